@@ -0,0 +1,71 @@
+"""
+Microbenchmark of decoding the full players/ list: the previous path of
+json.loads(response.text) against decoding the body bytes into typed records.
+
+Run from the repository root with: python benchmarks/bench_decoding.py
+"""
+import json
+import os
+import sys
+import timeit
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from interface.decoding import decode_records, loads, orjson  # noqa: E402
+from interface.records import PlayerRecord  # noqa: E402
+
+NO_OF_PLAYERS = 700
+REPEATS = 200
+
+
+def create_players_payload(no_of_players: int) -> bytes:
+    players = [
+        {
+            "id": player_id,
+            "name": f"Player {player_id}",
+            "first_name": "Player",
+            "surname": str(player_id),
+            "goals": player_id % 20,
+            "assists": player_id % 15,
+            "team": f"Team {player_id % 20}",
+            "position": "MID",
+        }
+        for player_id in range(no_of_players)
+    ]
+
+    return json.dumps(players).encode()
+
+
+def create_response(content: bytes) -> requests.Response:
+    """Response as built by requests, without a declared charset"""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = content
+
+    return response
+
+
+def main():
+    content = create_players_payload(NO_OF_PLAYERS)
+
+    benchmarks = {
+        "json.loads(response.text)": lambda: json.loads(create_response(content).text),
+        "loads(response.content)": lambda: loads(create_response(content).content),
+        "decode_records(response.content, PlayerRecord)": lambda: decode_records(
+            create_response(content).content, schema=PlayerRecord
+        ),
+    }
+
+    print(
+        f"Decoding {NO_OF_PLAYERS} players ({len(content) / 1024:.0f} KiB), "
+        f"orjson {'installed' if orjson is not None else 'not installed'}"
+    )
+    for name, benchmark in benchmarks.items():
+        best = min(timeit.repeat(benchmark, number=1, repeat=REPEATS))
+        print(f"{name:<50} {best * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
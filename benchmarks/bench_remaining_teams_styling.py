@@ -0,0 +1,104 @@
+"""
+Benchmark of memo hashing & styling the remaining teams table for 20 teams x N
+funballers, before (memoised on the whole DataFrame) and after (an lru_cache keyed
+on the remaining selections packed into int64 bytes).
+
+Run from the repository root with: python benchmarks/bench_remaining_teams_styling.py
+"""
+import os
+import random
+import sys
+import timeit
+
+import streamlit as st
+from pandas import DataFrame
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from suite import render_styler  # noqa: E402
+
+from logic.choices import style_remaining_teams_dataframe  # noqa: E402
+from utilities import get_team_names  # noqa: E402
+
+NO_OF_FUNBALLERS = (1, 10, 100, 500)
+REPEATS = 20
+
+
+@st.experimental_memo
+def legacy_remaining_teams_styler(s) -> DataFrame:
+    """The previous implementation, memoised on the full DataFrame"""
+    green = "background-color: green"
+    orange = "background-color: orange"
+    red = "background-color: red"
+
+    dataframe = s.copy()
+
+    green_mask = dataframe["Remaining Selections"] == 2
+    orange_mask = dataframe["Remaining Selections"] == 1
+    red_mask = dataframe["Remaining Selections"] == 0
+
+    dataframe.loc[green_mask, :] = green
+    dataframe.loc[orange_mask, :] = orange
+    dataframe.loc[red_mask, :] = red
+
+    return dataframe
+
+
+def create_remaining_teams_dataframe(no_of_funballers: int) -> DataFrame:
+    random.seed(no_of_funballers)
+    team_names = list(get_team_names()) * no_of_funballers
+
+    return DataFrame(
+        {
+            "Team Name": team_names,
+            "Remaining Selections": [random.randint(0, 2) for _ in team_names],
+        }
+    )
+
+
+def style_before(remaining_teams_dataframe: DataFrame) -> None:
+    render_styler(
+        remaining_teams_dataframe.style.apply(legacy_remaining_teams_styler, axis=None)
+    )
+
+
+def style_after(remaining_teams_dataframe: DataFrame) -> None:
+    render_styler(
+        style_remaining_teams_dataframe(
+            remaining_teams_dataframe=remaining_teams_dataframe
+        )
+    )
+
+
+def main():
+    print(f"{'rows':>8} {'before (ms)':>12} {'after (ms)':>12}")
+    for no_of_funballers in NO_OF_FUNBALLERS:
+        remaining_teams_dataframe = create_remaining_teams_dataframe(no_of_funballers)
+
+        # Warm the memo caches, so only hashing + styling is timed
+        style_before(remaining_teams_dataframe)
+        style_after(remaining_teams_dataframe)
+
+        before = min(
+            timeit.repeat(
+                lambda: style_before(remaining_teams_dataframe),
+                number=1,
+                repeat=REPEATS,
+            )
+        )
+        after = min(
+            timeit.repeat(
+                lambda: style_after(remaining_teams_dataframe),
+                number=1,
+                repeat=REPEATS,
+            )
+        )
+
+        print(
+            f"{len(remaining_teams_dataframe):>8} {before * 1000:>12.3f} "
+            f"{after * 1000:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
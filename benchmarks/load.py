@@ -0,0 +1,372 @@
+"""
+Load generator driving concurrent simulated sessions through the data loading of
+each page (Standings, Choices, Gameweeks, Players & League) against one shared
+FunballInterface, as the app's sessions share it. Reports throughput & latency
+percentiles per page, and what reached the backend.
+
+Without --url an in-process stub backend (see stub_backend.py) is started, by
+default all sessions start at once, as on a deadline night.
+
+Run from the repository root with:
+    python benchmarks/load.py --sessions 50 --duration 30 --latency 0.05
+    python benchmarks/load.py --sessions 200 --submit-rate 0.5 --error-rate 0.02
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Callable, Dict, List
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from streamlit.runtime.scriptrunner import StopException  # noqa: E402
+from stub_backend import (  # noqa: E402
+    add_backend_arguments,
+    create_backend,
+    start_stub_backend,
+)
+
+from interface.fantasy_funball import FunballInterface  # noqa: E402
+from utilities import SubmitChoiceData, get_team_names  # noqa: E402
+from utilities.gameweek import (  # noqa: E402
+    determine_default_gameweek_no,
+    determine_gameweek_no,
+)
+from utilities.loader import DataLoader  # noqa: E402
+
+DEFAULT_SESSIONS = 20
+DEFAULT_DURATION = 10
+DEFAULT_THINK_TIME = 0.5
+DEFAULT_MIX = "standings=4,choices=3,gameweeks=1,players=1,league=1"
+
+PERCENTILES = (50, 90, 99)
+
+
+class SimulatedSession:
+    """
+    A session clicking between pages, loading what each page loads with the same
+    DataLoader graph. Sessions are anonymous, so only the choices up to the
+    current gameweek are visible to them.
+    """
+
+    def __init__(
+        self,
+        funball_interface: FunballInterface,
+        rng: random.Random,
+        funballer_names: List[str],
+        submit_rate: float,
+    ):
+        self.funball_interface = funball_interface
+        self.rng = rng
+        self.funballer_names = funballer_names
+        self.submit_rate = submit_rate
+
+    def standings(self) -> None:
+        loader = DataLoader()
+        loader.add("gameweek_data", self.funball_interface.get_all_gameweek_data)
+        loader.add("gameweek_summary", self.funball_interface.get_gameweek_summary)
+        loader.add("funballer_data", self.funball_interface.get_funballer_dataframe)
+        data = loader.load()
+
+        self.funball_interface.get_standings_history(
+            current_gameweek_no=determine_gameweek_no(
+                all_gameweek_data=data["gameweek_data"]
+            ),
+        )
+
+    def choices(self) -> None:
+        funballer_no = self.rng.randrange(len(self.funballer_names))
+        funballer_name = self.funballer_names[funballer_no]
+
+        loader = DataLoader()
+        loader.add("all_gameweek_data", self.funball_interface.get_all_gameweek_data)
+        loader.add(
+            "gameweek_no_limit",
+            lambda all_gameweek_data: determine_default_gameweek_no(
+                all_gameweek_data=all_gameweek_data,
+            ),
+            depends_on=["all_gameweek_data"],
+        )
+        loader.add(
+            "choices_data",
+            lambda gameweek_no_limit: self.funball_interface.get_choices_dataframe(
+                funballer_name=funballer_name,
+                gameweek_no_limit=gameweek_no_limit,
+            ),
+            depends_on=["gameweek_no_limit"],
+        )
+        loader.add("player_catalog", self.funball_interface.get_player_catalog)
+        # Loaded once the choices are, which stop the page for unknown funballers
+        loader.add(
+            "valid_team_selections",
+            lambda **_: self.funball_interface.get_funballer_valid_team_selections(
+                funballer_name=funballer_name,
+            ),
+            depends_on=["choices_data"],
+        )
+        data = loader.load()
+
+        if self.rng.random() >= self.submit_rate:
+            return
+
+        valid_team_selections = data["valid_team_selections"]
+        team_names = [
+            team_name
+            for team_name, remaining_selections in zip(
+                valid_team_selections.team_names,
+                valid_team_selections.remaining_selections,
+            )
+            if remaining_selections > 0
+        ]
+        player_catalog = data["player_catalog"]
+
+        self.funball_interface.post_choice(
+            payload=SubmitChoiceData(
+                pin=f"{funballer_no:04d}",
+                gameweek_no=data["gameweek_no_limit"],
+                team_choice=self.rng.choice(team_names or get_team_names()),
+                player_choice=player_catalog.id_for_label(
+                    self.rng.choice(player_catalog.options)
+                ),
+                submit=True,
+            ),
+            funballer_name=funballer_name,
+        )
+        self.funball_interface.get_funballer_valid_team_selections(
+            funballer_name=funballer_name,
+        )
+
+    def gameweeks(self) -> None:
+        all_gameweek_data = self.funball_interface.get_all_gameweek_data()
+        gameweek_no = min(
+            determine_default_gameweek_no(all_gameweek_data=all_gameweek_data), 38
+        )
+
+        # Most sessions look at this gameweek, some browse around it
+        gameweek_no = min(max(gameweek_no + self.rng.choice((0, 0, 0, -1, 1)), 1), 38)
+        self.funball_interface.get_single_gameweek_data(gameweek_no=gameweek_no)
+
+    def players(self) -> None:
+        self.funball_interface.get_all_players_from_team_dataframe(
+            team_name=self.rng.choice(get_team_names())
+        )
+
+    def league(self) -> None:
+        all_gameweek_data = self.funball_interface.get_all_gameweek_data()
+        self.funball_interface.get_league_choices_dataframe(
+            gameweek_no_limit=determine_default_gameweek_no(
+                all_gameweek_data=all_gameweek_data
+            )
+        )
+
+
+class LoadResults:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = Counter()
+
+    def record(self, page: str, latency: float, error: str = None) -> None:
+        with self._lock:
+            self.latencies[page].append(latency)
+            if error is not None:
+                self.errors[page, error] += 1
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    weights = {}
+    for item in mix.split(","):
+        page, weight = item.split("=")
+        if not hasattr(SimulatedSession, page):
+            raise ValueError(f"Unknown page '{page}'.")
+
+        weights[page] = float(weight)
+
+    return weights
+
+
+def run_session(
+    session: SimulatedSession,
+    weights: Dict[str, float],
+    think_time: float,
+    deadline: float,
+    results: LoadResults,
+) -> None:
+    pages, page_weights = list(weights), list(weights.values())
+
+    while time.perf_counter() < deadline:
+        page = session.rng.choices(pages, weights=page_weights)[0]
+        flow: Callable[[], None] = getattr(session, page)
+
+        started = time.perf_counter()
+        try:
+            flow()
+        except (Exception, StopException) as exception:
+            results.record(page, time.perf_counter() - started, type(exception).__name__)
+        else:
+            results.record(page, time.perf_counter() - started)
+
+        if think_time:
+            time.sleep(session.rng.expovariate(1 / think_time))
+
+
+def format_latencies(name: str, latencies: List[float], elapsed: float) -> str:
+    percentiles = np.percentile(latencies, PERCENTILES) * 1000 if latencies else []
+
+    return (
+        f"{name:<12} {len(latencies):>8} {len(latencies) / elapsed:>9.1f} "
+        + " ".join(f"{percentile:>9.1f}" for percentile in percentiles)
+        + f" {max(latencies, default=0) * 1000:>9.1f}"
+    )
+
+
+def report(
+    results: LoadResults,
+    elapsed: float,
+    funball_interface: FunballInterface,
+    backend=None,
+) -> None:
+    print(
+        f"\n{'page':<12} {'requests':>8} {'req/s':>9} "
+        + " ".join(f"{f'p{percentile} (ms)':>9}" for percentile in PERCENTILES)
+        + f" {'max (ms)':>9}"
+    )
+    for page, latencies in sorted(results.latencies.items()):
+        print(format_latencies(page, latencies, elapsed))
+    print(
+        format_latencies(
+            "all",
+            [
+                latency
+                for latencies in results.latencies.values()
+                for latency in latencies
+            ],
+            elapsed,
+        )
+    )
+
+    if results.errors:
+        print("\nErrors:")
+        for (page, error), count in results.errors.most_common():
+            print(f"  {page:<12} {error:<30} {count:>8}")
+
+    cache_stats = funball_interface.cache_stats()
+    single_flight_stats = funball_interface.single_flight_stats()
+    print(
+        f"\nCache: {cache_stats.hits} hits, {cache_stats.misses} misses, "
+        f"{cache_stats.revalidations} revalidations, {cache_stats.entries} entries. "
+        f"Coalesced requests: {single_flight_stats.coalesced}"
+    )
+
+    if backend is not None:
+        print(f"\n{'backend endpoint':<50} {'status':>6} {'responses':>9}")
+        for (endpoint, status_code), count in sorted(backend.responses.items()):
+            print(f"{endpoint:<50} {status_code:>6} {count:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", help="Backend URL, else a stub backend is started")
+    parser.add_argument("--sessions", type=int, default=DEFAULT_SESSIONS)
+    parser.add_argument(
+        "--duration", type=float, default=DEFAULT_DURATION, help="Seconds to run for"
+    )
+    parser.add_argument(
+        "--ramp-up",
+        type=float,
+        default=0,
+        help="Seconds over which sessions start, 0 starts them all at once",
+    )
+    parser.add_argument(
+        "--think-time",
+        type=float,
+        default=DEFAULT_THINK_TIME,
+        help="Mean seconds each session waits between pages",
+    )
+    parser.add_argument(
+        "--mix", default=DEFAULT_MIX, help=f"Page weights (default: {DEFAULT_MIX})"
+    )
+    parser.add_argument(
+        "--submit-rate",
+        type=float,
+        default=0.2,
+        help="Fraction of Choices page visits that submit a choice",
+    )
+    add_backend_arguments(parser)
+    args = parser.parse_args()
+
+    # Streamlit warns when called outside `streamlit run`, & every page load logs
+    for logger_name in ("streamlit", "interface", "utilities"):
+        logging.getLogger(logger_name).setLevel(logging.ERROR)
+
+    backend = None
+    if args.url is None:
+        backend = create_backend(args)
+        server = start_stub_backend(backend)
+        os.environ["FANTASY_FUNBALL_URL"] = server.url
+        funballer_names = list(backend.season.choices)
+    else:
+        os.environ["FANTASY_FUNBALL_URL"] = args.url
+        funballer_names = [
+            funballer["first_name"]
+            for funballer in FunballInterface().get_funballer_data()
+        ]
+
+    funball_interface = FunballInterface()
+    weights = parse_mix(args.mix)
+    results = LoadResults()
+
+    print(
+        f"Running {args.sessions} sessions for {args.duration}s against "
+        f"{os.environ['FANTASY_FUNBALL_URL']}"
+    )
+    started = time.perf_counter()
+    deadline = started + args.ramp_up + args.duration
+
+    threads = []
+    for session_no in range(args.sessions):
+        session = SimulatedSession(
+            funball_interface=funball_interface,
+            rng=random.Random(args.seed + session_no),
+            funballer_names=funballer_names,
+            submit_rate=args.submit_rate,
+        )
+        thread = threading.Thread(
+            target=run_session,
+            args=(session, weights, args.think_time, deadline, results),
+            name=f"funball-session-{session_no}",
+            daemon=True,
+        )
+        threads.append(thread)
+
+    for session_no, thread in enumerate(threads):
+        if args.ramp_up:
+            time.sleep(
+                max(
+                    started
+                    + args.ramp_up * session_no / args.sessions
+                    - time.perf_counter(),
+                    0,
+                )
+            )
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    report(
+        results=results,
+        elapsed=time.perf_counter() - started,
+        funball_interface=funball_interface,
+        backend=backend,
+    )
+
+
+if __name__ == "__main__":
+    main()
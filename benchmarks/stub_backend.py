@@ -0,0 +1,445 @@
+"""
+Local stub of the Fantasy Funball backend, serving a synthetic season (see
+synthetic.py) on every endpoint FunballInterface calls, so the app & the load
+generator can run offline. Latency and errors can be injected into every response.
+
+Submitted choices are validated like the backend does (pin, deadline, team used at
+most twice, player used once) and update the season, so later reads see them.
+Funballer pins are their index, zero padded: Funballer3's pin is 0003.
+
+Run from the repository root with:
+    python benchmarks/stub_backend.py --port 8000 --latency 0.05 --error-rate 0.01
+then point the app at it:
+    FANTASY_FUNBALL_URL=http://127.0.0.1:8000/fantasy_funball/ streamlit run ...
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from synthetic import NO_OF_GAMEWEEKS, Season, create_season  # noqa: E402
+
+from interface.metrics import endpoint_label  # noqa: E402
+from utilities import get_team_names  # noqa: E402
+
+PATH_PREFIX = "/fantasy_funball/"
+DEADLINE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+DEFAULT_PORT = 8000
+DEFAULT_FUNBALLERS = 10
+DEFAULT_CURRENT_GAMEWEEK = 20
+DEFAULT_DEADLINE_IN = timedelta(minutes=30)
+
+Response = Tuple[int, Any]
+
+
+def season_start_for(current_gameweek_no: int, deadline_in: timedelta) -> datetime:
+    """Season start that puts the current gameweek's deadline deadline_in from now"""
+    return (
+        datetime.utcnow() + deadline_in - timedelta(weeks=current_gameweek_no - 1)
+    ).replace(microsecond=0)
+
+
+class SeasonBackend:
+    """
+    In-memory backend over a synthetic season. Requests are routed by handle(),
+    which is thread safe, and counted by endpoint template.
+    """
+
+    def __init__(
+        self,
+        season: Season,
+        latency: float = 0,
+        jitter: float = 0,
+        error_rate: float = 0,
+        error_status: int = 500,
+        seed: int = 0,
+    ):
+        self.season = season
+        # Seconds added to every response, plus up to jitter seconds at random
+        self.latency = latency
+        self.jitter = jitter
+        # Fraction of requests answered with error_status instead
+        self.error_rate = error_rate
+        self.error_status = error_status
+
+        # Requests by endpoint template, & responses by (template, status code)
+        self.requests = Counter()
+        self.responses = Counter()
+
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._pins = {
+            f"{funballer_no:04d}": name
+            for funballer_no, name in enumerate(season.choices)
+        }
+        self._players_by_id = {player["id"]: player for player in season.players}
+        self._deadlines = {
+            gameweek["gameweek_no"]: datetime.strptime(
+                gameweek["deadline"], DEADLINE_FORMAT
+            )
+            for gameweek in season.gameweeks
+        }
+
+        self._routes = (
+            ("GET", re.compile(r"^funballer/$"), self._funballers),
+            (
+                "GET",
+                re.compile(r"^funballer/choices/valid_teams/(?P<funballer_name>[^/]+)$"),
+                self._valid_teams,
+            ),
+            (
+                "POST",
+                re.compile(r"^funballer/choices/submit/(?P<pin>[^/]+)$"),
+                self._submit_choice,
+            ),
+            (
+                "GET",
+                re.compile(r"^funballer/choices/(?P<funballer_name>[^/]+)$"),
+                self._choices,
+            ),
+            ("GET", re.compile(r"^players/$"), self._players),
+            ("GET", re.compile(r"^(?P<team_name>[^/]+)/players/$"), self._team_players),
+            ("GET", re.compile(r"^gameweek/all/$"), self._gameweeks),
+            ("GET", re.compile(r"^gameweek/summary/$"), self._summary),
+            ("GET", re.compile(r"^gameweek/(?P<gameweek_no>\d+)$"), self._fixtures),
+            ("GET", re.compile(r"^update_database/$"), self._update_database),
+        )
+
+    def handle(self, method: str, path: str, form: Dict[str, str] = None) -> Response:
+        """(status code, JSON payload) of a request for a path below the prefix"""
+        url = urlsplit(path)
+        endpoint = unquote(url.path)
+        label = endpoint_label(endpoint)
+
+        with self._lock:
+            self.requests[label] += 1
+            delay = self.latency + self._rng.uniform(0, self.jitter)
+            failed = self._rng.random() < self.error_rate
+
+        time.sleep(delay)
+
+        response = (self.error_status, {"detail": "Injected error."}) if failed else None
+        if response is None:
+            response = self._route(method, endpoint, query=parse_qs(url.query), form=form)
+
+        with self._lock:
+            self.responses[label, response[0]] += 1
+
+        return response
+
+    def _route(
+        self, method: str, endpoint: str, query: Dict, form: Optional[Dict]
+    ) -> Response:
+        for route_method, pattern, route in self._routes:
+            match = pattern.match(endpoint)
+            if match and route_method == method:
+                with self._lock:
+                    return route(query=query, form=form or {}, **match.groupdict())
+
+        return 404, {"detail": "Not found."}
+
+    def _funballers(self, **_) -> Response:
+        return 200, self.season.funballers
+
+    def _choices(self, funballer_name: str, query: Dict, **_) -> Response:
+        choices = self.season.choices.get(funballer_name)
+        if choices is None:
+            return 404, {"detail": "Funballer not found."}
+
+        if "from" in query and "to" in query:
+            first, last = int(query["from"][0]), int(query["to"][0])
+            choices = [
+                choice
+                for choice in choices
+                if first <= choice["gameweek_id__gameweek_no"] <= last
+            ]
+
+        return 200, choices
+
+    def _valid_teams(self, funballer_name: str, **_) -> Response:
+        choices = self.season.choices.get(funballer_name)
+        if choices is None:
+            return 404, {"detail": "Funballer not found."}
+
+        times_chosen = Counter(choice["team_choice__team_name"] for choice in choices)
+
+        return 200, [
+            {"team_name": team_name, "remaining_selections": 2 - times_chosen[team_name]}
+            for team_name in get_team_names()
+        ]
+
+    def _validate_choice(
+        self, choices: list, gameweek_no: int, team_name: str, player_id: int
+    ) -> Optional[str]:
+        """Why the choice can't be made, None if it can"""
+        deadline = self._deadlines.get(gameweek_no)
+        if deadline is None:
+            return f"Gameweek {gameweek_no} does not exist."
+        if datetime.utcnow() > deadline:
+            return f"The deadline for gameweek {gameweek_no} has passed."
+        if team_name not in get_team_names():
+            return f"{team_name} is not a valid team."
+
+        player = self._players_by_id.get(player_id)
+        if player is None:
+            return "Player not found."
+
+        other_choices = [
+            choice
+            for choice in choices
+            if choice["gameweek_id__gameweek_no"] != gameweek_no
+        ]
+        if (
+            sum(choice["team_choice__team_name"] == team_name for choice in other_choices)
+            >= 2
+        ):
+            return f"{team_name} has already been chosen twice."
+        if any(
+            (choice["player_choice__first_name"], choice["player_choice__surname"])
+            == (player["first_name"], player["surname"])
+            for choice in other_choices
+        ):
+            return f"{player['name']} has already been chosen."
+
+        return None
+
+    def _submit_choice(self, pin: str, form: Dict[str, str], **_) -> Response:
+        funballer_name = self._pins.get(pin)
+        if funballer_name is None:
+            return 404, {"detail": "Funballer not found, check your pin."}
+
+        try:
+            gameweek_no = int(form["gameweek_no"])
+            team_name = form["team_choice"]
+            player_id = int(form["player_choice"])
+        except (KeyError, ValueError):
+            return 400, {"detail": "Invalid choice."}
+
+        choices = self.season.choices[funballer_name]
+        error = self._validate_choice(choices, gameweek_no, team_name, player_id)
+        if error is not None:
+            return 400, {"detail": error}
+
+        player = self._players_by_id[player_id]
+        choice = {
+            "gameweek_id__gameweek_no": gameweek_no,
+            "team_choice__team_name": team_name,
+            "player_choice__first_name": player["first_name"],
+            "player_choice__surname": player["surname"],
+            "team_point_awarded": None,
+            "player_point_awarded": None,
+        }
+
+        # Choices are replaced, never mutated, as responses may still be encoding
+        updated = any(
+            existing["gameweek_id__gameweek_no"] == gameweek_no for existing in choices
+        )
+        self.season.choices[funballer_name] = sorted(
+            [
+                existing
+                for existing in choices
+                if existing["gameweek_id__gameweek_no"] != gameweek_no
+            ]
+            + [choice],
+            key=lambda existing: existing["gameweek_id__gameweek_no"],
+        )
+
+        return (200, {"detail": "Choice updated."}) if updated else (201, choice)
+
+    def _players(self, **_) -> Response:
+        return 200, self.season.players
+
+    def _team_players(self, team_name: str, **_) -> Response:
+        return 200, [
+            player
+            for player in self.season.players
+            if player["team__team_name"] == team_name
+        ]
+
+    def _gameweeks(self, **_) -> Response:
+        return 200, self.season.gameweeks
+
+    def _summary(self, **_) -> Response:
+        return 200, {"text": "A synthetic gameweek, served by the stub backend."}
+
+    def _fixtures(self, gameweek_no: str, **_) -> Response:
+        gameweek_no = int(gameweek_no)
+        if not 1 <= gameweek_no <= NO_OF_GAMEWEEKS:
+            return 404, {"detail": "Gameweek not found."}
+
+        fixtures_per_gameweek = len(self.season.fixtures) // NO_OF_GAMEWEEKS
+        first = (gameweek_no - 1) * fixtures_per_gameweek
+        last = first + fixtures_per_gameweek
+
+        return 200, self.season.fixtures[first:last]
+
+    def _update_database(self, **_) -> Response:
+        """Recalculate the standings from every funballer's awarded points"""
+        funballers = []
+        for funballer_name, choices in self.season.choices.items():
+            team_points = sum(bool(choice["team_point_awarded"]) for choice in choices)
+            player_points = sum(
+                bool(choice["player_point_awarded"]) for choice in choices
+            )
+            funballers.append(
+                {
+                    "first_name": funballer_name,
+                    "team_points": team_points,
+                    "player_points": player_points,
+                    "points": team_points + player_points,
+                }
+            )
+
+        self.season = self.season._replace(
+            funballers=sorted(funballers, key=lambda funballer: -funballer["points"])
+        )
+
+        return 200, {"detail": "Standings updated."}
+
+
+class SeasonBackendHandler(BaseHTTPRequestHandler):
+    """Serves a SeasonBackend as JSON, with ETags & conditional GETs"""
+
+    protocol_version = "HTTP/1.1"
+
+    def _respond(self, status_code: int, payload: Any) -> None:
+        body = json.dumps(payload).encode()
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+
+        if status_code == 200 and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if status_code == 200:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, method: str, form: Dict[str, str] = None) -> None:
+        if not self.path.startswith(PATH_PREFIX):
+            self._respond(404, {"detail": "Not found."})
+            return
+
+        path = self.path[len(PATH_PREFIX):]  # fmt: skip
+        self._respond(*self.server.backend.handle(method, path, form=form))
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        form = {
+            name: values[0]
+            for name, values in parse_qs(self.rfile.read(length).decode()).items()
+        }
+
+        self._handle("POST", form=form)
+
+    def log_message(self, *_):
+        pass
+
+
+def start_stub_backend(
+    backend: SeasonBackend, port: int = 0, host: str = "127.0.0.1"
+) -> ThreadingHTTPServer:
+    """Serve the backend from a daemon thread, port 0 picks a free port"""
+    server = ThreadingHTTPServer((host, port), SeasonBackendHandler)
+    server.daemon_threads = True
+    server.backend = backend
+    server.url = f"http://{host}:{server.server_port}{PATH_PREFIX}"
+
+    threading.Thread(
+        target=server.serve_forever,
+        name="funball-stub-backend",
+        daemon=True,
+    ).start()
+
+    return server
+
+
+def add_backend_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--funballers", type=int, default=DEFAULT_FUNBALLERS)
+    parser.add_argument(
+        "--current-gameweek",
+        type=int,
+        default=DEFAULT_CURRENT_GAMEWEEK,
+        help="Gameweek whose deadline is upcoming",
+    )
+    parser.add_argument(
+        "--deadline-in",
+        type=float,
+        default=DEFAULT_DEADLINE_IN.total_seconds() / 60,
+        help="Minutes until the current gameweek's deadline",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0, help="Seconds added to every response"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0, help="Up to this many seconds more, at random"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0, help="Fraction of requests that fail"
+    )
+    parser.add_argument(
+        "--error-status", type=int, default=500, help="Status code of failed requests"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def create_backend(args: argparse.Namespace) -> SeasonBackend:
+    season = create_season(
+        no_of_funballers=args.funballers,
+        seed=args.seed,
+        season_start=season_start_for(
+            current_gameweek_no=args.current_gameweek,
+            deadline_in=timedelta(minutes=args.deadline_in),
+        ),
+    )
+
+    return SeasonBackend(
+        season=season,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    add_backend_arguments(parser)
+    args = parser.parse_args()
+
+    server = start_stub_backend(create_backend(args), port=args.port, host=args.host)
+    print(f"Serving {args.funballers} funballers at {server.url}")
+
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
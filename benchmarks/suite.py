@@ -0,0 +1,295 @@
+"""
+Benchmark suite of the formatting, gameweek & display logic against season-scale
+synthetic data (see synthetic.py), for 10 to 500 funballers. Each case's best time
+is compared with its baseline in baselines.json, and the run fails if any case is
+slower than its baseline by more than the threshold.
+
+Baselines depend on the environment, so they're kept per Python version, pandas
+version & machine in baselines/. A run without baselines for its environment
+only reports timings, record them before making a change.
+
+Run from the repository root with:
+    python benchmarks/suite.py                      # compare with the baselines
+    python benchmarks/suite.py --update-baselines   # record new baselines
+    python benchmarks/suite.py -k league            # only cases matching "league"
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+from typing import Callable, Dict, Iterator, Tuple
+
+import pandas as pd
+from pandas.io.formats.style import Styler
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from synthetic import create_season  # noqa: E402
+
+from interface.decoding import decode_records, loads  # noqa: E402
+from interface.formatter import FunballInterfaceFormatter  # noqa: E402
+from interface.records import PlayerRecord  # noqa: E402
+from interface.standings_history import StandingsHistory  # noqa: E402
+from logic.choices import (  # noqa: E402
+    create_choices_dataframe,
+    style_remaining_teams_dataframe,
+)
+from logic.league import style_league_table  # noqa: E402
+from logic.players import sort_player_data  # noqa: E402
+from logic.standings import create_standings_dataframe  # noqa: E402
+from utilities.gameweek import (  # noqa: E402
+    GameweekCalendar,
+    determine_default_gameweek_no,
+    determine_gameweek_no,
+    get_gameweek_deadline,
+    has_current_gameweek_deadline_passed,
+)
+
+BASELINES_DIR = os.path.join(os.path.dirname(__file__), "baselines")
+
+NO_OF_FUNBALLERS = (10, 100, 500)
+DEFAULT_THRESHOLD = 1.5
+REPEATS = 5
+
+FORMATTER = FunballInterfaceFormatter()
+
+
+def render_styler(styler: Styler) -> str:
+    """Styler HTML, Styler.render was replaced by to_html in pandas 1.3"""
+    if hasattr(styler, "to_html"):
+        return styler.to_html()
+
+    return styler.render()
+
+
+def season_cases() -> Iterator[Tuple[str, Callable[[], None]]]:
+    """Cases that don't depend on the number of funballers"""
+    season = create_season(no_of_funballers=1)
+    gameweeks = season.gameweeks
+    choices = next(iter(season.choices.values()))
+    choices_dataframe = FORMATTER.format_choices_dataframe(choices_data=choices)
+    players_dataframe = FORMATTER.format_all_players_from_team_dataframe(
+        player_data=season.players
+    )
+    players_content = json.dumps(season.players).encode()
+
+    yield "decode_records[players]", lambda: decode_records(
+        players_content, schema=PlayerRecord
+    )
+    yield "loads[players]", lambda: loads(players_content)
+
+    yield "format_gameweek_data[season]", lambda: FORMATTER.format_gameweek_data(
+        gameweek_data=season.fixtures
+    )
+    yield "format_gameweek_data[gameweek]", lambda: FORMATTER.format_gameweek_data(
+        gameweek_data=season.fixtures[:10]
+    )
+    yield "format_choices_data", lambda: FORMATTER.format_choices_data(
+        choices_data=choices
+    )
+    yield "format_choices_dataframe", lambda: FORMATTER.format_choices_dataframe(
+        choices_data=choices
+    )
+    yield "format_all_players_from_team", lambda: (
+        FORMATTER.format_all_players_from_team(player_data=season.team_players)
+    )
+    yield "format_all_players_from_team_dataframe[team]", lambda: (
+        FORMATTER.format_all_players_from_team_dataframe(player_data=season.team_players)
+    )
+    yield "format_all_players_from_team_dataframe[all]", lambda: (
+        FORMATTER.format_all_players_from_team_dataframe(player_data=season.players)
+    )
+    yield "format_funballer_valid_team_selections", lambda: (
+        FORMATTER.format_funballer_valid_team_selections(
+            remaining_valid_teams_data=season.valid_teams
+        )
+    )
+
+    yield "GameweekCalendar", lambda: GameweekCalendar(all_gameweek_data=gameweeks)
+    yield "determine_gameweek_no", lambda: determine_gameweek_no(
+        all_gameweek_data=gameweeks
+    )
+    yield "determine_default_gameweek_no", lambda: determine_default_gameweek_no(
+        all_gameweek_data=gameweeks
+    )
+    yield "get_gameweek_deadline", lambda: get_gameweek_deadline(
+        gameweek_no=20, gameweek_data=gameweeks
+    )
+    yield "has_current_gameweek_deadline_passed", lambda: (
+        has_current_gameweek_deadline_passed(gameweek_no=20, gameweek_data=gameweeks)
+    )
+
+    yield "sort_player_data[all]", lambda: sort_player_data(player_data=players_dataframe)
+    yield "create_choices_dataframe+style", lambda: render_styler(
+        create_choices_dataframe(
+            funballer_name="Funballer0", choices_data=choices_dataframe
+        )
+    )
+
+
+def league_cases(no_of_funballers: int) -> Iterator[Tuple[str, Callable[[], None]]]:
+    """Cases that scale with the number of funballers"""
+    season = create_season(no_of_funballers=no_of_funballers)
+    funballer_dataframe = FORMATTER.format_funballer_dataframe(
+        funballer_data=season.funballers
+    )
+    choices_by_funballer = {
+        name: FORMATTER.format_choices_dataframe(choices_data=choices)
+        for name, choices in season.choices.items()
+    }
+    league_choices = FORMATTER.format_league_choices_dataframe(
+        choices_by_funballer=choices_by_funballer
+    )
+    remaining_teams_dataframe = pd.DataFrame(
+        {
+            "Team Name": [team["team_name"] for team in season.valid_teams]
+            * no_of_funballers,
+            "Remaining Selections": [
+                team["remaining_selections"] for team in season.valid_teams
+            ]
+            * no_of_funballers,
+        }
+    )
+
+    yield "format_funballer_data", lambda: FORMATTER.format_funballer_data(
+        funballer_data=season.funballers
+    )
+    yield "format_funballer_dataframe", lambda: FORMATTER.format_funballer_dataframe(
+        funballer_data=season.funballers
+    )
+    yield "create_standings_dataframe", lambda: create_standings_dataframe(
+        funballer_data=funballer_dataframe
+    )
+    yield "format_league_choices_dataframe", lambda: (
+        FORMATTER.format_league_choices_dataframe(
+            choices_by_funballer=choices_by_funballer
+        )
+    )
+    yield "style_league_table", lambda: render_styler(
+        style_league_table(league_choices=league_choices)
+    )
+    yield "StandingsHistory.update", lambda: StandingsHistory(
+        funballer_names=league_choices.index
+    ).update(league_choices=league_choices, current_gameweek_no=38)
+    yield "style_remaining_teams_dataframe", lambda: render_styler(
+        style_remaining_teams_dataframe(
+            remaining_teams_dataframe=remaining_teams_dataframe
+        )
+    )
+
+
+def cases() -> Iterator[Tuple[str, Callable[[], None]]]:
+    yield from season_cases()
+
+    for no_of_funballers in NO_OF_FUNBALLERS:
+        for name, case in league_cases(no_of_funballers=no_of_funballers):
+            yield f"{name}[{no_of_funballers} funballers]", case
+
+
+def time_case(case: Callable[[], None]) -> float:
+    """Best time of a single call, in seconds"""
+    timer = timeit.Timer(case)
+    number, _ = timer.autorange()
+
+    return min(timer.repeat(number=number, repeat=REPEATS)) / number
+
+
+def baselines_path() -> str:
+    """Baselines of this environment: Python (major.minor), pandas & machine"""
+    python_version = ".".join(platform.python_version_tuple()[:2])
+
+    return os.path.join(
+        BASELINES_DIR,
+        f"python{python_version}-pandas{pd.__version__}-{platform.machine()}.json",
+    )
+
+
+def load_baselines() -> Dict[str, float]:
+    if not os.path.exists(baselines_path()):
+        return {}
+
+    with open(baselines_path()) as baselines_file:
+        return json.load(baselines_file)["cases"]
+
+
+def save_baselines(timings: Dict[str, float]) -> None:
+    baselines = {
+        "environment": {
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+        },
+        "cases": {name: round(seconds, 9) for name, seconds in timings.items()},
+    }
+
+    os.makedirs(BASELINES_DIR, exist_ok=True)
+    with open(baselines_path(), "w") as baselines_file:
+        json.dump(baselines, baselines_file, indent=4)
+        baselines_file.write("\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--update-baselines",
+        action="store_true",
+        help="Record this run's timings as the baselines",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Fail if a case takes longer than threshold x its baseline "
+        f"(default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "-k", dest="keyword", default="", help="Only run cases containing keyword"
+    )
+    args = parser.parse_args()
+
+    baselines = load_baselines()
+    if not baselines and not args.update_baselines:
+        print(f"No baselines at {baselines_path()}, only reporting timings")
+    timings = {}
+    regressions = []
+
+    print(f"{'case':<70} {'time (ms)':>10} {'baseline':>10} {'ratio':>7}")
+    for name, case in cases():
+        if args.keyword not in name:
+            continue
+
+        timings[name] = time_case(case)
+
+        baseline = baselines.get(name)
+        if baseline is None:
+            print(f"{name:<70} {timings[name] * 1000:>10.3f} {'-':>10} {'-':>7}")
+            continue
+
+        ratio = timings[name] / baseline
+        if ratio > args.threshold:
+            regressions.append(name)
+
+        print(
+            f"{name:<70} {timings[name] * 1000:>10.3f} {baseline * 1000:>10.3f} "
+            f"{ratio:>6.2f}x{' REGRESSION' if ratio > args.threshold else ''}"
+        )
+
+    if args.update_baselines:
+        save_baselines(timings={**baselines, **timings})
+        print(f"Updated {len(timings)} baselines in {baselines_path()}")
+        return 0
+
+    if regressions:
+        print(
+            f"{len(regressions)} case(s) slower than {args.threshold}x their baseline: "
+            + ", ".join(regressions)
+        )
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
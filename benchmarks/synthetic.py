@@ -0,0 +1,198 @@
+"""
+Season-scale synthetic backend records: 38 gameweeks, 380 fixtures, ~700 players
+and any number of funballers with full choice histories. Records match the
+schemas in interface.records, and are deterministic for a given seed.
+"""
+import random
+from collections import namedtuple
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from utilities import get_team_names
+
+NO_OF_GAMEWEEKS = 38
+PLAYERS_PER_TEAM = 35
+SEASON_START = datetime(2022, 8, 5, 17, 30)
+
+FIRST_NAMES = (
+    "Harry",
+    "Mohamed",
+    "Kevin",
+    "Bukayo",
+    "Marcus",
+    "Son",
+    "Jack",
+    "Bruno",
+    "Phil",
+    "Ollie",
+    "Ivan",
+    "Gabriel",
+    "Martin",
+    "James",
+    "Jarrod",
+    "Callum",
+)
+SURNAMES = (
+    "Kane",
+    "Salah",
+    "De Bruyne",
+    "Saka",
+    "Rashford",
+    "Heung-min",
+    "Grealish",
+    "Fernandes",
+    "Foden",
+    "Watkins",
+    "Toney",
+    "Jesus",
+    "Odegaard",
+    "Maddison",
+    "Bowen",
+    "Wilson",
+    "Mitrovic",
+    "Haaland",
+    "Nunez",
+    "Mount",
+)
+
+Season = namedtuple(
+    "Season",
+    [
+        "gameweeks",
+        "fixtures",
+        "players",
+        "team_players",
+        "funballers",
+        "choices",
+        "valid_teams",
+    ],
+)
+
+
+def create_gameweeks(season_start: datetime = SEASON_START) -> List[Dict]:
+    """GameweekRecords, a week apart"""
+    return [
+        {
+            "gameweek_no": gameweek_no,
+            "deadline": (season_start + timedelta(weeks=gameweek_no - 1)).strftime(
+                "%Y-%m-%dT%H:%M:%SZ"
+            ),
+        }
+        for gameweek_no in range(1, NO_OF_GAMEWEEKS + 1)
+    ]
+
+
+def create_fixtures(
+    rng: random.Random, season_start: datetime = SEASON_START
+) -> List[Dict]:
+    """FixtureRecords, every team plays every other team home & away"""
+    team_names = get_team_names()
+    pairings = [
+        (home, away) for home in team_names for away in team_names if home != away
+    ]
+    rng.shuffle(pairings)
+
+    fixtures = []
+    for fixture_id, (home_team, away_team) in enumerate(pairings, start=1):
+        gameweek_start = season_start + timedelta(weeks=(fixture_id - 1) // 10)
+        kickoff = gameweek_start + timedelta(
+            days=1 + rng.randint(0, 2), hours=rng.choice((-5, -2, 0, 2))
+        )
+        fixtures.append(
+            {
+                "id": fixture_id,
+                "home_team__team_name": home_team,
+                "away_team__team_name": away_team,
+                "gameday__date": kickoff.strftime("%Y-%m-%d"),
+                "kickoff": kickoff.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+        )
+
+    return fixtures
+
+
+def create_players(rng: random.Random) -> List[Dict]:
+    """PlayerRecords (with TeamPlayerRecord fields), PLAYERS_PER_TEAM per team"""
+    players = []
+    for team_name in get_team_names():
+        for _ in range(PLAYERS_PER_TEAM):
+            first_name = rng.choice(FIRST_NAMES)
+            surname = rng.choice(SURNAMES)
+            players.append(
+                {
+                    "id": len(players) + 1,
+                    "name": f"{first_name} {surname}",
+                    "first_name": first_name,
+                    "surname": surname,
+                    "team__team_name": team_name,
+                    "goals": int(rng.expovariate(0.4)),
+                    "assists": int(rng.expovariate(0.5)),
+                }
+            )
+
+    return players
+
+
+def create_choices(rng: random.Random, players: List[Dict]) -> List[Dict]:
+    """ChoiceRecords for every gameweek, each team chosen at most twice"""
+    teams = list(get_team_names()) * 2
+    rng.shuffle(teams)
+
+    return [
+        {
+            "gameweek_id__gameweek_no": gameweek_no,
+            "team_choice__team_name": team_name,
+            "player_choice__first_name": player["first_name"],
+            "player_choice__surname": player["surname"],
+            "team_point_awarded": rng.random() < 0.45,
+            "player_point_awarded": rng.random() < 0.3,
+        }
+        for gameweek_no, team_name, player in zip(
+            range(1, NO_OF_GAMEWEEKS + 1),
+            teams,
+            rng.sample(players, NO_OF_GAMEWEEKS),
+        )
+    ]
+
+
+def create_season(
+    no_of_funballers: int, seed: int = 0, season_start: datetime = SEASON_START
+) -> Season:
+    """A season of records, starting with gameweek 1's deadline (UTC)"""
+    rng = random.Random(seed)
+    players = create_players(rng)
+
+    funballer_names = [
+        f"Funballer{funballer_no}" for funballer_no in range(no_of_funballers)
+    ]
+    choices = {name: create_choices(rng, players) for name in funballer_names}
+
+    funballers = []
+    for name in funballer_names:
+        team_points = sum(choice["team_point_awarded"] for choice in choices[name])
+        player_points = sum(choice["player_point_awarded"] for choice in choices[name])
+        funballers.append(
+            {
+                "first_name": name,
+                "team_points": team_points,
+                "player_points": player_points,
+                "points": team_points + player_points,
+            }
+        )
+
+    team_name = get_team_names()[0]
+
+    return Season(
+        gameweeks=create_gameweeks(season_start=season_start),
+        fixtures=create_fixtures(rng, season_start=season_start),
+        players=players,
+        team_players=[
+            player for player in players if player["team__team_name"] == team_name
+        ],
+        funballers=funballers,
+        choices=choices,
+        valid_teams=[
+            {"team_name": team_name, "remaining_selections": rng.randint(0, 2)}
+            for team_name in get_team_names()
+        ],
+    )
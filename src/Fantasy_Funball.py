@@ -1,5 +1,7 @@
 import streamlit as st
 
+from interface import get_background_refresher
+
 st.set_page_config(
     page_title="Fantasy Funball",
     page_icon=":soccer:",
@@ -32,3 +34,6 @@ st.markdown(
         The Premier League Fantasy Football API is used as a data source.
         """
 )
+
+# Keep standings fresh after the midnight update, for every page
+get_background_refresher()
@@ -1,5 +1,16 @@
-from .fantasy_funball import FunballInterface
+from .fantasy_funball import FunballInterface, get_funball_interface
+from .jobs import BackgroundJob, get_update_standings_job
+from .player_catalog import PlayerCatalog
+from .refresher import BackgroundRefresher, get_background_refresher
+from .standings_history import StandingsHistory
 
 __all__ = [
     FunballInterface,
+    get_funball_interface,
+    PlayerCatalog,
+    BackgroundRefresher,
+    get_background_refresher,
+    BackgroundJob,
+    get_update_standings_job,
+    StandingsHistory,
 ]
@@ -0,0 +1,197 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from utilities.models import CacheStats
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_TTL = 10 * MINUTE
+
+# TTLs (in seconds) keyed by endpoint prefix, the longest matching prefix wins.
+# Gameweek and player data only change with the midnight results update, whereas
+# funballer data changes whenever a choice is submitted. The league choices matrix
+# & standings history are built from every funballer's choices, they're dropped
+# when a choice is submitted & expired by each refresh, so otherwise only need to
+# follow the midnight results update.
+ENDPOINT_TTLS = {
+    "gameweek/all/": 6 * HOUR,
+    "gameweek/summary/": 15 * MINUTE,
+    "gameweek/": 6 * HOUR,
+    "players/": 6 * HOUR,
+    "funballer/": 1 * MINUTE,
+    "funballer/choices/#league": 6 * HOUR,
+    "funballer/#standings_history": 6 * HOUR,
+}
+
+
+class CacheEntry:
+    __slots__ = ("value", "expires_at", "etag", "last_modified")
+
+    def __init__(
+        self,
+        value: Any,
+        expires_at: float,
+        etag: str = None,
+        last_modified: str = None,
+    ):
+        self.value = value
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers allowing the backend to reply 304 Not Modified"""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+
+class ResponseCache:
+    """
+    Thread-safe cache of parsed backend responses, keyed by endpoint. Entries
+    expire after a per-endpoint TTL and the least recently used entry is evicted
+    once the cache is full.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        default_ttl: float = DEFAULT_TTL,
+        endpoint_ttls: Dict[str, float] = None,
+    ):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.endpoint_ttls = ENDPOINT_TTLS if endpoint_ttls is None else endpoint_ttls
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._revalidations = 0
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Find the TTL of the longest endpoint prefix matching the endpoint"""
+        matching_prefixes = [
+            prefix for prefix in self.endpoint_ttls if endpoint.startswith(prefix)
+        ]
+        if not matching_prefixes:
+            return self.default_ttl
+
+        return self.endpoint_ttls[max(matching_prefixes, key=len)]
+
+    def get(self, endpoint: str) -> Tuple[bool, Any]:
+        """Returns (hit, value) for the endpoint, value is None on a miss"""
+        with self._lock:
+            entry = self._entries.get(endpoint)
+
+            if entry is None or entry.expires_at <= time.monotonic():
+                self._misses += 1
+                return False, None
+
+            self._entries.move_to_end(endpoint)
+            self._hits += 1
+
+            return True, entry.value
+
+    def get_stale(self, endpoint: str) -> Optional[CacheEntry]:
+        """
+        Returns the entry for the endpoint even if it has expired, so that its
+        validators can be used to revalidate it with the backend
+        """
+        with self._lock:
+            return self._entries.get(endpoint)
+
+    def put(
+        self,
+        endpoint: str,
+        value: Any,
+        etag: str = None,
+        last_modified: str = None,
+        ttl: float = None,
+    ) -> None:
+        """
+        Store a value, evicting the least recently used entry if full. The TTL
+        defaults to the endpoint's TTL.
+        """
+        ttl = self.ttl_for(endpoint) if ttl is None else ttl
+        expires_at = time.monotonic() + ttl
+
+        with self._lock:
+            self._entries[endpoint] = CacheEntry(
+                value=value,
+                expires_at=expires_at,
+                etag=etag,
+                last_modified=last_modified,
+            )
+            self._entries.move_to_end(endpoint)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def revalidate(self, endpoint: str, ttl: float = None) -> None:
+        """Renew the TTL of an entry the backend has confirmed is not modified"""
+        ttl = self.ttl_for(endpoint) if ttl is None else ttl
+        expires_at = time.monotonic() + ttl
+
+        with self._lock:
+            entry = self._entries.get(endpoint)
+            if entry is None:
+                return
+
+            entry.expires_at = expires_at
+            self._entries.move_to_end(endpoint)
+            self._revalidations += 1
+
+    def delete(self, *endpoints: str) -> None:
+        """Drop the entries of exactly these endpoints"""
+        with self._lock:
+            for endpoint in endpoints:
+                self._entries.pop(endpoint, None)
+
+    def invalidate(self, *prefixes: str) -> None:
+        """Drop every entry whose endpoint starts with one of the prefixes"""
+        with self._lock:
+            stale_endpoints = [
+                endpoint
+                for endpoint in self._entries
+                if endpoint.startswith(tuple(prefixes))
+            ]
+            for endpoint in stale_endpoints:
+                del self._entries[endpoint]
+
+    def expire(self, *prefixes: str) -> None:
+        """
+        Expire every entry whose endpoint starts with one of the prefixes, keeping
+        them for get_stale
+        """
+        now = time.monotonic()
+        with self._lock:
+            for endpoint, entry in self._entries.items():
+                if endpoint.startswith(tuple(prefixes)):
+                    entry.expires_at = min(entry.expires_at, now)
+
+    def clear(self) -> None:
+        """Drop every entry, counters are kept"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                revalidations=self._revalidations,
+                entries=len(self._entries),
+            )
@@ -0,0 +1,302 @@
+import atexit
+import base64
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple, Union
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from interface.metrics import endpoint_label
+from interface.session import create_http_session
+from utilities import Interaction
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+
+RECORD = "record"
+REPLAY = "replay"
+
+# Only the headers the interface reads are kept, so cassettes stay compact
+RECORDED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+CONDITIONAL_HEADERS = ("If-None-Match", "If-Modified-Since")
+
+# Endpoints recorded & replayed by their template, so pins are never written out
+REDACTED_ENDPOINTS = ("funballer/choices/submit/{pin}",)
+
+InteractionKey = Tuple[str, str, Tuple]
+
+
+class CassetteMiss(requests.ConnectionError):
+    """Raised when replaying a request that the cassette has no recording of"""
+
+
+def _interaction_key(method: str, endpoint: str, data: Optional[Dict]) -> InteractionKey:
+    return method, endpoint, tuple(sorted((data or {}).items()))
+
+
+class Cassette:
+    """
+    Backend responses (status code, headers & body) recorded against the request
+    that produced them, saved as gzipped JSON. Requests are identified by method,
+    endpoint (relative to the backend URL, including any query string) & form
+    data, so a cassette recorded against one backend replays against any URL.
+    Pins are redacted from endpoints, see REDACTED_ENDPOINTS.
+    """
+
+    def __init__(self, interactions: List[Interaction] = ()):
+        self._lock = threading.Lock()
+        self._interactions = defaultdict(list)
+        self._replayed = defaultdict(int)
+
+        for interaction in interactions:
+            self.add(interaction)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(map(len, self._interactions.values()))
+
+    @property
+    def interactions(self) -> List[Interaction]:
+        with self._lock:
+            return [
+                interaction
+                for interactions in self._interactions.values()
+                for interaction in interactions
+            ]
+
+    def add(self, interaction: Interaction) -> None:
+        key = _interaction_key(interaction.method, interaction.endpoint, interaction.data)
+        with self._lock:
+            self._interactions[key].append(interaction)
+
+    def next(
+        self, method: str, endpoint: str, data: Optional[Dict] = None
+    ) -> Optional[Interaction]:
+        """
+        The next recording of the request, in the order they were recorded. The
+        last recording is repeated once all have been replayed.
+        """
+        key = _interaction_key(method, endpoint, data)
+        with self._lock:
+            interactions = self._interactions.get(key)
+            if not interactions:
+                return None
+
+            index = min(self._replayed[key], len(interactions) - 1)
+            self._replayed[key] += 1
+
+            return interactions[index]
+
+    def save(self, path: str) -> None:
+        records = []
+        for interaction in self.interactions:
+            record = interaction._asdict()
+            try:
+                record["content"] = interaction.content.decode()
+            except UnicodeDecodeError:
+                record["content"] = base64.b64encode(interaction.content).decode()
+                record["encoding"] = "base64"
+            records.append(record)
+
+        with gzip.open(path, "wt", encoding="utf-8") as cassette_file:
+            json.dump(
+                {"version": CASSETTE_VERSION, "interactions": records}, cassette_file
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        with gzip.open(path, "rt", encoding="utf-8") as cassette_file:
+            cassette = json.load(cassette_file)
+
+        if cassette.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version: {cassette.get('version')}.")
+
+        interactions = []
+        for record in cassette["interactions"]:
+            if record.pop("encoding", None) == "base64":
+                content = base64.b64decode(record["content"])
+            else:
+                content = record["content"].encode()
+
+            interactions.append(Interaction(**{**record, "content": content}))
+
+        return cls(interactions)
+
+
+class _CassetteSession:
+    """Stands in for the interface's requests session, see FunballInterface._request"""
+
+    def __init__(self, cassette: Cassette, base_url: Optional[str]):
+        self.cassette = cassette
+        # Prefixed to endpoints exactly as the interface does, unset URLs included
+        self.base_url = f"{base_url}"
+
+    def _endpoint(self, url: str) -> str:
+        endpoint = (
+            url.replace(self.base_url, "", 1) if url.startswith(self.base_url) else url
+        )
+
+        label = endpoint_label(endpoint)
+        if label in REDACTED_ENDPOINTS:
+            return label
+
+        return endpoint
+
+    def close(self) -> None:
+        pass
+
+
+class RecordingSession(_CassetteSession):
+    """
+    Sends requests to the backend & records every response in the cassette.
+    Conditional headers are dropped, so every recording has a body; replays
+    answer conditional requests from the recorded validators instead.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        base_url: Optional[str],
+        session: requests.Session = None,
+    ):
+        super().__init__(cassette=cassette, base_url=base_url)
+        self.session = session if session is not None else create_http_session()
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        headers = {
+            name: value
+            for name, value in (kwargs.pop("headers", None) or {}).items()
+            if name not in CONDITIONAL_HEADERS
+        }
+
+        started = time.perf_counter()
+        send = self.session.post if method == "POST" else self.session.get
+        response = send(url, headers=headers, **kwargs)
+        elapsed = time.perf_counter() - started
+
+        self.cassette.add(
+            Interaction(
+                method=method,
+                endpoint=self._endpoint(url),
+                data=kwargs.get("data"),
+                status_code=response.status_code,
+                headers={
+                    name: response.headers[name]
+                    for name in RECORDED_HEADERS
+                    if name in response.headers
+                },
+                content=response.content,
+                elapsed=round(elapsed, 6),
+            )
+        )
+
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self._send("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self._send("POST", url, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class ReplaySession(_CassetteSession):
+    """
+    Answers requests from the cassette without touching the network. Responses
+    are delayed by their recorded latency times latency_scale, so 0 replays as
+    fast as possible & 1 replays at the recorded speed.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        base_url: Optional[str],
+        latency_scale: float = 0,
+    ):
+        super().__init__(cassette=cassette, base_url=base_url)
+        self.latency_scale = latency_scale
+
+    @staticmethod
+    def _is_unmodified(interaction: Interaction, headers: Dict) -> bool:
+        etag = interaction.headers.get("ETag")
+        last_modified = interaction.headers.get("Last-Modified")
+
+        return (etag is not None and headers.get("If-None-Match") == etag) or (
+            last_modified is not None
+            and headers.get("If-Modified-Since") == last_modified
+        )
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        endpoint = self._endpoint(url)
+        interaction = self.cassette.next(method, endpoint, data=kwargs.get("data"))
+        if interaction is None:
+            raise CassetteMiss(f"No recording of {method} {endpoint}.")
+
+        if self.latency_scale:
+            time.sleep(interaction.elapsed * self.latency_scale)
+
+        response = requests.Response()
+        response.url = url
+        response.headers = CaseInsensitiveDict(interaction.headers)
+        response.elapsed = timedelta(seconds=interaction.elapsed)
+
+        if self._is_unmodified(interaction, kwargs.get("headers") or {}):
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = interaction.status_code
+            response._content = interaction.content
+
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self._send("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self._send("POST", url, **kwargs)
+
+
+def create_cassette_session() -> Optional[Union[RecordingSession, ReplaySession]]:
+    """
+    Session recording to (FANTASY_FUNBALL_CASSETTE_MODE=record) or replaying from
+    (=replay) the cassette at FANTASY_FUNBALL_CASSETTE, None if either is unset.
+    Recordings are saved when the process exits, replays are delayed by the
+    recorded latencies times FANTASY_FUNBALL_CASSETTE_LATENCY (default 0).
+    """
+    path = os.environ.get("FANTASY_FUNBALL_CASSETTE")
+    mode = os.environ.get("FANTASY_FUNBALL_CASSETTE_MODE")
+    if not path or not mode:
+        return None
+
+    base_url = os.environ.get("FANTASY_FUNBALL_URL")
+
+    if mode == RECORD:
+        cassette = Cassette()
+        atexit.register(cassette.save, path)
+        logger.info("Recording backend responses to %s", path)
+
+        return RecordingSession(cassette=cassette, base_url=base_url)
+
+    if mode == REPLAY:
+        cassette = Cassette.load(path)
+        logger.info("Replaying %d backend responses from %s", len(cassette), path)
+
+        return ReplaySession(
+            cassette=cassette,
+            base_url=base_url,
+            latency_scale=float(os.environ.get("FANTASY_FUNBALL_CASSETTE_LATENCY") or 0),
+        )
+
+    raise ValueError(
+        f"FANTASY_FUNBALL_CASSETTE_MODE must be '{RECORD}' or '{REPLAY}', got '{mode}'."
+    )
@@ -0,0 +1,124 @@
+import json
+from functools import lru_cache
+from itertools import repeat
+from operator import itemgetter
+from typing import Any, List, Optional, Tuple, Union, get_args, get_origin, get_type_hints
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class RecordValidationError(TypeError):
+    """Raised when a backend response doesn't match the endpoint's record schema"""
+
+
+def loads(content: bytes) -> Any:
+    """
+    Decode a JSON response body straight from bytes, using orjson when it is
+    installed. Avoids requests decoding (& guessing the charset of) the body.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+
+    return json.loads(content)
+
+
+@lru_cache(maxsize=None)
+def _schema_fields(schema: type) -> Tuple:
+    """(field, accepted types, required) for each field of a TypedDict schema"""
+    fields = []
+    for field, field_type in get_type_hints(schema).items():
+        if get_origin(field_type) is Union:
+            accepted_types = get_args(field_type)
+        else:
+            accepted_types = (field_type,)
+
+        fields.append((field, accepted_types, field in schema.__required_keys__))
+
+    return tuple(fields)
+
+
+def _invalid_record_error(record: Any, schema: type) -> Optional[RecordValidationError]:
+    """Describe the first way in which a record doesn't match the schema, if any"""
+    if not isinstance(record, dict):
+        return RecordValidationError(
+            f"Expected a {schema.__name__}, got {type(record).__name__}."
+        )
+
+    for field, accepted_types, required in _schema_fields(schema):
+        if field not in record:
+            if required:
+                return RecordValidationError(
+                    f"{schema.__name__} is missing the '{field}' field."
+                )
+            continue
+
+        value = record[field]
+        if not _is_valid_value(value, accepted_types):
+            return RecordValidationError(
+                f"{schema.__name__} field '{field}' has unexpected type "
+                f"{type(value).__name__}."
+            )
+
+
+def _is_valid_value(value: Any, accepted_types: Tuple) -> bool:
+    # Decoded JSON values are of exact builtin types, bool must not pass as int
+    return value.__class__ in accepted_types
+
+
+def _are_valid_records(records: List, fields: Tuple) -> bool:
+    """
+    Check every record against the schema fields a field at a time, collecting
+    the value types with C-level map calls rather than looping over records
+    """
+    if not set(map(type, records)) <= {dict}:
+        return False
+
+    for field, accepted_types, required in fields:
+        if required:
+            try:
+                value_types = set(map(type, map(itemgetter(field), records)))
+            except KeyError:
+                return False
+        else:
+            # A missing optional field is read as None, so allow None too
+            accepted_types = accepted_types + (type(None),)
+            value_types = set(map(type, map(dict.get, records, repeat(field))))
+
+        if not value_types <= set(accepted_types):
+            return False
+
+    return True
+
+
+def decode_records(content: bytes, schema: type, many: bool = True) -> Any:
+    """
+    Decode a JSON response body into records of the given TypedDict schema,
+    either a list of records or a single record
+    """
+    decoded = loads(content)
+    fields = _schema_fields(schema)
+
+    if not many:
+        if not _are_valid_records([decoded], fields):
+            raise _invalid_record_error(record=decoded, schema=schema)
+
+        return decoded
+
+    if not isinstance(decoded, list):
+        raise RecordValidationError(
+            f"Expected a list of {schema.__name__}, got {type(decoded).__name__}."
+        )
+
+    if not _are_valid_records(decoded, fields):
+        raise next(
+            error
+            for error in (
+                _invalid_record_error(record=record, schema=schema) for record in decoded
+            )
+            if error is not None
+        )
+
+    return decoded
@@ -1,19 +1,441 @@
-import json
+import logging
 import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from json import JSONDecodeError
-from typing import Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import requests
 import streamlit as st
+from pandas import DataFrame
 
+from interface.cache import ResponseCache
+from interface.cassette import create_cassette_session
+from interface.decoding import decode_records, loads
 from interface.formatter import FunballInterfaceFormatter
-from utilities import ChoicesData, SubmitChoiceData, ValidTeamSelections, divider
+from interface.metrics import InterfaceMetrics, endpoint_label, start_metrics_server
+from interface.player_catalog import PlayerCatalog
+from interface.records import (
+    ChoiceRecord,
+    FixtureRecord,
+    FunballerRecord,
+    GameweekRecord,
+    GameweekSummaryRecord,
+    PlayerRecord,
+    TeamPlayerRecord,
+    ValidTeamRecord,
+)
+from interface.session import create_http_session
+from interface.single_flight import SingleFlight
+from interface.snapshot import SnapshotStore, create_snapshot_store, is_snapshot_endpoint
+from interface.standings_history import NO_OF_GAMEWEEKS, StandingsHistory
+from utilities import (
+    CacheStats,
+    ChoicesData,
+    SingleFlightStats,
+    Snapshot,
+    SubmitChoiceData,
+    ValidTeamSelections,
+    divider,
+)
+from utilities.tracing import span, with_trace_context
+
+logger = logging.getLogger(__name__)
+
+REVALIDATION_EXECUTOR = ThreadPoolExecutor(
+    max_workers=2,
+    thread_name_prefix="funball-revalidate",
+)
+
+# Every funballer's choices are fetched concurrently for the league view
+LEAGUE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=8,
+    thread_name_prefix="funball-league",
+)
+# How long (seconds) whether the backend supports gameweek windows is trusted
+GAMEWEEK_WINDOWS_TTL = 60 * 60
+
+LEAGUE_CHOICES_CACHE_KEY = "funballer/choices/#league"
+STANDINGS_HISTORY_CACHE_KEY = "funballer/#standings_history"
 
 
 class FunballInterface:
-    def __init__(self):
+    def __init__(
+        self,
+        session: requests.Session = None,
+        cache: ResponseCache = None,
+        snapshots: SnapshotStore = None,
+        metrics: InterfaceMetrics = None,
+    ):
         self.funball_url = os.environ.get("FANTASY_FUNBALL_URL")
         self.formatter = FunballInterfaceFormatter()
+        self.session = session if session is not None else create_http_session()
+        self.cache = cache if cache is not None else ResponseCache()
+        self.snapshots = snapshots
+        self.single_flight = SingleFlight()
+        self.metrics = metrics if metrics is not None else InterfaceMetrics()
+
+        # Whether the backend can filter choices by gameweek, None until known.
+        # Rechecked once GAMEWEEK_WINDOWS_TTL has passed since it was last checked.
+        self.supports_gameweek_windows = None
+        self._gameweek_windows_checked_at = None
+
+        # How each cached key was requested, so that it can be refreshed. Keys
+        # are dropped once they fail to fetch or are no longer cached.
+        self._requests = {}
+
+        self._revalidations = {}
+        self._revalidations_lock = threading.Lock()
+
+    def _get(
+        self,
+        endpoint: str,
+        schema: type,
+        parse: Callable[[Any], Any] = None,
+        cache_key: str = None,
+        many: bool = True,
+    ) -> Any:
+        """
+        GET an endpoint, decode the JSON response into records of the schema
+        (raising RecordValidationError if it doesn't match) & optionally parse it. Parsed
+        successful responses are cached, so they are shared between sessions and
+        must not be mutated by callers. Expired entries are revalidated with the
+        backend using their ETag / Last-Modified validators.
+
+        The cache key defaults to the endpoint, a suffixed key is needed when the
+        same endpoint is parsed in more than one way.
+
+        On a cold cache, a snapshot of the endpoint persisted by a previous
+        process is served while it is revalidated in the background. Concurrent
+        misses for the same key are coalesced into one request.
+        """
+        cache_key = endpoint if cache_key is None else cache_key
+        self._requests[cache_key] = (endpoint, schema, parse, many)
+
+        with span(
+            f"get {endpoint_label(endpoint)}", category="interface", cache_key=cache_key
+        ) as span_args:
+            hit, value = self.cache.get(cache_key)
+            span_args["hit"] = hit
+            if hit:
+                return value
+
+            # Concurrent misses for the same key share a single backend request
+            try:
+                return self.single_flight.do(
+                    cache_key,
+                    lambda: self._load(endpoint, schema, parse, cache_key, many),
+                )
+            except Exception:
+                self._requests.pop(cache_key, None)
+                raise
+
+    def _load(
+        self,
+        endpoint: str,
+        schema: type,
+        parse: Callable[[Any], Any],
+        cache_key: str,
+        many: bool,
+    ) -> Any:
+        """Load a cache miss from a snapshot if there is one, else the backend"""
+        if self.snapshots is not None and self.cache.get_stale(cache_key) is None:
+            snapshot = self.snapshots.get(endpoint)
+            if snapshot is not None:
+                try:
+                    value = self._decode_snapshot(snapshot, endpoint, schema, parse, many)
+                except (JSONDecodeError, TypeError):
+                    # Corrupt, or persisted before a schema change
+                    logger.warning("Discarding invalid snapshot of %s", endpoint)
+                    self.snapshots.delete(endpoint)
+                    return self._fetch(endpoint, schema, parse, cache_key, many)
+
+                self.cache.put(
+                    cache_key,
+                    value,
+                    etag=snapshot.etag,
+                    last_modified=snapshot.last_modified,
+                )
+                self._revalidate_in_background(endpoint, schema, parse, cache_key, many)
+
+                return value
+
+        return self._fetch(endpoint, schema, parse, cache_key, many)
+
+    @staticmethod
+    def _decode_snapshot(
+        snapshot: Snapshot,
+        endpoint: str,
+        schema: type,
+        parse: Callable[[Any], Any],
+        many: bool,
+    ) -> Any:
+        label = endpoint_label(endpoint)
+        with span(f"decode {label}", category="decode", snapshot=True):
+            value = decode_records(snapshot.content, schema=schema, many=many)
+        if parse is not None:
+            with span(f"parse {label}", category="parse"):
+                value = parse(value)
+
+        return value
+
+    def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """Send a request to the backend, recording its latency & outcome"""
+        label = endpoint_label(endpoint)
+        started = time.perf_counter()
+
+        try:
+            with span(f"{method} {label}", category="network") as span_args:
+                send = self.session.post if method == "POST" else self.session.get
+                response = send(f"{self.funball_url}{endpoint}", **kwargs)
+                span_args["status_code"] = response.status_code
+        except Exception as exception:
+            self.metrics.errors.inc(
+                endpoint=label, method=method, error=type(exception).__name__
+            )
+            raise
+        finally:
+            self.metrics.request_duration.observe(
+                time.perf_counter() - started, endpoint=label, method=method
+            )
+
+        self.metrics.responses.inc(
+            endpoint=label, method=method, status_code=str(response.status_code)
+        )
+
+        return response
+
+    def _fetch(
+        self,
+        endpoint: str,
+        schema: type,
+        parse: Callable[[Any], Any],
+        cache_key: str,
+        many: bool,
+        ttl: float = None,
+    ) -> Any:
+        """Request the endpoint from the backend, revalidating any stale entry"""
+        # Revalidate an expired entry rather than transferring & parsing it again
+        stale_entry = self.cache.get_stale(cache_key)
+        headers = stale_entry.conditional_headers() if stale_entry is not None else {}
+
+        response = self._request("GET", endpoint, headers=headers)
+
+        if response.status_code == 304 and stale_entry is not None:
+            self.cache.revalidate(cache_key, ttl=ttl)
+            return stale_entry.value
+
+        label = endpoint_label(endpoint)
+        self.metrics.response_size.observe(len(response.content), endpoint=label)
+
+        started = time.perf_counter()
+        with span(f"decode {label}", category="decode", size=len(response.content)):
+            value = decode_records(response.content, schema=schema, many=many)
+        self.metrics.decode_duration.observe(
+            time.perf_counter() - started, endpoint=label
+        )
+
+        if parse is not None:
+            started = time.perf_counter()
+            with span(f"parse {label}", category="parse"):
+                value = parse(value)
+            self.metrics.parse_duration.observe(
+                time.perf_counter() - started, endpoint=label
+            )
+
+        if response.status_code == 200:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+            self.cache.put(
+                cache_key, value, etag=etag, last_modified=last_modified, ttl=ttl
+            )
+            if self.snapshots is not None and is_snapshot_endpoint(endpoint):
+                self.snapshots.put(
+                    endpoint,
+                    response.content,
+                    etag=etag,
+                    last_modified=last_modified,
+                )
+
+        return value
+
+    def _revalidate_in_background(
+        self,
+        endpoint: str,
+        schema: type,
+        parse: Callable[[Any], Any],
+        cache_key: str,
+        many: bool,
+    ) -> None:
+        """Revalidate a cache entry served from a snapshot, at most once at a time"""
+        with self._revalidations_lock:
+            if cache_key in self._revalidations:
+                return
+
+            future = REVALIDATION_EXECUTOR.submit(
+                self._fetch, endpoint, schema, parse, cache_key, many
+            )
+            self._revalidations[cache_key] = future
+
+        future.add_done_callback(lambda done: self._revalidation_done(cache_key, done))
+
+    def _revalidation_done(self, cache_key: str, future: Future) -> None:
+        with self._revalidations_lock:
+            self._revalidations.pop(cache_key, None)
+
+        if future.exception() is not None:
+            logger.warning(
+                "Background revalidation of %s failed: %r",
+                cache_key,
+                future.exception(),
+            )
+
+    def wait_for_revalidations(self, timeout: float = None) -> None:
+        """Block until every background revalidation in flight has finished"""
+        with self._revalidations_lock:
+            pending = list(self._revalidations.values())
+
+        wait(pending, timeout=timeout)
+
+    def refresh(self, *prefixes: str, ttl: float = None) -> Tuple[int, int]:
+        """
+        Refetch every cached key starting with one of the prefixes, even if it
+        is still fresh. Each new value replaces the cached one in a single step,
+        so readers are never blocked or see a gap. Keys that are no longer
+        cached are left until they're next requested, & keys that fail aren't
+        refreshed again until then. Returns the number of keys (refreshed, failed).
+        """
+        cache_keys = [
+            cache_key
+            for cache_key in list(self._requests)
+            if cache_key.startswith(tuple(prefixes))
+        ]
+
+        refreshed = failed = 0
+        for cache_key in cache_keys:
+            request = self._requests.get(cache_key)
+            if request is None or self.cache.get_stale(cache_key) is None:
+                self._requests.pop(cache_key, None)
+                continue
+
+            endpoint, schema, parse, many = request
+            try:
+                self._fetch(endpoint, schema, parse, cache_key, many, ttl=ttl)
+                refreshed += 1
+            except Exception:
+                logger.exception("Refresh of %s failed", cache_key)
+                self._requests.pop(cache_key, None)
+                failed += 1
+
+        # Rebuilt from the refreshed choices when next requested
+        self.cache.expire(
+            *(
+                cache_key
+                for cache_key in (LEAGUE_CHOICES_CACHE_KEY, STANDINGS_HISTORY_CACHE_KEY)
+                if cache_key.startswith(tuple(prefixes))
+            )
+        )
+
+        return refreshed, failed
+
+    def cache_stats(self) -> CacheStats:
+        """Hit/miss counters of the response cache"""
+        return self.cache.stats()
+
+    def single_flight_stats(self) -> SingleFlightStats:
+        """Counters of backend loads & the cache misses coalesced into them"""
+        return self.single_flight.stats()
+
+    def _get_choices(
+        self,
+        funballer_name: str,
+        parse: Callable[[Any], Any] = None,
+        cache_suffix: str = "",
+        gameweek_window: range = None,
+    ) -> Any:
+        """
+        A funballer's choices, only those within the gameweek window if one is
+        given (for backends supporting the from/to query parameters)
+        """
+        endpoint = f"funballer/choices/{funballer_name}"
+        if gameweek_window is not None:
+            endpoint = (
+                f"{endpoint}?from={gameweek_window.start}&to={gameweek_window.stop - 1}"
+            )
+
+        return self._get(
+            endpoint,
+            schema=ChoiceRecord,
+            parse=parse,
+            cache_key=f"{endpoint}{cache_suffix}",
+        )
+
+    def _check_gameweek_windows(self, funballer_name: str) -> None:
+        """
+        Check whether the backend supports gameweek windows by requesting an empty
+        window of a funballer with choices: a backend applying it returns none,
+        one ignoring it returns them all. Support is left as it was if the check
+        fails.
+        """
+        try:
+            response = self._request(
+                "GET", f"funballer/choices/{funballer_name}?from=1&to=0"
+            )
+            choices = loads(response.content) if response.status_code == 200 else None
+        except (requests.RequestException, ValueError):
+            logger.warning("Unable to check whether gameweek windows are supported")
+            return
+
+        if not isinstance(choices, list):
+            return
+
+        self.supports_gameweek_windows = not choices
+        self._gameweek_windows_checked_at = time.monotonic()
+        logger.info("Backend supports gameweek windows: %s", not choices)
+
+    def _get_windowed_choices(
+        self,
+        funballer_name: str,
+        gameweek_window: range,
+        select: Callable[[Any, range], Any],
+        parse: Callable[[Any], Any] = None,
+        cache_suffix: str = "",
+    ) -> Any:
+        """
+        A funballer's choices within the gameweek window, requesting only that
+        window from the backend if it supports windows. Otherwise every choice is
+        requested & the window selected client-side, checking for support (see
+        _check_gameweek_windows) while it is unknown or due a recheck.
+        """
+        support_known = (
+            self._gameweek_windows_checked_at is not None
+            and time.monotonic() - self._gameweek_windows_checked_at
+            < GAMEWEEK_WINDOWS_TTL
+        )
+
+        if support_known and self.supports_gameweek_windows:
+            try:
+                return self._get_choices(
+                    funballer_name=funballer_name,
+                    parse=parse,
+                    cache_suffix=cache_suffix,
+                    gameweek_window=gameweek_window,
+                )
+            except (JSONDecodeError, TypeError):
+                pass
+
+        all_choices = self._get_choices(
+            funballer_name=funballer_name,
+            parse=parse,
+            cache_suffix=cache_suffix,
+        )
+        if not support_known and len(all_choices):
+            self._check_gameweek_windows(funballer_name=funballer_name)
+
+        return select(all_choices, gameweek_window)
 
     def get_choices_data(
         self, funballer_name: str, gameweek_no_limit: int
@@ -22,21 +444,24 @@ class FunballInterface:
         Retrieve choices data from the backend. Only displays all future choices
         if the requested funballer matches that stored in the streamlit session.
         """
-        choices = requests.get(f"{self.funball_url}funballer/choices/{funballer_name}")
-
         if funballer_name == st.session_state.get("funballer_name"):
             view_all_choices = True
         else:
             view_all_choices = False
 
         try:
-            choices_data = json.loads(choices.text)
-            if not view_all_choices:
-                choices_data = [
-                    x
-                    for x in choices_data
-                    if x["gameweek_id__gameweek_no"] in range(1, gameweek_no_limit)
-                ]
+            if view_all_choices:
+                choices_data = self._get_choices(funballer_name=funballer_name)
+            else:
+                choices_data = self._get_windowed_choices(
+                    funballer_name=funballer_name,
+                    gameweek_window=range(1, gameweek_no_limit),
+                    select=lambda choices, gameweek_window: [
+                        x
+                        for x in choices
+                        if x["gameweek_id__gameweek_no"] in gameweek_window
+                    ],
+                )
 
             formatted_choices_data = self.formatter.format_choices_data(
                 choices_data=choices_data,
@@ -48,99 +473,357 @@ class FunballInterface:
             st.error("Please enter a valid funballer name")
             st.stop()
 
-    def post_choice(self, payload: SubmitChoiceData) -> None:
-        """Send POST request to backend with submitted choice payload"""
+    def _get_all_choices_dataframe(self, funballer_name: str) -> DataFrame:
+        """All of a funballer's choices, including future ones"""
+        return self._get_choices(
+            funballer_name=funballer_name,
+            parse=lambda choices_data: self.formatter.format_choices_dataframe(
+                choices_data=choices_data,
+            ),
+            cache_suffix="#dataframe",
+        )
+
+    def get_choices_dataframe(
+        self, funballer_name: str, gameweek_no_limit: int
+    ) -> DataFrame:
+        """
+        Columnar variant of get_choices_data, with the same visibility rules for
+        future choices
+        """
+        if funballer_name == st.session_state.get("funballer_name"):
+            view_all_choices = True
+        else:
+            view_all_choices = False
+
+        try:
+            if view_all_choices:
+                return self._get_all_choices_dataframe(funballer_name=funballer_name)
+
+            return self._get_windowed_choices(
+                funballer_name=funballer_name,
+                gameweek_window=range(1, gameweek_no_limit),
+                select=lambda choices_dataframe, gameweek_window: choices_dataframe[
+                    choices_dataframe["Gameweek Number"].between(
+                        gameweek_window.start, gameweek_window.stop - 1
+                    )
+                ],
+                parse=lambda choices_data: self.formatter.format_choices_dataframe(
+                    choices_data=choices_data,
+                ),
+                cache_suffix="#dataframe",
+            )
+
+        except (JSONDecodeError, TypeError):
+            st.error("Please enter a valid funballer name")
+            st.stop()
+
+    def _load_league_choices_dataframe(self) -> DataFrame:
+        """Fetch every funballer's choices concurrently & merge them into a matrix"""
+        funballer_names = self.get_funballer_dataframe()["Name"].tolist()
+
+        choices_dataframes = LEAGUE_EXECUTOR.map(
+            with_trace_context(self._get_all_choices_dataframe), funballer_names
+        )
+        league_choices_dataframe = self.formatter.format_league_choices_dataframe(
+            choices_by_funballer=dict(zip(funballer_names, choices_dataframes)),
+        )
+
+        self.cache.put(LEAGUE_CHOICES_CACHE_KEY, league_choices_dataframe)
+
+        return league_choices_dataframe
+
+    def _get_all_league_choices_dataframe(self) -> DataFrame:
+        """The cached league choices matrix, including everyone's future choices"""
+        hit, league_choices_dataframe = self.cache.get(LEAGUE_CHOICES_CACHE_KEY)
+        if hit:
+            return league_choices_dataframe
+
+        return self.single_flight.do(
+            LEAGUE_CHOICES_CACHE_KEY, self._load_league_choices_dataframe
+        )
+
+    def get_league_choices_dataframe(self, gameweek_no_limit: int) -> DataFrame:
+        """
+        Funballer x gameweek matrix of every funballer's choices. The merged
+        matrix is cached, the same visibility rules as get_choices_dataframe are
+        then applied: only the funballer stored in the streamlit session can see
+        their own future choices.
+        """
+        try:
+            league_choices_dataframe = self._get_all_league_choices_dataframe()
+        except (JSONDecodeError, TypeError):
+            st.error("Unable to retrieve the league's choices")
+            st.stop()
+
+        gameweek_nos = league_choices_dataframe.columns.get_level_values(
+            "Gameweek Number"
+        )
+        hidden_gameweeks = (gameweek_nos < 1) | (gameweek_nos >= gameweek_no_limit)
+        hidden_funballers = league_choices_dataframe.index != st.session_state.get(
+            "funballer_name"
+        )
+
+        visible_choices_dataframe = league_choices_dataframe.mask(
+            np.outer(hidden_funballers, hidden_gameweeks)
+        )
+
+        # Drop gameweeks no one can see choices for yet
+        return visible_choices_dataframe.dropna(axis="columns", how="all")
+
+    def _load_standings_history(self, current_gameweek_no: int) -> StandingsHistory:
+        """
+        Update the last standings history built, even if it has expired, with
+        the latest league choices
+        """
+        stale_entry = self.cache.get_stale(STANDINGS_HISTORY_CACHE_KEY)
+        if stale_entry is not None:
+            standings_history = stale_entry.value
+        else:
+            standings_history = StandingsHistory(funballer_names=())
+
+        standings_history = standings_history.update(
+            league_choices=self._get_all_league_choices_dataframe(),
+            current_gameweek_no=current_gameweek_no,
+        )
+        self.cache.put(STANDINGS_HISTORY_CACHE_KEY, standings_history)
+
+        return standings_history
+
+    def get_standings_history(
+        self, current_gameweek_no: int
+    ) -> Optional[StandingsHistory]:
+        """
+        Cumulative points & rank of every funballer after each gameweek, up to
+        the current gameweek. None if it can't be built, e.g. when a funballer's
+        choices can't be fetched.
+        """
+        hit, standings_history = self.cache.get(STANDINGS_HISTORY_CACHE_KEY)
+        if hit and standings_history.latest_gameweek_no >= min(
+            current_gameweek_no, NO_OF_GAMEWEEKS
+        ):
+            return standings_history
+
+        try:
+            return self.single_flight.do(
+                STANDINGS_HISTORY_CACHE_KEY,
+                lambda: self._load_standings_history(
+                    current_gameweek_no=current_gameweek_no
+                ),
+            )
+        except (JSONDecodeError, TypeError, requests.RequestException):
+            logger.exception("Unable to build the standings history")
+            return None
+
+    def _invalidate_choices(self, funballer_name: str) -> None:
+        """Drop every cached view of a funballer's choices, & the league matrix"""
+        endpoint = f"funballer/choices/{funballer_name}"
+
+        self.cache.delete(
+            endpoint,
+            f"{endpoint}#dataframe",
+            f"funballer/choices/valid_teams/{funballer_name}",
+            LEAGUE_CHOICES_CACHE_KEY,
+        )
+        # Gameweek windows of the choices
+        self.cache.invalidate(f"{endpoint}?")
+
+    def post_choice(self, payload: SubmitChoiceData, funballer_name: str) -> None:
+        """
+        Send POST request to backend with submitted choice payload. Once accepted,
+        the cached choices of the funballer it was submitted for are dropped.
+        """
         post_payload = {
             "gameweek_no": payload.gameweek_no,
             "team_choice": payload.team_choice,
             "player_choice": payload.player_choice,
         }
 
-        submit_choices_request = requests.post(
-            url=f"{self.funball_url}funballer/choices/submit/{payload.pin}",
+        submit_choices_request = self._request(
+            "POST",
+            f"funballer/choices/submit/{payload.pin}",
             data=post_payload,
         )
 
+        # Choices & remaining valid teams have changed for the funballer
+        if submit_choices_request.status_code in {200, 201}:
+            self._invalidate_choices(funballer_name=funballer_name)
+
         if submit_choices_request.status_code == 201:
             st.markdown("Gameweek selection submitted! :white_check_mark:")
         elif submit_choices_request.status_code == 200:
             st.markdown("Gameweek selection updated! :ballot_box_with_check:️")
         elif submit_choices_request.status_code in {400, 404, 500}:
-            error_message = json.loads(submit_choices_request.text)["detail"]
+            error_message = loads(submit_choices_request.content)["detail"]
             st.error(f"{error_message}")
 
         divider()
 
     def get_all_player_data(self) -> List:
         """Retrieve data on ALL players from the backend"""
-        raw_player_data = requests.get(f"{self.funball_url}players/")
-        player_data = json.loads(raw_player_data.text)
+        player_data = self._get("players/", schema=PlayerRecord)
 
         return player_data
 
+    def get_player_catalog(self) -> PlayerCatalog:
+        """
+        Index of ALL players, shared by every session until the players endpoint
+        is next refreshed
+        """
+        player_catalog = self._get(
+            "players/",
+            schema=PlayerRecord,
+            parse=PlayerCatalog,
+            cache_key="players/#catalog",
+        )
+
+        return player_catalog
+
     def get_all_players_from_team(self, team_name: str) -> Dict:
         """Retrieve player data from the funball backend"""
-        players = requests.get(f"{self.funball_url}{team_name}/players/")
-        player_data = json.loads(players.text)
-
-        formatted_player_data = self.formatter.format_all_players_from_team(
-            player_data=player_data,
+        formatted_player_data = self._get(
+            f"{team_name}/players/",
+            schema=TeamPlayerRecord,
+            parse=lambda player_data: self.formatter.format_all_players_from_team(
+                player_data=player_data,
+            ),
         )
 
         return formatted_player_data
 
+    def get_all_players_from_team_dataframe(self, team_name: str) -> DataFrame:
+        """Columnar variant of get_all_players_from_team"""
+        players_dataframe = self._get(
+            f"{team_name}/players/",
+            schema=TeamPlayerRecord,
+            parse=lambda player_data: (
+                self.formatter.format_all_players_from_team_dataframe(
+                    player_data=player_data,
+                )
+            ),
+            cache_key=f"{team_name}/players/#dataframe",
+        )
+
+        return players_dataframe
+
     def get_funballer_valid_team_selections(
         self, funballer_name: str
     ) -> ValidTeamSelections:
         """Retrieve the remaining available team selections for the requested funballer"""
-        remaining_valid_teams_raw = requests.get(
-            f"{self.funball_url}funballer/choices/valid_teams/{funballer_name}"
-        )
-        remaining_valid_teams = json.loads(remaining_valid_teams_raw.text)
-
-        valid_team_selections = self.formatter.format_funballer_valid_team_selections(
-            remaining_valid_teams_data=remaining_valid_teams,
+        valid_team_selections = self._get(
+            f"funballer/choices/valid_teams/{funballer_name}",
+            schema=ValidTeamRecord,
+            parse=lambda remaining_valid_teams: (
+                self.formatter.format_funballer_valid_team_selections(
+                    remaining_valid_teams_data=remaining_valid_teams,
+                )
+            ),
         )
 
         return valid_team_selections
 
     def get_single_gameweek_data(self, gameweek_no: int) -> Dict:
         """Retrieve gameweek data from backend & format it"""
-        gameweek_data_raw = requests.get(f"{self.funball_url}gameweek/{gameweek_no}")
-
-        gameweek_data = json.loads(gameweek_data_raw.text)
-
-        formatted_gameweek_data = self.formatter.format_gameweek_data(
-            gameweek_data=gameweek_data
+        formatted_gameweek_data = self._get(
+            f"gameweek/{gameweek_no}",
+            schema=FixtureRecord,
+            parse=lambda gameweek_data: self.formatter.format_gameweek_data(
+                gameweek_data=gameweek_data
+            ),
         )
 
         return formatted_gameweek_data
 
     def get_all_gameweek_data(self) -> List:
         """Retrieve data on all gameweeks"""
-        gameweek_info = requests.get(f"{self.funball_url}gameweek/all/")
-        gameweek_data = json.loads(gameweek_info.text)
+        gameweek_data = self._get("gameweek/all/", schema=GameweekRecord)
 
         return gameweek_data
 
     def get_funballer_data(self) -> Dict:
         """Retrieve all funballer data from backend"""
-        funballers = requests.get(f"{self.funball_url}funballer/")
-        funballers_text = json.loads(funballers.text)
-
-        funballer_data = self.formatter.format_funballer_data(
-            funballer_data=funballers_text
+        funballer_data = self._get(
+            "funballer/",
+            schema=FunballerRecord,
+            parse=lambda funballers: self.formatter.format_funballer_data(
+                funballer_data=funballers
+            ),
         )
 
         return funballer_data
 
+    def get_funballer_dataframe(self) -> DataFrame:
+        """Columnar variant of get_funballer_data"""
+        funballer_dataframe = self._get(
+            "funballer/",
+            schema=FunballerRecord,
+            parse=lambda funballers: self.formatter.format_funballer_dataframe(
+                funballer_data=funballers
+            ),
+            cache_key="funballer/#dataframe",
+        )
+
+        return funballer_dataframe
+
     def get_gameweek_summary(self) -> Dict:
         """Retrieves gameweek summary from backend"""
-        gameweek_summary = requests.get(f"{self.funball_url}gameweek/summary/")
-        gameweek_summary_text = json.loads(gameweek_summary.text)
+        gameweek_summary_text = self._get(
+            "gameweek/summary/", schema=GameweekSummaryRecord, many=False
+        )
 
         return gameweek_summary_text
 
     def update_standings(self) -> None:
         """Wrapper to make update_standings request callable"""
-        requests.get(f"{self.funball_url}update_database/")
+        response = self._request("GET", "update_database/")
+        response.raise_for_status()
+
+        # Results, points & the summary are all recalculated by the update
+        self.cache.clear()
+        if self.snapshots is not None:
+            self.snapshots.clear()
+
+
+@st.experimental_singleton
+def get_funball_interface() -> FunballInterface:
+    """
+    Process-wide FunballInterface, shared across all pages and sessions so that
+    backend connections are pooled and kept alive between reruns. Its metrics
+    are served in the Prometheus format if FANTASY_FUNBALL_METRICS_PORT is set,
+    and backend responses can be recorded to / replayed from a cassette (see
+    create_cassette_session).
+    """
+    funball_interface = FunballInterface(
+        session=create_cassette_session(),
+        snapshots=create_snapshot_store(),
+    )
+
+    registry = funball_interface.metrics.registry
+    for name, documentation in (
+        ("hits", "Responses served from the cache"),
+        ("misses", "Cache lookups that missed"),
+        ("evictions", "Cache entries evicted"),
+        ("revalidations", "Expired cache entries the backend confirmed unmodified"),
+    ):
+        registry.function(
+            f"funball_cache_{name}_total",
+            documentation,
+            lambda name=name: getattr(funball_interface.cache_stats(), name),
+            kind="counter",
+        )
+    registry.function(
+        "funball_cache_entries",
+        "Entries held in the cache",
+        lambda: funball_interface.cache_stats().entries,
+    )
+    registry.function(
+        "funball_coalesced_requests_total",
+        "Cache misses that waited on an identical request in flight",
+        lambda: funball_interface.single_flight_stats().coalesced,
+        kind="counter",
+    )
+
+    metrics_port = os.environ.get("FANTASY_FUNBALL_METRICS_PORT")
+    if metrics_port:
+        start_metrics_server(port=int(metrics_port), registry=registry)
+
+    return funball_interface
@@ -1,46 +1,84 @@
-from datetime import datetime
 from typing import Dict, List
 
-import pytz
+import pandas as pd
 
 from utilities import ChoicesData, ValidTeamSelections
 
+KICKOFF_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+GAMEWEEK_COLUMNS = [
+    "id",
+    "home_team__team_name",
+    "away_team__team_name",
+    "gameday__date",
+    "kickoff",
+]
+
+# Backend fields (& their dtypes) used to build the columnar DataFrames
+CHOICES_DTYPES = {
+    "gameweek_id__gameweek_no": "int64",
+    "team_choice__team_name": "object",
+    "player_choice__first_name": "object",
+    "player_choice__surname": "object",
+    "team_point_awarded": "bool",
+    "player_point_awarded": "bool",
+}
+FUNBALLER_DTYPES = {
+    "first_name": "object",
+    "team_points": "int64",
+    "player_points": "int64",
+    "points": "int64",
+}
+LEAGUE_CHOICES_COLUMNS = [
+    "Team Choice",
+    "Player Choice",
+    "Team Point Awarded",
+    "Player Point Awarded",
+]
+TEAM_PLAYERS_DTYPES = {
+    "first_name": "object",
+    "surname": "object",
+    "goals": "int64",
+    "assists": "int64",
+}
+
 
 class FunballInterfaceFormatter:
     @classmethod
     def _format_kickoffs(cls, kickoffs: List) -> List:
-        """Format game kickoffs into Y-M-D H:M:S"""
-        bst = pytz.timezone("Europe/London")
-
-        formatted_kickoffs = [
-            datetime.strftime(
-                bst.fromutc(datetime.strptime(kickoff, "%Y-%m-%d %H:%M:%S")),
-                "%H:%M",
-            )
-            for kickoff in kickoffs
-        ]
+        """
+        Format UTC game kickoffs as UK kickoff times (H:M). The whole column of
+        kickoffs is converted at once, so it scales to a season of fixtures.
+        """
+        formatted_kickoffs = (
+            pd.to_datetime(pd.Index(kickoffs, dtype=object), format=KICKOFF_FORMAT)
+            .tz_localize("UTC")
+            .tz_convert("Europe/London")
+            .strftime("%H:%M")
+        )
 
-        return formatted_kickoffs
+        return formatted_kickoffs.tolist()
 
     def format_gameweek_data(self, gameweek_data: List) -> Dict:
-        """Format gameweek data by sorting by gameweek id"""
-        # Sort into ascending order by date, can be done via "id"
-        gameweek_sorted = sorted(gameweek_data, key=lambda x: x["id"])
+        """
+        Format gameweek data by sorting by gameweek id. Handles the fixtures of
+        one gameweek or of a whole season.
+        """
+        gameweek_dataframe = pd.DataFrame.from_records(
+            gameweek_data, columns=GAMEWEEK_COLUMNS
+        )
 
-        home_teams = [game["home_team__team_name"] for game in gameweek_sorted]
-        away_teams = [game["away_team__team_name"] for game in gameweek_sorted]
+        # Sort into ascending order by date, can be done via "id"
+        gameweek_sorted = gameweek_dataframe.sort_values(by="id", kind="mergesort")
 
         # TODO: potentially duplicated info between gameday__date and kickoff
-        game_dates = [game["gameday__date"] for game in gameweek_sorted]
-        game_kickoffs = [game["kickoff"] for game in gameweek_sorted]
-
-        formatted_kickoffs = self._format_kickoffs(kickoffs=game_kickoffs)
-
         sorted_gameweek_data = {
-            "home_teams": home_teams,
-            "away_teams": away_teams,
-            "game_dates": game_dates,
-            "game_kickoffs": formatted_kickoffs,
+            "home_teams": gameweek_sorted["home_team__team_name"].tolist(),
+            "away_teams": gameweek_sorted["away_team__team_name"].tolist(),
+            "game_dates": gameweek_sorted["gameday__date"].tolist(),
+            "game_kickoffs": self._format_kickoffs(
+                kickoffs=gameweek_sorted["kickoff"].tolist()
+            ),
         }
 
         return sorted_gameweek_data
@@ -110,3 +148,96 @@ class FunballInterfaceFormatter:
         }
 
         return funballer_data
+
+    @classmethod
+    def _records_to_dataframe(cls, records: List, dtypes: Dict) -> pd.DataFrame:
+        """Build a typed DataFrame of the given fields from decoded records"""
+        if not isinstance(records, list):
+            raise TypeError("Expected a list of records.")
+
+        return pd.DataFrame.from_records(records, columns=list(dtypes)).astype(dtypes)
+
+    @classmethod
+    def format_choices_dataframe(cls, choices_data: List) -> pd.DataFrame:
+        """Columnar variant of format_choices_data"""
+        choices = cls._records_to_dataframe(records=choices_data, dtypes=CHOICES_DTYPES)
+
+        choices_dataframe = pd.DataFrame(
+            {
+                "Gameweek Number": choices["gameweek_id__gameweek_no"],
+                "Team Choice": choices["team_choice__team_name"],
+                "Player Choice": (
+                    choices["player_choice__first_name"]
+                    + " "
+                    + choices["player_choice__surname"]
+                ),
+                "Team Point Awarded": choices["team_point_awarded"],
+                "Player Point Awarded": choices["player_point_awarded"],
+            }
+        )
+
+        return choices_dataframe
+
+    @classmethod
+    def format_all_players_from_team_dataframe(cls, player_data: List) -> pd.DataFrame:
+        """Columnar variant of format_all_players_from_team"""
+        players = cls._records_to_dataframe(
+            records=player_data, dtypes=TEAM_PLAYERS_DTYPES
+        )
+
+        players_dataframe = pd.DataFrame(
+            {
+                "Player Name": players["first_name"] + " " + players["surname"],
+                "Goals": players["goals"],
+                "Assists": players["assists"],
+            }
+        )
+
+        return players_dataframe
+
+    @classmethod
+    def format_funballer_dataframe(cls, funballer_data: List) -> pd.DataFrame:
+        """Columnar variant of format_funballer_data"""
+        funballers = cls._records_to_dataframe(
+            records=funballer_data, dtypes=FUNBALLER_DTYPES
+        )
+
+        funballer_dataframe = funballers.rename(
+            columns={
+                "first_name": "Name",
+                "team_points": "Team Points",
+                "player_points": "Player Points",
+                "points": "Total Points",
+            }
+        )
+
+        return funballer_dataframe
+
+    @classmethod
+    def format_league_choices_dataframe(
+        cls, choices_by_funballer: Dict[str, pd.DataFrame]
+    ) -> pd.DataFrame:
+        """
+        Merge the choices dataframes of every funballer into one funballer x
+        gameweek matrix, with a column per (choice field, gameweek number)
+        """
+        if not choices_by_funballer:
+            return pd.DataFrame(
+                index=pd.Index([], name="Funballer Name"),
+                columns=pd.MultiIndex.from_arrays(
+                    [[], []], names=[None, "Gameweek Number"]
+                ),
+            )
+
+        league_choices = pd.concat(
+            choices_by_funballer, names=["Funballer Name", None]
+        ).reset_index(level="Funballer Name")
+
+        league_choices_dataframe = league_choices.pivot(
+            index="Funballer Name",
+            columns="Gameweek Number",
+            values=LEAGUE_CHOICES_COLUMNS,
+        )
+
+        # Funballers without any choices still get a (empty) row
+        return league_choices_dataframe.reindex(list(choices_by_funballer))
@@ -0,0 +1,119 @@
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Callable
+
+import streamlit as st
+
+from interface.fantasy_funball import get_funball_interface
+from utilities import JobStatus
+from utilities.gameweek import UTC
+
+logger = logging.getLogger(__name__)
+
+IDLE = "idle"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+DEFAULT_UPDATE_COOLDOWN = 5 * 60
+
+
+class BackgroundJob:
+    """
+    Runs a function on a background thread at most once at a time, shared by
+    every session. Triggers while the job is running are coalesced into the
+    running job, and the job can't be triggered again until the cooldown since
+    it last started has elapsed.
+    """
+
+    def __init__(self, name: str, target: Callable[[], None], cooldown: float = 0):
+        self.name = name
+        self.target = target
+        self.cooldown = cooldown
+
+        self._lock = threading.Lock()
+        self._state = IDLE
+        self._started_at = None
+        self._started = None
+        self._finished_at = None
+        self._error = None
+        self._thread = None
+
+    def _cooldown_remaining(self) -> float:
+        if self._started is None:
+            return 0
+
+        return max(self.cooldown - (time.monotonic() - self._started), 0)
+
+    def trigger(self) -> bool:
+        """
+        Start the job unless it is already running or cooling down, returns
+        whether it was started
+        """
+        with self._lock:
+            if self._state == RUNNING or self._cooldown_remaining() > 0:
+                return False
+
+            self._state = RUNNING
+            self._started_at = datetime.now(tz=UTC)
+            self._started = time.monotonic()
+            self._finished_at = None
+            self._error = None
+
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"funball-job-{self.name}",
+                daemon=True,
+            )
+            self._thread.start()
+
+        return True
+
+    def _run(self) -> None:
+        try:
+            self.target()
+        except Exception as exception:
+            logger.exception("Job %s failed", self.name)
+            state, error = FAILED, exception
+        else:
+            logger.info("Job %s finished", self.name)
+            state, error = SUCCEEDED, None
+
+        with self._lock:
+            self._state = state
+            self._error = error
+            self._finished_at = datetime.now(tz=UTC)
+
+    def status(self) -> JobStatus:
+        with self._lock:
+            return JobStatus(
+                state=self._state,
+                started_at=self._started_at,
+                finished_at=self._finished_at,
+                error=self._error,
+                cooldown_remaining=self._cooldown_remaining(),
+            )
+
+    def wait(self, timeout: float = None) -> None:
+        """Block until the running job, if any, has finished"""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+
+
+@st.experimental_singleton
+def get_update_standings_job() -> BackgroundJob:
+    """
+    Process-wide job asking the backend to recalculate the standings. The
+    cooldown (seconds) can be overridden by FANTASY_FUNBALL_UPDATE_COOLDOWN.
+    """
+    cooldown = os.environ.get("FANTASY_FUNBALL_UPDATE_COOLDOWN")
+
+    return BackgroundJob(
+        name="update-standings",
+        target=get_funball_interface().update_standings,
+        cooldown=DEFAULT_UPDATE_COOLDOWN if not cooldown else float(cooldown),
+    )
@@ -0,0 +1,312 @@
+import logging
+import re
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Prometheus' default latency buckets, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# Endpoints are reported by template, so that label values are bounded (& pins
+# never leave the process). The first matching pattern wins.
+ENDPOINT_TEMPLATES = (
+    (re.compile(r"^funballer/choices/submit/[^/?]+"), "funballer/choices/submit/{pin}"),
+    (
+        re.compile(r"^funballer/choices/valid_teams/[^/?]+"),
+        "funballer/choices/valid_teams/{funballer_name}",
+    ),
+    (re.compile(r"^funballer/choices/[^/?]+"), "funballer/choices/{funballer_name}"),
+    (re.compile(r"^gameweek/\d+"), "gameweek/{gameweek_no}"),
+    (re.compile(r"^[^/]+/players/$"), "{team_name}/players/"),
+)
+
+
+def endpoint_label(endpoint: str) -> str:
+    """The template of an endpoint, without any query string"""
+    endpoint = endpoint.split("?", 1)[0]
+    for pattern, template in ENDPOINT_TEMPLATES:
+        if pattern.match(endpoint):
+            return template
+
+    return endpoint
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Sequence[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Metric '{self.name}' expects labels {self.labelnames}, "
+                f"got {tuple(labels)}."
+            )
+
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self) -> Iterable[Tuple[str, List[Tuple[str, str]], float]]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        for name, labels, value in self._samples():
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+        return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def _samples(self):
+        with self._lock:
+            values = sorted(self._values.items())
+
+        for key, value in values:
+            yield self.name, list(zip(self.labelnames, key)), value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name=name, documentation=documentation, labelnames=labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        bucket = bisect_left(self.buckets, value)
+
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * (len(self.buckets) + 1), 0))
+            counts[bucket] += 1
+            self._values[key] = (counts, total + value)
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            counts, _ = self._values.get(self._key(labels), ([0], 0))
+
+            return sum(counts)
+
+    def _samples(self):
+        with self._lock:
+            values = sorted(
+                (key, (list(counts), total))
+                for key, (counts, total) in self._values.items()
+            )
+
+        for key, (counts, total) in values:
+            labels = list(zip(self.labelnames, key))
+
+            cumulative_count = 0
+            for upper_bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative_count += count
+                yield (
+                    f"{self.name}_bucket",
+                    labels + [("le", _format_value(float(upper_bound)))],
+                    cumulative_count,
+                )
+
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, cumulative_count
+
+
+class FunctionMetric(_Metric):
+    """Unlabelled metric whose value is read from a function when exported"""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        function: Callable[[], float],
+        kind: str = "gauge",
+    ):
+        super().__init__(name=name, documentation=documentation)
+        self.function = function
+        self.kind = kind
+
+    def _samples(self):
+        yield self.name, [], self.function()
+
+
+class MetricsRegistry:
+    """Named metrics, rendered together in the Prometheus text format"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing_metric = self._metrics.get(metric.name)
+            if existing_metric is not None and not isinstance(metric, FunctionMetric):
+                return existing_metric
+
+            self._metrics[metric.name] = metric
+
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def function(
+        self,
+        name: str,
+        documentation: str,
+        function: Callable[[], float],
+        kind: str = "gauge",
+    ) -> FunctionMetric:
+        """Register (or replace) a metric read from a function"""
+        return self._register(FunctionMetric(name, documentation, function, kind))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+
+        lines = []
+        for metric in metrics:
+            try:
+                lines.extend(metric.render())
+            except Exception:
+                logger.exception("Unable to collect metric %s", metric.name)
+
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+class InterfaceMetrics:
+    """The metrics recorded by FunballInterface for every backend call"""
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY):
+        self.registry = registry
+
+        self.request_duration = registry.histogram(
+            "funball_backend_request_duration_seconds",
+            "Time taken for the backend to respond, by endpoint",
+            labelnames=("endpoint", "method"),
+        )
+        self.responses = registry.counter(
+            "funball_backend_responses_total",
+            "Backend responses, by endpoint & status code",
+            labelnames=("endpoint", "method", "status_code"),
+        )
+        self.errors = registry.counter(
+            "funball_backend_errors_total",
+            "Backend calls that failed, by endpoint & error",
+            labelnames=("endpoint", "method", "error"),
+        )
+        self.response_size = registry.histogram(
+            "funball_backend_response_size_bytes",
+            "Size of backend response bodies, by endpoint",
+            labelnames=("endpoint",),
+            buckets=SIZE_BUCKETS,
+        )
+        self.decode_duration = registry.histogram(
+            "funball_decode_duration_seconds",
+            "Time taken to decode & validate backend responses, by endpoint",
+            labelnames=("endpoint",),
+        )
+        self.parse_duration = registry.histogram(
+            "funball_parse_duration_seconds",
+            "Time taken to format decoded responses, by endpoint",
+            labelnames=("endpoint",),
+        )
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        body = self.server.registry.render().encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_):
+        pass
+
+
+def start_metrics_server(
+    port: int, registry: MetricsRegistry = REGISTRY, host: str = "0.0.0.0"
+) -> ThreadingHTTPServer:
+    """Serve the registry at /metrics from a daemon thread, port 0 picks a free port"""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    server.registry = registry
+
+    threading.Thread(
+        target=server.serve_forever,
+        name="funball-metrics",
+        daemon=True,
+    ).start()
+    logger.info("Serving metrics on port %d", server.server_port)
+
+    return server
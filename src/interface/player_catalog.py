@@ -0,0 +1,78 @@
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from interface.records import PlayerRecord
+
+
+def _player_name(player: PlayerRecord) -> str:
+    """The player's display name, built from their first name & surname if needed"""
+    name = player.get("name")
+    if name is not None:
+        return name
+
+    return " ".join(
+        part for part in (player.get("first_name"), player.get("surname")) if part
+    )
+
+
+class PlayerCatalog:
+    """
+    Immutable index of every player, built once per refresh of the players
+    endpoint. Players are looked up by id, display label or team in constant
+    time. Players sharing a name are given labels disambiguated by their team,
+    or by their id if the team doesn't tell them apart.
+    """
+
+    def __init__(self, player_data: List[PlayerRecord]):
+        ids = tuple(player["id"] for player in player_data)
+        names = tuple(_player_name(player) for player in player_data)
+        teams = tuple(player.get("team__team_name") for player in player_data)
+
+        name_counts = Counter(names)
+        name_team_counts = Counter(zip(names, teams))
+
+        labels = []
+        for player_id, name, team in zip(ids, names, teams):
+            if name_counts[name] == 1:
+                labels.append(name)
+            elif team is not None and name_team_counts[name, team] == 1:
+                labels.append(f"{name} ({team})")
+            else:
+                labels.append(f"{name} (#{player_id})")
+
+        self.options = tuple(labels)
+
+        self._names_by_id = dict(zip(ids, names))
+        self._teams_by_id = dict(zip(ids, teams))
+        self._labels_by_id = dict(zip(ids, labels))
+        self._ids_by_label = dict(zip(labels, ids))
+
+        ids_by_team = {}
+        for player_id, team in zip(ids, teams):
+            if team is not None:
+                ids_by_team.setdefault(team, []).append(player_id)
+        self._ids_by_team: Dict[str, Tuple[int, ...]] = {
+            team: tuple(team_ids) for team, team_ids in ids_by_team.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.options)
+
+    def __contains__(self, player_id: int) -> bool:
+        return player_id in self._names_by_id
+
+    def id_for_label(self, label: str) -> int:
+        """The id of the player a selectbox option refers to"""
+        return self._ids_by_label[label]
+
+    def label_for_id(self, player_id: int) -> str:
+        return self._labels_by_id[player_id]
+
+    def name_for_id(self, player_id: int) -> str:
+        return self._names_by_id[player_id]
+
+    def team_for_id(self, player_id: int) -> Optional[str]:
+        return self._teams_by_id[player_id]
+
+    def ids_for_team(self, team_name: str) -> Tuple[int, ...]:
+        return self._ids_by_team.get(team_name, ())
@@ -0,0 +1,60 @@
+from typing import Optional, TypedDict
+
+# Schemas of the records returned by each backend endpoint. Only the fields the
+# app reads are listed, any other fields are passed through untouched.
+
+
+class ChoiceRecord(TypedDict):
+    gameweek_id__gameweek_no: int
+    team_choice__team_name: str
+    player_choice__first_name: str
+    player_choice__surname: str
+    team_point_awarded: Optional[bool]
+    player_point_awarded: Optional[bool]
+
+
+class FixtureRecord(TypedDict):
+    id: int
+    home_team__team_name: str
+    away_team__team_name: str
+    gameday__date: str
+    kickoff: str
+
+
+class GameweekRecord(TypedDict):
+    gameweek_no: int
+    deadline: str
+
+
+class GameweekSummaryRecord(TypedDict):
+    text: str
+
+
+class FunballerRecord(TypedDict):
+    first_name: str
+    team_points: int
+    player_points: int
+    points: int
+
+
+class _PlayerRecordBase(TypedDict):
+    id: int
+
+
+class PlayerRecord(_PlayerRecordBase, total=False):
+    name: str
+    first_name: str
+    surname: str
+    team__team_name: str
+
+
+class TeamPlayerRecord(TypedDict):
+    first_name: str
+    surname: str
+    goals: int
+    assists: int
+
+
+class ValidTeamRecord(TypedDict):
+    team_name: str
+    remaining_selections: int
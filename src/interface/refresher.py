@@ -0,0 +1,170 @@
+import logging
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+import streamlit as st
+
+from interface.fantasy_funball import FunballInterface, get_funball_interface
+from utilities import RefreshRun
+from utilities.gameweek import LONDON, UTC, get_gameweek_calendar
+
+logger = logging.getLogger(__name__)
+
+# Standings, choices & the summary only change with the backend's midnight
+# results update, or once a gameweek deadline reveals everyone's choices
+REFRESH_PREFIXES = ("funballer/", "gameweek/summary/")
+
+DEFAULT_UPDATE_DELAY = timedelta(minutes=5)
+DEFAULT_DEADLINE_DELAY = timedelta(minutes=1)
+
+# Refreshed entries are kept fresh until a little after the next refresh is due
+TTL_MARGIN = timedelta(minutes=5)
+
+DEFAULT_HISTORY_SIZE = 50
+
+
+class BackgroundRefresher:
+    """
+    Daemon thread refetching the data that changes at known times: shortly after
+    the backend's midnight (UK time) results update, and at each gameweek
+    deadline. Refreshed entries are swapped into the shared cache & kept fresh
+    until the next refresh, so no user request waits on the backend at the busy
+    moments right after an update.
+    """
+
+    def __init__(
+        self,
+        funball_interface: FunballInterface,
+        update_delay: timedelta = DEFAULT_UPDATE_DELAY,
+        deadline_delay: timedelta = DEFAULT_DEADLINE_DELAY,
+        history_size: int = DEFAULT_HISTORY_SIZE,
+    ):
+        self.funball_interface = funball_interface
+        self.update_delay = update_delay
+        self.deadline_delay = deadline_delay
+
+        self._history = deque(maxlen=history_size)
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def next_update(self, now: datetime) -> datetime:
+        """When the refresh following the next midnight results update is due"""
+        today = now.astimezone(LONDON).date()
+
+        for date in (today, today + timedelta(days=1)):
+            midnight = LONDON.localize(datetime.combine(date, datetime.min.time()))
+            update = midnight + self.update_delay
+            if update > now:
+                return update
+
+    def next_deadline(self, now: datetime) -> Optional[datetime]:
+        """When the refresh following the next gameweek deadline is due"""
+        try:
+            all_gameweek_data = self.funball_interface.get_all_gameweek_data()
+        except Exception:
+            logger.exception("Unable to fetch gameweek deadlines")
+            return None
+
+        calendar = get_gameweek_calendar(all_gameweek_data=all_gameweek_data)
+        next_deadline = calendar.next_deadline(now=now - self.deadline_delay)
+        if next_deadline is None:
+            return None
+
+        _, deadline = next_deadline
+
+        return deadline + self.deadline_delay
+
+    def next_run(self, now: datetime = None) -> Tuple[datetime, str]:
+        """(when, reason) of the next scheduled refresh"""
+        now = now or datetime.now(tz=UTC)
+
+        next_run = (self.next_update(now=now), "update")
+
+        deadline = self.next_deadline(now=now)
+        if deadline is not None and deadline < next_run[0]:
+            next_run = (deadline, "deadline")
+
+        return next_run
+
+    def run_once(self, reason: str = "manual") -> RefreshRun:
+        """Refresh the data now, keeping it fresh until the next scheduled run"""
+        started_at = datetime.now(tz=UTC)
+        started = time.perf_counter()
+
+        next_run, _ = self.next_run(now=started_at)
+        ttl = (next_run - started_at + TTL_MARGIN).total_seconds()
+
+        refreshed, failed = self.funball_interface.refresh(*REFRESH_PREFIXES, ttl=ttl)
+
+        run = RefreshRun(
+            reason=reason,
+            started_at=started_at,
+            duration=time.perf_counter() - started,
+            refreshed=refreshed,
+            failed=failed,
+        )
+        self._history.append(run)
+
+        logger.info(
+            "Refreshed %d entries (%d failed) after %s in %.3fs",
+            run.refreshed,
+            run.failed,
+            run.reason,
+            run.duration,
+        )
+
+        return run
+
+    def history(self) -> List[RefreshRun]:
+        """The most recent refresh runs, oldest first"""
+        return list(self._history)
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            now = datetime.now(tz=UTC)
+            when, reason = self.next_run(now=now)
+
+            if self._stopped.wait(timeout=max((when - now).total_seconds(), 0)):
+                break
+
+            try:
+                self.run_once(reason=reason)
+            except Exception:
+                logger.exception("Background refresh failed")
+
+    def start(self) -> None:
+        if self.is_running():
+            return
+
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="funball-refresher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = None) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+
+@st.experimental_singleton
+def get_background_refresher() -> BackgroundRefresher:
+    """
+    Process-wide refresher of the shared FunballInterface, started on first use
+    unless FANTASY_FUNBALL_BACKGROUND_REFRESH is set to 0
+    """
+    refresher = BackgroundRefresher(funball_interface=get_funball_interface())
+    if os.environ.get("FANTASY_FUNBALL_BACKGROUND_REFRESH", "1") != "0":
+        refresher.start()
+
+    return refresher
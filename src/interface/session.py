@@ -0,0 +1,63 @@
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_POOL_SIZE = 20
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.3
+
+# Only idempotent requests are retried, POSTs (choice submissions) never are
+RETRY_METHODS = frozenset({"GET", "HEAD"})
+RETRY_STATUS_CODES = (502, 503, 504)
+
+
+def _get_env_setting(name: str, default, cast):
+    """Read a setting from the environment, falling back to the default"""
+    value = os.environ.get(name)
+    if value is None or value == "":
+        return default
+
+    return cast(value)
+
+
+def create_http_session(
+    pool_size: int = None,
+    max_retries: int = None,
+    backoff_factor: float = None,
+) -> requests.Session:
+    """
+    Create a requests session backed by a keep-alive connection pool. Idempotent
+    requests are retried with exponential backoff on connection errors and
+    gateway errors. Settings can be overridden via the environment.
+    """
+    if pool_size is None:
+        pool_size = _get_env_setting("FANTASY_FUNBALL_POOL_SIZE", DEFAULT_POOL_SIZE, int)
+    if max_retries is None:
+        max_retries = _get_env_setting(
+            "FANTASY_FUNBALL_MAX_RETRIES", DEFAULT_MAX_RETRIES, int
+        )
+    if backoff_factor is None:
+        backoff_factor = _get_env_setting(
+            "FANTASY_FUNBALL_RETRY_BACKOFF", DEFAULT_BACKOFF_FACTOR, float
+        )
+
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=RETRY_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
@@ -0,0 +1,112 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from utilities import Snapshot
+
+DAY = 24 * 60 * 60
+
+DEFAULT_MAX_AGE = 7 * DAY
+
+# Let SQLite memory-map the snapshot file, so reading it costs page cache rather
+# than heap
+MMAP_SIZE = 64 * 1024 * 1024
+
+# Only shared, non-personal responses are persisted: gameweeks, fixtures, the
+# summary, players & the standings. A funballer's choices never touch the disk.
+SNAPSHOT_PREFIXES = ("gameweek/", "players/")
+SNAPSHOT_ENDPOINTS = frozenset({"funballer/"})
+
+
+def is_snapshot_endpoint(endpoint: str) -> bool:
+    """Whether responses from the endpoint are persisted to the snapshot store"""
+    return endpoint in SNAPSHOT_ENDPOINTS or endpoint.startswith(SNAPSHOT_PREFIXES)
+
+
+class SnapshotStore:
+    """
+    SQLite store of the last good response body for each endpoint, along with
+    its validators. Lets a restarted process serve its first requests from disk
+    while the responses are revalidated with the backend. Snapshots older than
+    max_age are ignored.
+    """
+
+    def __init__(self, path: str, max_age: float = DEFAULT_MAX_AGE):
+        self.path = path
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                "endpoint TEXT PRIMARY KEY, "
+                "content BLOB NOT NULL, "
+                "etag TEXT, "
+                "last_modified TEXT, "
+                "fetched_at REAL NOT NULL)"
+            )
+
+    def get(self, endpoint: str) -> Optional[Snapshot]:
+        """The endpoint's snapshot, or None if there isn't a recent enough one"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT content, etag, last_modified, fetched_at "
+                "FROM snapshots WHERE endpoint = ?",
+                (endpoint,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        snapshot = Snapshot(*row)
+        if time.time() - snapshot.fetched_at > self.max_age:
+            return None
+
+        return snapshot
+
+    def put(
+        self,
+        endpoint: str,
+        content: bytes,
+        etag: str = None,
+        last_modified: str = None,
+    ) -> None:
+        """Replace the endpoint's snapshot with a freshly fetched response body"""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO snapshots "
+                "(endpoint, content, etag, last_modified, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (endpoint, content, etag, last_modified, time.time()),
+            )
+
+    def delete(self, endpoint: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM snapshots WHERE endpoint = ?", (endpoint,)
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM snapshots")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+def create_snapshot_store() -> Optional[SnapshotStore]:
+    """
+    Snapshot store at the path set by FANTASY_FUNBALL_SNAPSHOT_PATH, snapshots
+    are disabled if it isn't set
+    """
+    path = os.environ.get("FANTASY_FUNBALL_SNAPSHOT_PATH")
+    if not path:
+        return None
+
+    return SnapshotStore(path)
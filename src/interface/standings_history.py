@@ -0,0 +1,126 @@
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+NO_OF_GAMEWEEKS = 38
+
+POINTS_DTYPE = np.int16
+
+
+def _points_matrix(points_awarded: pd.DataFrame, first: int, last: int) -> np.ndarray:
+    """
+    Points awarded (0 or 1) for gameweeks first to last, from a league choices
+    (funballer x gameweek) points column. Missing choices score nothing.
+    """
+    return (
+        points_awarded.reindex(columns=range(first, last + 1))
+        .fillna(False)
+        .to_numpy(dtype=bool)
+        .astype(POINTS_DTYPE)
+    )
+
+
+class StandingsHistory:
+    """
+    Cumulative team, player & total points, along with the rank, of every
+    funballer after each gameweek. Held as funballers x 38 arrays, so the whole
+    season's history is a few kilobytes.
+
+    Histories are updated incrementally from the league choices: gameweeks that
+    have finished are folded in once & never recalculated, only the current
+    gameweek (whose results may still be arriving) is recalculated on update.
+    Updates return a new history, so a history shared via the cache is never
+    mutated.
+    """
+
+    def __init__(self, funballer_names: Sequence[str]):
+        self.funballer_names = tuple(funballer_names)
+
+        shape = (len(self.funballer_names), NO_OF_GAMEWEEKS)
+        self.team_points = np.zeros(shape, dtype=POINTS_DTYPE)
+        self.player_points = np.zeros(shape, dtype=POINTS_DTYPE)
+        self.ranks = np.zeros(shape, dtype=POINTS_DTYPE)
+
+        # Gameweeks up to final_gameweek_no are finished & won't be recalculated,
+        # latest_gameweek_no is the last gameweek with (possibly partial) results
+        self.final_gameweek_no = 0
+        self.latest_gameweek_no = 0
+
+    @property
+    def total_points(self) -> np.ndarray:
+        return self.team_points + self.player_points
+
+    def _copy(self) -> "StandingsHistory":
+        history = StandingsHistory(funballer_names=self.funballer_names)
+        history.team_points = self.team_points.copy()
+        history.player_points = self.player_points.copy()
+        history.ranks = self.ranks.copy()
+        history.final_gameweek_no = self.final_gameweek_no
+        history.latest_gameweek_no = self.latest_gameweek_no
+
+        return history
+
+    def update(
+        self, league_choices: pd.DataFrame, current_gameweek_no: int
+    ) -> "StandingsHistory":
+        """
+        Fold the league choices' points into the history, up to the current
+        gameweek. The history is rebuilt if the funballers have changed.
+        """
+        if tuple(league_choices.index) != self.funballer_names:
+            base = StandingsHistory(funballer_names=league_choices.index)
+        else:
+            base = self
+
+        history = base._copy()
+
+        first = base.final_gameweek_no + 1
+        last = min(current_gameweek_no, NO_OF_GAMEWEEKS)
+        if last < first or not history.funballer_names:
+            return history
+
+        gameweeks = slice(first - 1, last)
+
+        for cumulative_points, points_awarded in (
+            (history.team_points, league_choices["Team Point Awarded"]),
+            (history.player_points, league_choices["Player Point Awarded"]),
+        ):
+            previous_points = (
+                cumulative_points[:, first - 2] if first > 1 else POINTS_DTYPE(0)
+            )
+            cumulative_points[:, gameweeks] = np.cumsum(
+                _points_matrix(points_awarded, first=first, last=last), axis=1
+            ) + np.reshape(previous_points, (-1, 1))
+
+        # Rank is 1 + the number of funballers with strictly more points
+        total_points = history.total_points[:, gameweeks]
+        history.ranks[:, gameweeks] = 1 + np.sum(
+            total_points[np.newaxis, :, :] > total_points[:, np.newaxis, :], axis=1
+        )
+
+        history.final_gameweek_no = max(base.final_gameweek_no, last - 1)
+        history.latest_gameweek_no = last
+
+        return history
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """History up to the latest gameweek, a row per funballer & gameweek"""
+        gameweeks = slice(0, self.latest_gameweek_no)
+        no_of_funballers = len(self.funballer_names)
+
+        return pd.DataFrame(
+            {
+                "Gameweek": np.tile(
+                    np.arange(1, self.latest_gameweek_no + 1), no_of_funballers
+                ),
+                "Funballer": np.repeat(
+                    np.array(self.funballer_names, dtype=object),
+                    self.latest_gameweek_no,
+                ),
+                "Team Points": self.team_points[:, gameweeks].ravel(),
+                "Player Points": self.player_points[:, gameweeks].ravel(),
+                "Total Points": self.total_points[:, gameweeks].ravel(),
+                "Rank": self.ranks[:, gameweeks].ravel(),
+            }
+        )
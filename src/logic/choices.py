@@ -1,58 +1,76 @@
-from typing import List
+from functools import lru_cache
+from typing import Dict, Sequence, Tuple
 
+import numpy as np
 import streamlit as st
 from pandas import DataFrame
+from pandas.io.formats.style import Styler
+
+from interface import PlayerCatalog
+from utilities import (
+    ColourMap,
+    SubmitChoiceData,
+    ValidTeamSelections,
+    divider,
+    get_team_names,
+)
+from utilities.tracing import traced
+
+WIN_COLOUR = "background-color: green"
+LOSE_COLOUR = "background-color: red"
+
+
+@lru_cache(maxsize=128)
+def _create_choices_css_matrix(
+    points_awarded: bytes,
+    shape: Tuple[int, int],
+    no_of_columns: int,
+    column_positions: Tuple[int, ...],
+) -> np.ndarray:
+    """
+    Build the CSS matrix for a choices table, cached by the content of the
+    points awarded (rows x coloured columns) matrix
+    """
+    points_awarded_matrix = np.frombuffer(points_awarded, dtype=bool).reshape(shape)
 
-from interface.fantasy_funball import FunballInterface
-from utilities import ChoicesData, ColourMap, SubmitChoiceData, divider, get_team_names
+    css_matrix = np.full((shape[0], no_of_columns), "", dtype=object)
+    css_matrix[:, list(column_positions)] = np.where(
+        points_awarded_matrix, WIN_COLOUR, LOSE_COLOUR
+    )
+    css_matrix.flags.writeable = False
 
-FUNBALL_INTERFACE = FunballInterface()
+    return css_matrix
 
 
-class DataframeStyler:
-    def __init__(
-        self,
-        dataframe: DataFrame,
-        winning_teams_colourmap: List[int],
-        winning_players_colourmap: List[int],
-    ):
-        self.styled_dataframe = DataFrame(
-            "", index=dataframe.index, columns=dataframe.columns
-        )
+@traced
+def create_choices_css(
+    choices_dataframe: DataFrame,
+    points_awarded: Dict[str, Sequence[bool]],
+) -> DataFrame:
+    """
+    Create the CSS for every cell of a choices table in one operation. Each
+    column in points_awarded is coloured green where a point was awarded & red
+    where it wasn't, all other cells are left unstyled.
+    """
+    column_positions = tuple(
+        choices_dataframe.columns.get_loc(column) for column in points_awarded
+    )
+    points_awarded_matrix = np.column_stack(
+        [np.asarray(points, dtype=bool) for points in points_awarded.values()]
+    ).reshape(len(choices_dataframe), len(points_awarded))
+
+    css_matrix = _create_choices_css_matrix(
+        points_awarded=points_awarded_matrix.tobytes(),
+        shape=points_awarded_matrix.shape,
+        no_of_columns=len(choices_dataframe.columns),
+        column_positions=column_positions,
+    )
 
-        self.winning_teams_colourmap = winning_teams_colourmap
-        self.winning_players_colourmap = winning_players_colourmap
-
-        self.win_colour = "background-color: green"
-        self.lose_colour = "background-color: red"
-
-    def format_winning_teams(self, *_) -> DataFrame:
-        team_choice_column_index = 2
-        for index, value in enumerate(self.winning_teams_colourmap):
-            if value:
-                self.styled_dataframe.iloc[
-                    index, team_choice_column_index
-                ] = self.win_colour
-            else:
-                self.styled_dataframe.iloc[
-                    index, team_choice_column_index
-                ] = self.lose_colour
-
-        return self.styled_dataframe
-
-    def format_winning_players(self, *_) -> DataFrame:
-        player_choice_column_index = 3
-        for index, value in enumerate(self.winning_players_colourmap):
-            if value:
-                self.styled_dataframe.iloc[
-                    index, player_choice_column_index
-                ] = self.win_colour
-            else:
-                self.styled_dataframe.iloc[
-                    index, player_choice_column_index
-                ] = self.lose_colour
-
-        return self.styled_dataframe
+    return DataFrame(
+        css_matrix,
+        index=choices_dataframe.index,
+        columns=choices_dataframe.columns,
+    )
 
 
 def get_funballer_name_from_pin(funballer_pin: str) -> None:
@@ -109,25 +127,62 @@ def get_funballer_name_from_pin(funballer_pin: str) -> None:
     st.session_state.funballer_name = funballer_name
 
 
-@st.experimental_memo
-def remaining_teams_styler(s) -> DataFrame:
-    green = "background-color: green"
-    orange = "background-color: orange"
-    red = "background-color: red"
+# Colours indexed by the number of remaining selections, the last is for
+# unexpected counts
+REMAINING_SELECTIONS_COLOURS = np.array(
+    [
+        "background-color: red",
+        "background-color: orange",
+        "background-color: green",
+        "",
+    ],
+    dtype=object,
+)
+
+
+@lru_cache(maxsize=256)
+def _remaining_teams_colours(remaining_selections: bytes) -> np.ndarray:
+    """Map packed remaining selections to row colours in one vectorised lookup"""
+    remaining_selections_array = np.frombuffer(remaining_selections, dtype=np.int64)
+    colour_index = np.where(
+        (remaining_selections_array >= 0) & (remaining_selections_array <= 2),
+        remaining_selections_array,
+        len(REMAINING_SELECTIONS_COLOURS) - 1,
+    )
 
-    dataframe = s.copy()
+    colours = REMAINING_SELECTIONS_COLOURS[colour_index]
+    colours.flags.writeable = False
 
-    green_mask = dataframe["Remaining Selections"] == 2
-    orange_mask = dataframe["Remaining Selections"] == 1
-    red_mask = dataframe["Remaining Selections"] == 0
+    return colours
 
-    dataframe.loc[green_mask, :] = green
-    dataframe.loc[orange_mask, :] = orange
-    dataframe.loc[red_mask, :] = red
 
-    return dataframe
+def remaining_teams_colours(remaining_selections: Sequence[int]) -> np.ndarray:
+    """
+    Row colours for each team's remaining selections, memoised on the packed
+    counts. Hashing the packed bytes is far cheaper than hashing a DataFrame
+    (or a tuple, which streamlit's memo hashes element by element).
+    """
+    return _remaining_teams_colours(
+        np.asarray(remaining_selections, dtype=np.int64).tobytes()
+    )
 
 
+@traced
+def style_remaining_teams_dataframe(remaining_teams_dataframe: DataFrame) -> Styler:
+    """Colour each team's row by the number of selections it has remaining"""
+    colours = remaining_teams_colours(
+        remaining_teams_dataframe["Remaining Selections"].to_numpy()
+    )
+    remaining_teams_css = DataFrame(
+        np.repeat(colours[:, np.newaxis], len(remaining_teams_dataframe.columns), 1),
+        index=remaining_teams_dataframe.index,
+        columns=remaining_teams_dataframe.columns,
+    )
+
+    return remaining_teams_dataframe.style.apply(lambda _: remaining_teams_css, axis=None)
+
+
+@traced
 def display_choices_form() -> str:
     """
     Display the choices form, allowing user to select who's choices they want to
@@ -157,80 +212,47 @@ def display_choices_form() -> str:
     return funballer_name
 
 
-def create_choices_colour_map(choices_data: ChoicesData) -> ColourMap:
+@traced
+def create_choices_colour_map(choices_data: DataFrame) -> ColourMap:
     """
     Create dataframe colour map for points awarded for team and player choices.
     """
-    team_result_data = [
-        {
-            "team": team_name,
-            "team_point_awarded": team_point_awarded,
-        }
-        for team_name, team_point_awarded in zip(
-            choices_data.team_choice, choices_data.team_point_awarded
-        )
-    ]
-
-    player_result_data = [
-        {
-            "player": player_name,
-            "player_point_awarded": player_point_awarded,
-        }
-        for player_name, player_point_awarded in zip(
-            choices_data.player_choice, choices_data.player_point_awarded
-        )
-    ]
-
-    team_point_awarded_colour_mapping = [
-        True if result["team_point_awarded"] else False for result in team_result_data
-    ]
-    player_point_awarded_colour_mapping = [
-        True if result["player_point_awarded"] else False for result in player_result_data
-    ]
-
     colour_map = ColourMap(
-        team_points=team_point_awarded_colour_mapping,
-        player_points=player_point_awarded_colour_mapping,
+        team_points=choices_data["Team Point Awarded"].tolist(),
+        player_points=choices_data["Player Point Awarded"].tolist(),
     )
 
     return colour_map
 
 
+@traced
 def style_choices_dataframe(
     choices_dataframe: DataFrame,
     colour_map: ColourMap,
-) -> DataFrame:
-    df_styler = DataframeStyler(
-        dataframe=choices_dataframe,
-        winning_teams_colourmap=colour_map.team_points,
-        winning_players_colourmap=colour_map.player_points,
-    )
-
-    int_styled_dataframe = choices_dataframe.style.apply(
-        df_styler.format_winning_teams, axis=None
-    )
-    final_styled_dataframe = int_styled_dataframe.apply(
-        df_styler.format_winning_players, axis=None
+) -> Styler:
+    """Colour team & player choices by whether they were awarded a point"""
+    choices_css = create_choices_css(
+        choices_dataframe=choices_dataframe,
+        points_awarded={
+            "Team Choice": colour_map.team_points,
+            "Player Choice": colour_map.player_points,
+        },
     )
 
-    return final_styled_dataframe
+    return choices_dataframe.style.apply(lambda _: choices_css, axis=None)
 
 
+@traced
 def create_choices_dataframe(
     funballer_name: str,
-    choices_data: ChoicesData,
-) -> DataFrame:
+    choices_data: DataFrame,
+) -> Styler:
     """Create the choices dataframe"""
     st.write(f"{funballer_name}'s Choices:")
 
-    choices_dataframe = DataFrame(
-        {
-            "Funballer Name": funballer_name,
-            "Gameweek Number": choices_data.gameweek_no,
-            "Team Choice": choices_data.team_choice,
-            "Player Choice": choices_data.player_choice,
-        }
-    )
+    choices_dataframe = choices_data.assign(**{"Funballer Name": funballer_name})[
+        ["Funballer Name", "Gameweek Number", "Team Choice", "Player Choice"]
+    ]
     indexed_choices_dataframe = choices_dataframe.set_index("Gameweek Number", drop=False)
 
     colour_map = create_choices_colour_map(choices_data=choices_data)
@@ -243,19 +265,20 @@ def create_choices_dataframe(
     return styled_choices_dataframe
 
 
+@traced
 def display_choices_dataframe(choices_dataframe: DataFrame) -> None:
     """Display choices dataframe"""
     st.dataframe(choices_dataframe)
     divider()
 
 
-def create_submit_choices_form(default_gameweek_no: int) -> SubmitChoiceData:
+@traced
+def create_submit_choices_form(
+    default_gameweek_no: int,
+    player_catalog: PlayerCatalog,
+) -> SubmitChoiceData:
     st.subheader("Submit Choices")
 
-    player_data = FUNBALL_INTERFACE.get_all_player_data()
-
-    player_names = [player["name"] for player in player_data]
-
     with st.form(key="submit_choices"):
         cols_top = st.columns(2)
         pin = cols_top[0].text_input("Funballer Pin:")
@@ -265,12 +288,10 @@ def create_submit_choices_form(default_gameweek_no: int) -> SubmitChoiceData:
         team_choice = cols_bottom[0].selectbox(
             label="Team Choice:", options=get_team_names()
         )
-        player_choice_name = cols_bottom[1].selectbox(
-            label="Player Choice:", options=player_names
-        )
-        player_choice_id = next(
-            player["id"] for player in player_data if player_choice_name == player["name"]
+        player_choice_label = cols_bottom[1].selectbox(
+            label="Player Choice:", options=player_catalog.options
         )
+        player_choice_id = player_catalog.id_for_label(player_choice_label)
 
         submit_choices = st.form_submit_button("Submit Choices")
 
@@ -285,22 +306,21 @@ def create_submit_choices_form(default_gameweek_no: int) -> SubmitChoiceData:
         return submit_choice_data
 
 
-def display_funballers_remaining_picks(funballer_name: str) -> None:
+@traced
+def display_funballers_remaining_picks(
+    funballer_name: str,
+    valid_team_selections: ValidTeamSelections,
+) -> None:
     """Display the remaining available team picks for the requested funballer"""
     st.subheader(f"Remaining Team Picks for {funballer_name}")
 
-    valid_team_selections = FUNBALL_INTERFACE.get_funballer_valid_team_selections(
-        funballer_name=funballer_name,
-    )
-
     remaining_teams_dataframe = DataFrame(
         {
             "Team Name": valid_team_selections.team_names,
             "Remaining Selections": valid_team_selections.remaining_selections,
         },
     )
-    styled_remaining_teams_dataframe = remaining_teams_dataframe.style.apply(
-        remaining_teams_styler,
-        axis=None,
+    styled_remaining_teams_dataframe = style_remaining_teams_dataframe(
+        remaining_teams_dataframe=remaining_teams_dataframe,
     )
     st.dataframe(styled_remaining_teams_dataframe)
@@ -7,8 +7,10 @@ import streamlit as st
 from interface import FunballInterface
 from utilities import get_gameweek_deadline
 from utilities.gameweek import determine_default_gameweek_no
+from utilities.tracing import traced
 
 
+@traced
 def display_gameweek_select_box(default_gameweek_no: int) -> int:
     """
     Display the gameweek select box, allowing the user to select the desired
@@ -21,6 +23,7 @@ def display_gameweek_select_box(default_gameweek_no: int) -> int:
     return gameweek_no
 
 
+@traced
 def display_gameweek_data(
     gameweek_data: Dict,
     gameweek_no: int,
@@ -0,0 +1,74 @@
+import numpy as np
+import streamlit as st
+from pandas import DataFrame
+from pandas.io.formats.style import Styler
+
+from utilities import divider
+from utilities.tracing import traced
+
+# Colours by the number of points awarded for a gameweek's choices (0, 1 or 2),
+# hidden or missing choices are left unstyled
+LEAGUE_POINTS_COLOURS = np.array(
+    [
+        "background-color: red",
+        "background-color: orange",
+        "background-color: green",
+        "",
+    ],
+    dtype=object,
+)
+
+
+def _gameweek_labels(league_choices: DataFrame) -> list:
+    return [f"GW {gameweek_no}" for gameweek_no in league_choices["Team Choice"].columns]
+
+
+@traced
+def create_league_table(league_choices: DataFrame) -> DataFrame:
+    """One cell per funballer & gameweek, showing their team & player choice"""
+    league_table = (
+        league_choices["Team Choice"] + " / " + league_choices["Player Choice"]
+    ).fillna("")
+    league_table.columns = _gameweek_labels(league_choices=league_choices)
+
+    return league_table
+
+
+@traced
+def create_league_css(league_choices: DataFrame) -> DataFrame:
+    """Colour each cell of the league table by the points its choices were awarded"""
+    points_awarded = league_choices["Team Point Awarded"].to_numpy(
+        dtype=float
+    ) + league_choices["Player Point Awarded"].to_numpy(dtype=float)
+    colour_index = np.where(
+        np.isnan(points_awarded),
+        len(LEAGUE_POINTS_COLOURS) - 1,
+        np.nan_to_num(points_awarded),
+    ).astype(int)
+
+    return DataFrame(
+        LEAGUE_POINTS_COLOURS[colour_index],
+        index=league_choices.index,
+        columns=_gameweek_labels(league_choices=league_choices),
+    )
+
+
+@traced
+def style_league_table(league_choices: DataFrame) -> Styler:
+    league_table = create_league_table(league_choices=league_choices)
+    league_css = create_league_css(league_choices=league_choices)
+
+    return league_table.style.apply(lambda _: league_css, axis=None)
+
+
+@traced
+def display_league_choices(league_choices: DataFrame) -> None:
+    """Display every funballer's choices, a row per funballer"""
+    st.subheader("League Choices")
+
+    if league_choices.empty:
+        st.write("No choices have been made yet.")
+    else:
+        st.dataframe(style_league_table(league_choices=league_choices))
+
+    divider()
@@ -1,12 +1,11 @@
-from typing import Dict
-
 import pandas as pd
 import streamlit as st
 
-from utilities.models import SortedPlayerData
 from utilities.team_names import get_team_names
+from utilities.tracing import traced
 
 
+@traced
 def display_retrieve_players_form() -> str:
     """Display the retrieve players form, returns the name of the requested team name"""
     retrieve_players_form = st.form(key="retrieve_team_players")
@@ -18,33 +17,20 @@ def display_retrieve_players_form() -> str:
     return team_name
 
 
-def sort_player_data(player_data: Dict) -> SortedPlayerData:
+@traced
+def sort_player_data(player_data: pd.DataFrame) -> pd.DataFrame:
     """Sort player data by goals scored"""
-    player_data = zip(
-        player_data["goals"], player_data["assists"], player_data["player_names"]
-    )
-    player_data_sorted = sorted(player_data, reverse=True)
-
-    goals, assists, player_names = map(list, zip(*player_data_sorted))
-
-    sorted_player_data = SortedPlayerData(
-        goals=goals,
-        assists=assists,
-        player_names=player_names,
+    sorted_player_data = player_data.sort_values(
+        by=["Goals", "Assists", "Player Name"],
+        ascending=False,
+        ignore_index=True,
     )
 
     return sorted_player_data
 
 
-def display_player_data(team_name: str, player_data: SortedPlayerData) -> None:
-    """Constructs a pandas dataframe and displays it"""
+@traced
+def display_player_data(team_name: str, player_data: pd.DataFrame) -> None:
+    """Displays the player dataframe"""
     st.write(f"{team_name} Players:")
-    st.write(
-        pd.DataFrame(
-            {
-                "Player Name": player_data.player_names,
-                "Goals": player_data.goals,
-                "Assists": player_data.assists,
-            }
-        )
-    )
+    st.write(player_data)
@@ -1,49 +1,46 @@
-from typing import Dict
+from math import ceil
+from typing import Dict, List, Optional
 
+import altair as alt
 import pandas as pd
 import streamlit as st
 
-from interface.fantasy_funball import FunballInterface
+from interface import BackgroundJob, StandingsHistory
+from interface.jobs import FAILED, RUNNING, SUCCEEDED
 from utilities.formatting import divider
 from utilities.gameweek import (
     determine_gameweek_no,
-    get_gameweek_deadline,
+    format_deadline,
+    get_gameweek_deadline_datetime,
     has_current_gameweek_deadline_passed,
 )
+from utilities.tracing import traced
 
-FUNBALL_INTERFACE = FunballInterface()
 
-
-def display_gameweek_summary() -> None:
+@traced
+def display_gameweek_summary(gameweek_summary: Dict) -> None:
     """Displays gameweek summary section"""
     st.subheader("Weekly Summary")
 
-    gameweek_summary = FUNBALL_INTERFACE.get_gameweek_summary()
     st.markdown(gameweek_summary["text"])
 
     divider()
 
 
-def create_standings_dataframe(funballer_data: Dict) -> pd.DataFrame:
+@traced
+def create_standings_dataframe(funballer_data: pd.DataFrame) -> pd.DataFrame:
     """Creates standings dataframe"""
-    standings_dataframe = pd.DataFrame(
-        {
-            "Name": funballer_data["funballer_names"],
-            "Team Points": funballer_data["funballer_team_points"],
-            "Player Points": funballer_data["funballer_player_points"],
-            "Total Points": funballer_data["funballer_points"],
-        }
-    ).sort_values(by="Total Points", ascending=False)
+    standings_dataframe = funballer_data.sort_values(by="Total Points", ascending=False)
 
     return standings_dataframe
 
 
-def display_gameweek_info() -> None:
+@traced
+def display_gameweek_info(gameweek_data: List) -> None:
     """
     Determine gameweek no. - if deadline has passed, show info
     for next gameweek
     """
-    gameweek_data = FUNBALL_INTERFACE.get_all_gameweek_data()
     gameweek_no = determine_gameweek_no(all_gameweek_data=gameweek_data)
 
     if gameweek_no == 0:
@@ -56,38 +53,109 @@ def display_gameweek_info() -> None:
     if gameweek_deadline_passed:
         gameweek_no += 1
 
-    gameweek_deadline = get_gameweek_deadline(
+    gameweek_deadline = get_gameweek_deadline_datetime(
         gameweek_no=gameweek_no,
         gameweek_data=gameweek_data,
     )
 
-    if gameweek_no > 38:
+    if gameweek_no > 38 or gameweek_deadline is None:
         st.markdown(f"**Season finished.**")
     else:
         st.markdown(
             f"**Current Gameweek:** {gameweek_no}  \n"
-            f"**Gameweek {gameweek_no} Deadline:** {gameweek_deadline}"
+            f"**Gameweek {gameweek_no} Deadline:** {format_deadline(gameweek_deadline)}"
         )
 
     divider()
 
 
-def display_standings() -> None:
+@traced
+def display_standings(funballer_data: pd.DataFrame) -> None:
     """Displays current standings"""
     st.subheader("Standings")
 
-    funballer_data = FUNBALL_INTERFACE.get_funballer_data()
     standings_dataframe = create_standings_dataframe(funballer_data=funballer_data)
 
     st.write(standings_dataframe)
     divider()
 
 
-def display_update_standings_button() -> None:
-    update_standings_button = st.button(
+@traced
+def create_standings_progression_chart(
+    standings_history: pd.DataFrame, metric: str
+) -> alt.Chart:
+    """Line chart of a standings metric per funballer, over the gameweeks"""
+    y_scale = alt.Scale(reverse=True) if metric == "Rank" else alt.Scale()
+
+    return (
+        alt.Chart(standings_history)
+        .mark_line(point=True)
+        .encode(
+            x=alt.X("Gameweek:O"),
+            y=alt.Y(f"{metric}:Q", scale=y_scale),
+            color=alt.Color("Funballer:N"),
+            tooltip=["Funballer", "Gameweek", metric],
+        )
+    )
+
+
+@traced
+def display_standings_progression(
+    standings_history: Optional[StandingsHistory],
+) -> None:
+    """Displays how the standings have changed over the season"""
+    st.subheader("Standings Progression")
+
+    if standings_history is None:
+        st.write("The standings progression is unavailable, please try again later.")
+    elif standings_history.latest_gameweek_no == 0:
+        st.write("The season hasn't started yet.")
+    else:
+        metric = st.selectbox(
+            label="Show:",
+            options=("Total Points", "Rank", "Team Points", "Player Points"),
+        )
+        st.altair_chart(
+            create_standings_progression_chart(
+                standings_history=standings_history.to_dataframe(),
+                metric=metric,
+            ),
+            use_container_width=True,
+        )
+
+    divider()
+
+
+@traced
+def display_update_standings_button(update_standings_job: BackgroundJob) -> None:
+    """
+    Button triggering the shared update standings job, along with the status of
+    the job. The update runs in the background, so the page never waits on it.
+    """
+    # Button callbacks run before the rerun, so a click is already reflected here
+    status = update_standings_job.status()
+
+    st.button(
         label="Update Standings",
-        on_click=FUNBALL_INTERFACE.update_standings(),
+        on_click=update_standings_job.trigger,
+        disabled=status.state == RUNNING or status.cooldown_remaining > 0,
     )
 
-    if update_standings_button:
-        st.markdown("Standings updated! :white_check_mark:")
+    if status.state == RUNNING:
+        st.markdown(
+            f"Updating standings, started at {format_deadline(status.started_at)}. "
+            "Refresh the page to see the latest standings once finished."
+        )
+    elif status.state == SUCCEEDED:
+        st.markdown(
+            f"Standings updated at {format_deadline(status.finished_at)}! "
+            ":white_check_mark:"
+        )
+    elif status.state == FAILED:
+        st.error(f"Standings update failed: {status.error}")
+
+    if status.state != RUNNING and status.cooldown_remaining > 0:
+        st.caption(
+            f"Standings can be updated again in {ceil(status.cooldown_remaining / 60)} "
+            "minute(s)."
+        )
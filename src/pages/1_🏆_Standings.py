@@ -1,11 +1,20 @@
 import streamlit as st
 
+from interface import (
+    get_background_refresher,
+    get_funball_interface,
+    get_update_standings_job,
+)
 from logic.standings import (
     display_gameweek_info,
     display_gameweek_summary,
     display_standings,
+    display_standings_progression,
     display_update_standings_button,
 )
+from utilities.gameweek import determine_gameweek_no
+from utilities.loader import DataLoader
+from utilities.tracing import trace_script_run
 
 st.set_page_config(
     page_title="Standings",
@@ -20,14 +29,32 @@ def standings_app() -> None:
     Displays info on current gameweek and standings.
 
     """
-    display_gameweek_info()
+    funball_interface = get_funball_interface()
+    get_background_refresher()
+
+    loader = DataLoader()
+    loader.add("gameweek_data", funball_interface.get_all_gameweek_data)
+    loader.add("gameweek_summary", funball_interface.get_gameweek_summary)
+    loader.add("funballer_data", funball_interface.get_funballer_dataframe)
+    data = loader.load()
+
+    display_gameweek_info(gameweek_data=data["gameweek_data"])
+
+    display_gameweek_summary(gameweek_summary=data["gameweek_summary"])
 
-    display_gameweek_summary()
+    display_standings(funballer_data=data["funballer_data"])
 
-    display_standings()
+    # Needs every funballer's choices, so is only loaded once the standings are shown
+    standings_history = funball_interface.get_standings_history(
+        current_gameweek_no=determine_gameweek_no(
+            all_gameweek_data=data["gameweek_data"]
+        ),
+    )
+    display_standings_progression(standings_history=standings_history)
 
-    display_update_standings_button()
+    display_update_standings_button(update_standings_job=get_update_standings_job())
 
 
 if __name__ == "__main__":
-    standings_app()
+    with trace_script_run("Standings"):
+        standings_app()
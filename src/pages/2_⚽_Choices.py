@@ -1,6 +1,6 @@
 import streamlit as st
 
-from interface import FunballInterface
+from interface import get_background_refresher, get_funball_interface
 from logic.choices import (
     create_choices_dataframe,
     create_submit_choices_form,
@@ -9,6 +9,8 @@ from logic.choices import (
     display_funballers_remaining_picks,
 )
 from utilities.gameweek import determine_default_gameweek_no
+from utilities.loader import DataLoader
+from utilities.tracing import trace_script_run
 
 st.set_page_config(
     page_title="Choices",
@@ -21,35 +23,66 @@ def choices_app():
     st.subheader("View Choices")
 
     funballer_name = display_choices_form()
-    funball_interface = FunballInterface()
+    funball_interface = get_funball_interface()
+    get_background_refresher()
 
-    all_gameweek_data = funball_interface.get_all_gameweek_data()
-
-    gameweek_no_limit = determine_default_gameweek_no(
-        all_gameweek_data=all_gameweek_data,
+    loader = DataLoader()
+    loader.add("all_gameweek_data", funball_interface.get_all_gameweek_data)
+    loader.add(
+        "gameweek_no_limit",
+        lambda all_gameweek_data: determine_default_gameweek_no(
+            all_gameweek_data=all_gameweek_data,
+        ),
+        depends_on=["all_gameweek_data"],
     )
-
-    choices_data = funball_interface.get_choices_data(
-        funballer_name=funballer_name,
-        gameweek_no_limit=gameweek_no_limit,
+    loader.add(
+        "choices_data",
+        lambda gameweek_no_limit: funball_interface.get_choices_dataframe(
+            funballer_name=funballer_name,
+            gameweek_no_limit=gameweek_no_limit,
+        ),
+        depends_on=["gameweek_no_limit"],
+    )
+    loader.add("player_catalog", funball_interface.get_player_catalog)
+    # Loaded once the choices are, which stop the page for unknown funballers
+    loader.add(
+        "valid_team_selections",
+        lambda choices_data: funball_interface.get_funballer_valid_team_selections(
+            funballer_name=funballer_name,
+        ),
+        depends_on=["choices_data"],
     )
+    data = loader.load()
 
     choices_dataframe = create_choices_dataframe(
         funballer_name=funballer_name,
-        choices_data=choices_data,
+        choices_data=data["choices_data"],
     )
 
     display_choices_dataframe(choices_dataframe=choices_dataframe)
 
     submit_choice_data = create_submit_choices_form(
-        default_gameweek_no=gameweek_no_limit,
+        default_gameweek_no=data["gameweek_no_limit"],
+        player_catalog=data["player_catalog"],
     )
 
+    valid_team_selections = data["valid_team_selections"]
     if submit_choice_data.submit:
-        funball_interface.post_choice(payload=submit_choice_data)
+        funball_interface.post_choice(
+            payload=submit_choice_data, funballer_name=funballer_name
+        )
 
-    display_funballers_remaining_picks(funballer_name=funballer_name)
+        # The submitted choice may have used up one of the remaining team picks
+        valid_team_selections = funball_interface.get_funballer_valid_team_selections(
+            funballer_name=funballer_name,
+        )
+
+    display_funballers_remaining_picks(
+        funballer_name=funballer_name,
+        valid_team_selections=valid_team_selections,
+    )
 
 
 if __name__ == "__main__":
-    choices_app()
+    with trace_script_run("Choices"):
+        choices_app()
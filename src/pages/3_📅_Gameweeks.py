@@ -2,10 +2,15 @@ from json import JSONDecodeError
 
 import streamlit as st
 
-from interface import FunballInterface
+from interface import get_background_refresher, get_funball_interface
 from logic.gameweeks import display_gameweek_data, display_gameweek_select_box
-from utilities import get_gameweek_deadline
-from utilities.gameweek import determine_default_gameweek_no
+from utilities.gameweek import (
+    determine_default_gameweek_no,
+    format_deadline,
+    get_gameweek_deadline_datetime,
+)
+from utilities.loader import DataLoader
+from utilities.tracing import trace_script_run
 
 st.set_page_config(
     page_title="Gameweeks",
@@ -17,12 +22,22 @@ st.set_page_config(
 def gameweeks_app():
     st.subheader("Gameweeks")
 
-    funball_interface = FunballInterface()
-    all_gameweek_data = funball_interface.get_all_gameweek_data()
-
-    default_gameweek_no = determine_default_gameweek_no(
-        all_gameweek_data=all_gameweek_data,
+    funball_interface = get_funball_interface()
+    get_background_refresher()
+
+    loader = DataLoader()
+    loader.add("all_gameweek_data", funball_interface.get_all_gameweek_data)
+    loader.add(
+        "default_gameweek_no",
+        lambda all_gameweek_data: determine_default_gameweek_no(
+            all_gameweek_data=all_gameweek_data,
+        ),
+        depends_on=["all_gameweek_data"],
     )
+    data = loader.load()
+
+    all_gameweek_data = data["all_gameweek_data"]
+    default_gameweek_no = data["default_gameweek_no"]
 
     # Revert back to gameweek 38 if season is over (indicated by gameweek 39).
     if default_gameweek_no == 39:
@@ -31,12 +46,12 @@ def gameweeks_app():
     gameweek_no = display_gameweek_select_box(default_gameweek_no=default_gameweek_no)
 
     try:
-        gameweek_deadline = get_gameweek_deadline(
+        gameweek_deadline = get_gameweek_deadline_datetime(
             gameweek_no=gameweek_no,
             gameweek_data=all_gameweek_data,
         )
 
-        if gameweek_deadline == "Season finished.":
+        if gameweek_deadline is None:
             st.markdown(f"**Season finished.**")
 
         else:
@@ -48,7 +63,10 @@ def gameweeks_app():
                 gameweek_no=gameweek_no,
             )
 
-            st.markdown(f"**Gameweek {gameweek_no} Deadline:** {gameweek_deadline}")
+            st.markdown(
+                f"**Gameweek {gameweek_no} Deadline:** "
+                f"{format_deadline(gameweek_deadline)}"
+            )
 
     except (JSONDecodeError, TypeError):
         st.error("Please enter a gameweek number, valid range: 1-38")
@@ -56,4 +74,5 @@ def gameweeks_app():
 
 
 if __name__ == "__main__":
-    gameweeks_app()
+    with trace_script_run("Gameweeks"):
+        gameweeks_app()
@@ -1,11 +1,13 @@
 import streamlit as st
 
-from interface import FunballInterface
+from interface import get_background_refresher, get_funball_interface
 from logic.players import (
     display_player_data,
     display_retrieve_players_form,
     sort_player_data,
 )
+from utilities.loader import DataLoader
+from utilities.tracing import trace_script_run
 
 st.set_page_config(
     page_title="Players",
@@ -19,13 +21,23 @@ def players_app():
 
     team_name = display_retrieve_players_form()
 
-    funball_interface = FunballInterface()
-    player_data = funball_interface.get_all_players_from_team(team_name=team_name)
+    funball_interface = get_funball_interface()
+    get_background_refresher()
 
-    sorted_player_data = sort_player_data(player_data=player_data)
+    loader = DataLoader()
+    loader.add(
+        "player_data",
+        lambda: funball_interface.get_all_players_from_team_dataframe(
+            team_name=team_name
+        ),
+    )
+    data = loader.load()
+
+    sorted_player_data = sort_player_data(player_data=data["player_data"])
 
     display_player_data(team_name=team_name, player_data=sorted_player_data)
 
 
 if __name__ == "__main__":
-    players_app()
+    with trace_script_run("Players"):
+        players_app()
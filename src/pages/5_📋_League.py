@@ -0,0 +1,48 @@
+import streamlit as st
+
+from interface import get_background_refresher, get_funball_interface
+from logic.league import display_league_choices
+from utilities.gameweek import determine_default_gameweek_no
+from utilities.loader import DataLoader
+from utilities.tracing import trace_script_run
+
+st.set_page_config(
+    page_title="League",
+    page_icon=":clipboard:",
+    initial_sidebar_state="expanded",
+)
+
+
+def league_app():
+    funball_interface = get_funball_interface()
+    get_background_refresher()
+
+    loader = DataLoader()
+    loader.add("all_gameweek_data", funball_interface.get_all_gameweek_data)
+    loader.add(
+        "gameweek_no_limit",
+        lambda all_gameweek_data: determine_default_gameweek_no(
+            all_gameweek_data=all_gameweek_data,
+        ),
+        depends_on=["all_gameweek_data"],
+    )
+    loader.add(
+        "league_choices",
+        lambda gameweek_no_limit: funball_interface.get_league_choices_dataframe(
+            gameweek_no_limit=gameweek_no_limit,
+        ),
+        depends_on=["gameweek_no_limit"],
+    )
+    data = loader.load()
+
+    display_league_choices(league_choices=data["league_choices"])
+
+    st.write(
+        "Future choices are only shown for the funballer whose pin was entered on "
+        "the Choices page."
+    )
+
+
+if __name__ == "__main__":
+    with trace_script_run("League"):
+        league_app()
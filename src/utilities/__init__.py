@@ -1,13 +1,25 @@
 from .formatting import divider
 from .gameweek import (
+    GameweekCalendar,
     determine_gameweek_no,
+    format_deadline,
+    get_gameweek_calendar,
     get_gameweek_deadline,
+    get_gameweek_deadline_datetime,
     has_current_gameweek_deadline_passed,
 )
 from .models import (
+    CacheStats,
     ChoicesData,
     ColourMap,
+    Interaction,
+    JobStatus,
+    NodeTiming,
+    RefreshRun,
+    SingleFlightStats,
+    Snapshot,
     SortedPlayerData,
+    Span,
     SubmitChoiceData,
     ValidTeamSelections,
 )
@@ -17,12 +29,23 @@ __all__ = [
     divider,
     determine_gameweek_no,
     get_gameweek_deadline,
-    get_gameweek_deadline,
+    get_gameweek_deadline_datetime,
+    format_deadline,
     has_current_gameweek_deadline_passed,
+    GameweekCalendar,
+    get_gameweek_calendar,
     get_team_names,
     ChoicesData,
     SubmitChoiceData,
     ValidTeamSelections,
     SortedPlayerData,
     ColourMap,
+    CacheStats,
+    NodeTiming,
+    Snapshot,
+    RefreshRun,
+    JobStatus,
+    SingleFlightStats,
+    Span,
+    Interaction,
 ]
@@ -1,106 +1,171 @@
+from bisect import bisect_left, bisect_right
 from datetime import datetime
-from typing import List
+from typing import List, Optional, Tuple
 
 import pytz
 
+DEADLINE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+UTC = pytz.utc
+LONDON = pytz.timezone("Europe/London")
+
+TIMEZONES = {
+    "utc": UTC,
+    "bst": LONDON,
+}
+
 
 def _localise_datetime(datetime: datetime, timezone: str) -> datetime:
     """
     Localise datetime into specified timezone. Currently supports
     "utc" and "bst".
     """
-    if timezone == "utc":
-        tz = pytz.timezone("utc")
-    elif timezone == "bst":
-        tz = pytz.timezone("Europe/London")
-    else:
+    if timezone not in TIMEZONES:
         raise Exception("Timezone not supported.")
 
-    localised_datetime = tz.localize(datetime)
+    localised_datetime = TIMEZONES[timezone].localize(datetime)
 
     return localised_datetime
 
 
-def determine_gameweek_no(all_gameweek_data: List) -> int:
-    """Uses local time to determine what gameweek number we are in"""
-    # TODO: Can be improved, currently runs through all gameweeks
-    current_datetime = _localise_datetime(datetime=datetime.now(), timezone="utc")
-
-    gameweek_no = 0  # Season hasn't started yet
-    for gameweek in all_gameweek_data:
-        # Convert deadline str to datetime
-        deadline_datetime = datetime.strptime(gameweek["deadline"], "%Y-%m-%dT%H:%M:%SZ")
-        localised_deadline_datetime = _localise_datetime(
-            datetime=deadline_datetime,
-            timezone="utc",
+def format_deadline(deadline: datetime) -> str:
+    """
+    Format a timezone aware deadline in UK time, to be displayed in the front end
+    in the format: Sat 1 January 2022 @ 00:00:00
+    """
+    return datetime.strftime(deadline.astimezone(LONDON), "%a %-d %B %Y @ %H:%M:%S")
+
+
+def _current_datetime() -> datetime:
+    """Current time in UTC, whatever the host's timezone"""
+    return datetime.now(tz=UTC)
+
+
+class GameweekCalendar:
+    """
+    Gameweek deadlines parsed once into timezone aware datetimes, held in sorted
+    order so that deadline lookups are bisects rather than scans over every
+    gameweek
+    """
+
+    def __init__(self, all_gameweek_data: List):
+        gameweeks = sorted(
+            (
+                _localise_datetime(
+                    datetime=datetime.strptime(gameweek["deadline"], DEADLINE_FORMAT),
+                    timezone="utc",
+                ),
+                gameweek["gameweek_no"],
+            )
+            for gameweek in all_gameweek_data
         )
 
-        if current_datetime > localised_deadline_datetime:
-            gameweek_no = gameweek["gameweek_no"]
+        self.deadlines = [deadline for deadline, _ in gameweeks]
+        self.gameweek_nos = [gameweek_no for _, gameweek_no in gameweeks]
+        self._deadlines_by_gameweek_no = dict(zip(self.gameweek_nos, self.deadlines))
 
-    return gameweek_no
+    def current_gameweek_no(self, now: datetime = None) -> int:
+        """
+        The gameweek with the latest deadline before now, 0 if the season hasn't
+        started yet
+        """
+        now = now or _current_datetime()
 
+        deadlines_passed = bisect_left(self.deadlines, now)
+        if deadlines_passed == 0:
+            return 0
 
-def get_gameweek_deadline(gameweek_no: int, gameweek_data: List) -> str:
-    """Gets the deadline for a specific gameweek"""
+        return self.gameweek_nos[deadlines_passed - 1]
+
+    def next_deadline(self, now: datetime = None) -> Optional[Tuple[int, datetime]]:
+        """(gameweek no, deadline) of the next deadline, None once all have passed"""
+        now = now or _current_datetime()
+
+        index = bisect_right(self.deadlines, now)
+        if index == len(self.deadlines):
+            return None
+
+        return self.gameweek_nos[index], self.deadlines[index]
+
+    def deadline_for(self, gameweek_no: int) -> Optional[datetime]:
+        """Deadline of the gameweek, None if there is no such gameweek"""
+        return self._deadlines_by_gameweek_no.get(gameweek_no)
+
+    def has_deadline_passed(self, gameweek_no: int, now: datetime = None) -> bool:
+        """Whether the gameweek's deadline has passed, False for unknown gameweeks"""
+        deadline = self.deadline_for(gameweek_no)
+        if deadline is None:
+            return False
+
+        return (now or _current_datetime()) > deadline
+
+
+_CALENDAR_CACHE = (None, None)
+
+
+def get_gameweek_calendar(all_gameweek_data: List) -> GameweekCalendar:
+    """
+    Build the calendar for the gameweek data, reusing the last calendar built if
+    it is for the same gameweek data. The interface shares one gameweek data list
+    across sessions until it changes, so the calendar is built once per refresh.
+    """
+    global _CALENDAR_CACHE
+
+    cached_gameweek_data, calendar = _CALENDAR_CACHE
+    if cached_gameweek_data is not all_gameweek_data:
+        calendar = GameweekCalendar(all_gameweek_data=all_gameweek_data)
+        _CALENDAR_CACHE = (all_gameweek_data, calendar)
+
+    return calendar
+
+
+def determine_gameweek_no(all_gameweek_data: List) -> int:
+    """Uses local time to determine what gameweek number we are in"""
+    calendar = get_gameweek_calendar(all_gameweek_data=all_gameweek_data)
+
+    return calendar.current_gameweek_no()
+
+
+def get_gameweek_deadline_datetime(
+    gameweek_no: int,
+    gameweek_data: List,
+) -> Optional[datetime]:
+    """
+    Gets the timezone aware (UTC) deadline for a specific gameweek, None if the
+    season has finished
+    """
     # Season not started yet
     if gameweek_no == 0:
         gameweek_no += 1
 
-    try:
-        gameweek_deadline_utc = next(
-            gameweek["deadline"]
-            for gameweek in gameweek_data
-            if gameweek["gameweek_no"] == gameweek_no
-        )
-    except StopIteration:
-        return "Season finished."
+    calendar = get_gameweek_calendar(all_gameweek_data=gameweek_data)
+
+    return calendar.deadline_for(gameweek_no)
 
-    # Convert deadline from UTC to BST
-    gameweek_deadline_datetime = datetime.strptime(
-        gameweek_deadline_utc, "%Y-%m-%dT%H:%M:%SZ"
-    )
-    localised_gameweek_deadline = _localise_datetime(
-        datetime=gameweek_deadline_datetime, timezone="bst"
-    )
 
-    # Convert datetime obj back to str, formatted to be displayed in front end
-    # in the format: Sat 1 January 2022 @ 00:00:00
-    gameweek_deadline = datetime.strftime(
-        pytz.timezone("Europe/London").fromutc(localised_gameweek_deadline),
-        "%a %-d %B %Y @ %H:%M:%S",
+def get_gameweek_deadline(gameweek_no: int, gameweek_data: List) -> str:
+    """Gets the deadline for a specific gameweek, formatted for display"""
+    gameweek_deadline = get_gameweek_deadline_datetime(
+        gameweek_no=gameweek_no,
+        gameweek_data=gameweek_data,
     )
+    if gameweek_deadline is None:
+        return "Season finished."
 
-    return gameweek_deadline
+    return format_deadline(deadline=gameweek_deadline)
 
 
 def has_current_gameweek_deadline_passed(
     gameweek_no: int,
     gameweek_data: List,
 ) -> bool:
-    current_gameweek_deadline = get_gameweek_deadline(
-        gameweek_no=gameweek_no,
-        gameweek_data=gameweek_data,
-    )
-
-    current_datetime = _localise_datetime(
-        datetime=datetime.now(),
-        timezone="utc",
-    )
-
-    gameweek_deadline = datetime.strptime(
-        current_gameweek_deadline,
-        "%a %d %B %Y @ %H:%M:%S",
-    )
-    gameweek_deadline_datetime = _localise_datetime(
-        datetime=gameweek_deadline,
-        timezone="utc",
-    )
+    # Season not started yet
+    if gameweek_no == 0:
+        gameweek_no += 1
 
-    if current_datetime > gameweek_deadline_datetime:
-        return True
+    calendar = get_gameweek_calendar(all_gameweek_data=gameweek_data)
 
-    return False
+    return calendar.has_deadline_passed(gameweek_no=gameweek_no)
 
 
 def determine_default_gameweek_no(all_gameweek_data: List) -> int:
@@ -0,0 +1,183 @@
+import logging
+import os
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List
+
+from utilities.models import NodeTiming
+from utilities.script_context import with_script_run_ctx
+from utilities.tracing import span, traced, with_trace_context
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class DataLoader:
+    """
+    Resolves the datasets a page declares before rendering starts. Each dataset
+    is loaded by a function whose keyword arguments are the datasets it depends
+    on. Datasets are loaded as soon as their dependencies are, on a thread pool
+    of the load's own sized to the widest level of the graph (at most
+    max_workers, FANTASY_FUNBALL_LOADER_WORKERS by default). Graphs that can't
+    load anything concurrently are loaded on the calling thread.
+    """
+
+    def __init__(self, max_workers: int = None):
+        if max_workers is None:
+            max_workers = int(
+                os.environ.get("FANTASY_FUNBALL_LOADER_WORKERS") or DEFAULT_MAX_WORKERS
+            )
+
+        self.max_workers = max_workers
+        self.nodes = {}
+        self.timings = {}
+
+    def add(
+        self,
+        name: str,
+        load: Callable[..., Any],
+        depends_on: Iterable[str] = (),
+    ) -> None:
+        """Declare a dataset, loaded by calling load(**{dependency: data})"""
+        if name in self.nodes:
+            raise ValueError(f"Dataset '{name}' has already been declared.")
+
+        self.nodes[name] = (load, tuple(depends_on))
+
+    def _check_dependencies(self) -> None:
+        """Ensure every dependency is declared & there are no cycles"""
+        for name, (_, depends_on) in self.nodes.items():
+            for dependency in depends_on:
+                if dependency not in self.nodes:
+                    raise ValueError(
+                        f"Dataset '{name}' depends on undeclared dataset "
+                        f"'{dependency}'."
+                    )
+
+        resolved = set()
+        while len(resolved) < len(self.nodes):
+            resolvable = {
+                name
+                for name, (_, depends_on) in self.nodes.items()
+                if name not in resolved and resolved.issuperset(depends_on)
+            }
+            if not resolvable:
+                raise ValueError("Dataset dependencies contain a cycle.")
+
+            resolved |= resolvable
+
+    def width(self) -> int:
+        """The most datasets on one level of the graph, i.e. that can load at once"""
+        levels = {}
+        while len(levels) < len(self.nodes):
+            for name, (_, depends_on) in self.nodes.items():
+                if name not in levels and all(dep in levels for dep in depends_on):
+                    levels[name] = 1 + max(
+                        (levels[dependency] for dependency in depends_on), default=-1
+                    )
+
+        return max(Counter(levels.values()).values(), default=0)
+
+    @traced(category="loader")
+    def load(self) -> Dict[str, Any]:
+        """
+        Load every declared dataset, returning them keyed by name. The first
+        exception raised by a load function is re-raised.
+        """
+        self._check_dependencies()
+
+        load_started = time.perf_counter()
+        results = {}
+        pending = dict(self.nodes)
+        running = {}
+
+        def timed_load(name: str, load: Callable, kwargs: Dict) -> Any:
+            started = time.perf_counter() - load_started
+            with span(f"load {name}", category="loader"):
+                result = load(**kwargs)
+            finished = time.perf_counter() - load_started
+
+            self.timings[name] = NodeTiming(
+                name=name,
+                started=started,
+                finished=finished,
+                duration=finished - started,
+            )
+
+            return result
+
+        max_workers = min(self.width(), self.max_workers)
+        if max_workers <= 1:
+            while pending:
+                name = next(
+                    name
+                    for name, (_, depends_on) in pending.items()
+                    if all(dependency in results for dependency in depends_on)
+                )
+                load, depends_on = pending.pop(name)
+                kwargs = {dependency: results[dependency] for dependency in depends_on}
+                results[name] = timed_load(name, load, kwargs)
+        else:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="funball-loader"
+            )
+            try:
+                while pending or running:
+                    ready = [
+                        name
+                        for name, (_, depends_on) in pending.items()
+                        if all(dependency in results for dependency in depends_on)
+                    ]
+                    for name in ready:
+                        load, depends_on = pending.pop(name)
+                        kwargs = {
+                            dependency: results[dependency] for dependency in depends_on
+                        }
+
+                        future = executor.submit(
+                            with_script_run_ctx(with_trace_context(timed_load)),
+                            name,
+                            load,
+                            kwargs,
+                        )
+                        running[future] = name
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results[running.pop(future)] = future.result()
+            finally:
+                # Loads still running after a failure are left to finish unwaited
+                executor.shutdown(wait=False)
+
+        logger.info(
+            "Loaded %s in %.3fs, critical path: %s",
+            ", ".join(self.nodes),
+            time.perf_counter() - load_started,
+            " -> ".join(self.critical_path()),
+        )
+
+        return results
+
+    def critical_path(self) -> List[str]:
+        """
+        The chain of datasets that determined the total load time, found by
+        walking back from the last dataset to finish through the dependency
+        that finished last
+        """
+        if not self.timings:
+            return []
+
+        path = []
+        name = max(self.timings, key=lambda node: self.timings[node].finished)
+        while name is not None:
+            path.append(name)
+            _, depends_on = self.nodes[name]
+            name = max(
+                depends_on,
+                key=lambda node: self.timings[node].finished,
+                default=None,
+            )
+
+        return path[::-1]
@@ -39,3 +39,93 @@ SubmitChoiceData = namedtuple(
         "submit",
     ],
 )
+
+CacheStats = namedtuple(
+    "CacheStats",
+    [
+        "hits",
+        "misses",
+        "evictions",
+        "revalidations",
+        "entries",
+    ],
+)
+
+NodeTiming = namedtuple(
+    "NodeTiming",
+    [
+        "name",
+        "started",
+        "finished",
+        "duration",
+    ],
+)
+
+Snapshot = namedtuple(
+    "Snapshot",
+    [
+        "content",
+        "etag",
+        "last_modified",
+        "fetched_at",
+    ],
+)
+
+RefreshRun = namedtuple(
+    "RefreshRun",
+    [
+        "reason",
+        "started_at",
+        "duration",
+        "refreshed",
+        "failed",
+    ],
+)
+
+JobStatus = namedtuple(
+    "JobStatus",
+    [
+        "state",
+        "started_at",
+        "finished_at",
+        "error",
+        "cooldown_remaining",
+    ],
+)
+
+SingleFlightStats = namedtuple(
+    "SingleFlightStats",
+    [
+        "executions",
+        "coalesced",
+        "in_flight",
+    ],
+)
+
+Span = namedtuple(
+    "Span",
+    [
+        "span_id",
+        "parent_id",
+        "name",
+        "category",
+        "thread_id",
+        "thread_name",
+        "started",
+        "duration",
+        "args",
+    ],
+)
+
+Interaction = namedtuple(
+    "Interaction",
+    [
+        "method",
+        "endpoint",
+        "data",
+        "status_code",
+        "headers",
+        "content",
+        "elapsed",
+    ],
+)
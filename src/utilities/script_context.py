@@ -0,0 +1,19 @@
+import functools
+from typing import Callable
+
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+
+def with_script_run_ctx(func: Callable) -> Callable:
+    """
+    Wrap a callable so that it runs with the streamlit script run context of the
+    thread that wrapped it. Lets worker threads use st.* and the session state.
+    """
+    ctx = get_script_run_ctx()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        add_script_run_ctx(ctx=ctx)
+        return func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,275 @@
+import functools
+import itertools
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import streamlit as st
+
+from utilities.models import Span
+
+logger = logging.getLogger(__name__)
+
+TRACE_QUERY_PARAM = "trace"
+
+DEFAULT_TRACE_DIR = os.path.join(tempfile.gettempdir(), "fantasy_funball_traces")
+# Older traces are deleted once there are more than this many in the trace dir
+DEFAULT_MAX_TRACES = 20
+
+# The tracer of the script run in progress & the innermost open span, carried
+# onto worker threads by with_trace_context
+_TRACER = ContextVar("funball_tracer", default=None)
+_PARENT_SPAN_ID = ContextVar("funball_parent_span_id", default=None)
+
+
+class Tracer:
+    """
+    Records the spans of a single script run. Spans nest through context
+    variables, so spans opened on worker threads (see with_trace_context) are
+    children of the span that handed them the work.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._spans = []
+        self._started = time.perf_counter()
+
+    def _record(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    @property
+    def spans(self) -> List[Span]:
+        """Every finished span, in the order they started"""
+        with self._lock:
+            return sorted(self._spans, key=lambda span: span.started)
+
+    def children(self, span_id: Optional[int]) -> List[Span]:
+        """The spans directly nested in a span, or the root spans for None"""
+        return [span for span in self.spans if span.parent_id == span_id]
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """The spans as Chrome trace events, viewable in Perfetto / chrome://tracing"""
+        pid = os.getpid()
+        spans = self.spans
+
+        events = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "args": {"name": f"Fantasy Funball: {self.name}"},
+            }
+        ]
+        thread_names = {span.thread_id: span.thread_name for span in spans}
+        for thread_id, thread_name in thread_names.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": thread_id,
+                    "args": {"name": thread_name},
+                }
+            )
+
+        for span in spans:
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": round(span.started * 1e6, 3),
+                    "dur": round(span.duration * 1e6, 3),
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": {
+                        "span_id": span.span_id,
+                        "parent_id": span.parent_id,
+                        **span.args,
+                    },
+                }
+            )
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dumps(self) -> str:
+        return json.dumps(self.to_chrome_trace(), default=str)
+
+
+def get_tracer() -> Optional[Tracer]:
+    """The tracer of the script run in progress, if it is being traced"""
+    return _TRACER.get()
+
+
+@contextmanager
+def span(name: str, category: str = "app", **args: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Time the enclosed block as a span of the current trace, a no-op when the
+    script run isn't being traced. Yields the span's args, so details only known
+    inside the block can be added to them.
+    """
+    tracer = _TRACER.get()
+    if tracer is None:
+        yield args
+        return
+
+    span_id = next(tracer._ids)
+    parent_id = _PARENT_SPAN_ID.get()
+    token = _PARENT_SPAN_ID.set(span_id)
+    thread = threading.current_thread()
+    started = time.perf_counter()
+
+    try:
+        yield args
+    except BaseException as exception:
+        args["error"] = type(exception).__name__
+        raise
+    finally:
+        finished = time.perf_counter()
+        _PARENT_SPAN_ID.reset(token)
+
+        tracer._record(
+            Span(
+                span_id=span_id,
+                parent_id=parent_id,
+                name=name,
+                category=category,
+                thread_id=thread.ident,
+                thread_name=thread.name,
+                started=started - tracer._started,
+                duration=finished - started,
+                args=args,
+            )
+        )
+
+
+def traced(func: Callable = None, *, category: str = "logic") -> Callable:
+    """Decorator recording each call of a function as a span"""
+    if func is None:
+        return functools.partial(traced, category=category)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _TRACER.get() is None:
+            return func(*args, **kwargs)
+
+        with span(func.__qualname__, category=category):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def with_trace_context(func: Callable) -> Callable:
+    """
+    Wrap a callable so that it runs in the trace of the thread that wrapped it,
+    nested in that thread's open span. Lets spans follow work onto thread pools.
+    """
+    context = copy_context()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        # A context can only be entered by one thread at a time
+        return context.copy().run(func, *args, **kwargs)
+
+    return wrapper
+
+
+def tracing_enabled() -> bool:
+    """
+    Whether script runs should be traced: FANTASY_FUNBALL_TRACE is set, or the
+    page was opened with ?trace=1 & FANTASY_FUNBALL_TRACE_QUERY allows visitors
+    to request traces
+    """
+    if os.environ.get("FANTASY_FUNBALL_TRACE", "0") != "0":
+        return True
+
+    if os.environ.get("FANTASY_FUNBALL_TRACE_QUERY", "0") == "0":
+        return False
+
+    values = st.experimental_get_query_params().get(TRACE_QUERY_PARAM, ["0"])
+
+    return values[0].lower() not in ("0", "false")
+
+
+def _slug(name: str) -> str:
+    return re.sub(r"\W+", "_", name).strip("_").lower()
+
+
+def trace_path(name: str) -> str:
+    """Where a trace of the named script run is written"""
+    trace_dir = os.environ.get("FANTASY_FUNBALL_TRACE_DIR") or DEFAULT_TRACE_DIR
+    os.makedirs(trace_dir, exist_ok=True)
+
+    return os.path.join(trace_dir, f"{_slug(name)}-{datetime.now():%Y%m%dT%H%M%S%f}.json")
+
+
+def prune_traces(trace_dir: str, max_traces: int) -> None:
+    """Delete all but the max_traces most recently written traces in trace_dir"""
+    traces = sorted(
+        (entry for entry in os.scandir(trace_dir) if entry.name.endswith(".json")),
+        key=lambda entry: entry.stat().st_mtime,
+        reverse=True,
+    )
+    for entry in traces[max_traces:]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            logger.warning("Unable to delete trace %s", entry.path)
+
+
+@contextmanager
+def trace_script_run(name: str) -> Iterator[Optional[Tracer]]:
+    """
+    Trace the enclosed script run when tracing is enabled, yielding the tracer
+    (or None). The trace is written to FANTASY_FUNBALL_TRACE_DIR once the run
+    finishes, and offered for download in the sidebar. Only the latest
+    FANTASY_FUNBALL_TRACE_KEEP traces (default 20) are kept.
+    """
+    if not tracing_enabled():
+        yield None
+        return
+
+    tracer = Tracer(name=name)
+    token = _TRACER.set(tracer)
+
+    try:
+        with span(name, category="page"):
+            yield tracer
+    finally:
+        _TRACER.reset(token)
+
+        trace = tracer.dumps()
+        try:
+            path = trace_path(name)
+            with open(path, "w") as trace_file:
+                trace_file.write(trace)
+
+            prune_traces(
+                os.path.dirname(path),
+                max_traces=int(
+                    os.environ.get("FANTASY_FUNBALL_TRACE_KEEP") or DEFAULT_MAX_TRACES
+                ),
+            )
+        except OSError:
+            logger.exception("Unable to write trace of %s", name)
+        else:
+            logger.info("Wrote trace of %s to %s", name, path)
+
+    st.sidebar.download_button(
+        "Download trace",
+        data=trace,
+        file_name=f"{_slug(name)}.json",
+        mime="application/json",
+    )
@@ -0,0 +1,89 @@
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+
+class StubBackendHandler(BaseHTTPRequestHandler):
+    """Serves JSON payloads from the stub backend's routes, with ETags"""
+
+    def do_GET(self):
+        backend = self.server.backend
+        path = self.path.split("/fantasy_funball/", 1)[1]
+
+        backend.requests.append((path, dict(self.headers)))
+        time.sleep(backend.delay)
+
+        url = urlsplit(path)
+        if url.path not in backend.routes:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        payload = backend.routes[url.path]
+        query = parse_qs(url.query)
+        if backend.supports_gameweek_windows and "from" in query and "to" in query:
+            first, last = int(query["from"][0]), int(query["to"][0])
+            payload = [
+                record
+                for record in payload
+                if first <= record["gameweek_id__gameweek_no"] <= last
+            ]
+
+        body = json.dumps(payload).encode()
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_):
+        pass
+
+
+class StubBackend:
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+        # Seconds to wait before responding, to simulate a slow backend
+        self.delay = 0
+        # Whether choices can be filtered by the from/to gameweek query parameters
+        self.supports_gameweek_windows = True
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubBackendHandler)
+        self.server.backend = self
+        self.url = f"http://127.0.0.1:{self.server.server_port}/fantasy_funball/"
+
+        self.thread = threading.Thread(
+            target=self.server.serve_forever,
+            kwargs={"poll_interval": 0.01},
+            daemon=True,
+        )
+        self.thread.start()
+
+    def shutdown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub_backend(monkeypatch):
+    backend = StubBackend()
+    monkeypatch.setenv("FANTASY_FUNBALL_URL", backend.url)
+
+    yield backend
+
+    backend.shutdown()
@@ -0,0 +1,95 @@
+from unittest.mock import patch
+
+import pytest
+
+from interface.cache import ResponseCache
+from utilities import CacheStats
+
+CACHE_PATH = "interface.cache"
+
+
+@pytest.mark.parametrize(
+    "endpoint, expected_ttl",
+    [
+        ("gameweek/all/", 100),
+        ("gameweek/1", 50),
+        ("funballer/", 5),
+        ("Spurs/players/", 1),
+    ],
+)
+def test_ttl_for(endpoint, expected_ttl):
+    cache = ResponseCache(
+        default_ttl=1,
+        endpoint_ttls={"gameweek/all/": 100, "gameweek/": 50, "funballer/": 5},
+    )
+
+    assert cache.ttl_for(endpoint) == expected_ttl
+
+
+@patch(f"{CACHE_PATH}.time")
+def test_get_expired_entry(mock_time):
+    cache = ResponseCache(default_ttl=10, endpoint_ttls={})
+
+    mock_time.monotonic.return_value = 0
+    cache.put("funballer/", "data")
+    assert cache.get("funballer/") == (True, "data")
+
+    mock_time.monotonic.return_value = 10
+    assert cache.get("funballer/") == (False, None)
+
+    assert cache.stats() == CacheStats(
+        hits=1, misses=1, evictions=0, revalidations=0, entries=1
+    )
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_entries=2)
+
+    cache.put("a/", 1)
+    cache.put("b/", 2)
+    cache.get("a/")  # "b/" becomes the least recently used entry
+    cache.put("c/", 3)
+
+    assert cache.get("a/") == (True, 1)
+    assert cache.get("b/") == (False, None)
+    assert cache.get("c/") == (True, 3)
+    assert cache.stats().evictions == 1
+
+
+def test_invalidate():
+    cache = ResponseCache()
+
+    cache.put("funballer/", 1)
+    cache.put("funballer/choices/Patrick", 2)
+    cache.put("funballer/choices/valid_teams/Patrick", 3)
+
+    cache.invalidate("funballer/choices/")
+
+    assert cache.get("funballer/") == (True, 1)
+    assert cache.get("funballer/choices/Patrick") == (False, None)
+    assert cache.get("funballer/choices/valid_teams/Patrick") == (False, None)
+
+
+def test_delete():
+    cache = ResponseCache()
+
+    cache.put("funballer/choices/Ben", 1)
+    cache.put("funballer/choices/Bennett", 2)
+
+    cache.delete("funballer/choices/Ben", "funballer/choices/Unknown")
+
+    assert cache.get("funballer/choices/Ben") == (False, None)
+    assert cache.get("funballer/choices/Bennett") == (True, 2)
+
+
+def test_expire():
+    cache = ResponseCache()
+
+    cache.put("funballer/", 1)
+    cache.put("funballer/#standings_history", 2)
+
+    cache.expire("funballer/#")
+
+    assert cache.get("funballer/") == (True, 1)
+    assert cache.get("funballer/#standings_history") == (False, None)
+    assert cache.get_stale("funballer/#standings_history").value == 2
@@ -0,0 +1,228 @@
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from interface import FunballInterface
+from interface.cache import ResponseCache
+from interface.cassette import (
+    Cassette,
+    CassetteMiss,
+    RecordingSession,
+    ReplaySession,
+    create_cassette_session,
+)
+from utilities import Interaction
+
+FUNBALLER_DATA = [
+    {"first_name": "Test", "player_points": 1, "team_points": 2, "points": 3}
+]
+
+
+def create_interaction(content: bytes, **kwargs) -> Interaction:
+    return Interaction(
+        **{
+            "method": "GET",
+            "endpoint": "funballer/",
+            "data": None,
+            "status_code": 200,
+            "headers": {"ETag": '"abc"'},
+            "content": content,
+            "elapsed": 0.25,
+            **kwargs,
+        }
+    )
+
+
+def test_record_and_replay(stub_backend, monkeypatch, tmp_path):
+    stub_backend.routes["funballer/"] = FUNBALLER_DATA
+    cassette_path = str(tmp_path / "cassette.json.gz")
+
+    cassette = Cassette()
+    recording_interface = FunballInterface(
+        session=RecordingSession(cassette=cassette, base_url=stub_backend.url)
+    )
+    recorded_output = recording_interface.get_funballer_dataframe()
+    cassette.save(cassette_path)
+
+    # Replays never reach the backend, whatever its URL
+    monkeypatch.setenv("FANTASY_FUNBALL_URL", "http://replay.invalid/fantasy_funball/")
+    replaying_interface = FunballInterface(
+        session=ReplaySession(
+            cassette=Cassette.load(cassette_path),
+            base_url="http://replay.invalid/fantasy_funball/",
+        )
+    )
+    replayed_output = replaying_interface.get_funballer_dataframe()
+
+    (interaction,) = cassette.interactions
+
+    assert len(stub_backend.requests) == 1
+    assert interaction.endpoint == "funballer/"
+    assert interaction.status_code == 200
+    assert set(interaction.headers) == {"Content-Type", "ETag"}
+    assert replayed_output.equals(recorded_output)
+
+
+def test_recording_drops_conditional_headers(stub_backend):
+    stub_backend.routes["funballer/"] = FUNBALLER_DATA
+
+    cassette = Cassette()
+    funball_interface = FunballInterface(
+        session=RecordingSession(cassette=cassette, base_url=stub_backend.url),
+        cache=ResponseCache(default_ttl=0, endpoint_ttls={}),
+    )
+    funball_interface.get_funballer_data()
+    funball_interface.get_funballer_data()
+
+    (_, first_headers), (_, second_headers) = stub_backend.requests
+
+    assert "If-None-Match" not in second_headers
+    assert [interaction.status_code for interaction in cassette.interactions] == [
+        200,
+        200,
+    ]
+
+
+def test_replay_conditional_request(monkeypatch):
+    monkeypatch.setenv("FANTASY_FUNBALL_URL", "http://replay.invalid/")
+    cassette = Cassette(
+        [
+            create_interaction(
+                b'[{"first_name":"Test","player_points":1,'
+                b'"team_points":2,"points":3}]'
+            )
+        ]
+    )
+    funball_interface = FunballInterface(
+        session=ReplaySession(cassette=cassette, base_url="http://replay.invalid/"),
+        cache=ResponseCache(default_ttl=0, endpoint_ttls={}),
+    )
+
+    first_output = funball_interface.get_funballer_data()
+    second_output = funball_interface.get_funballer_data()
+
+    assert second_output is first_output
+    assert funball_interface.cache_stats().revalidations == 1
+
+
+def test_replay_in_recorded_order():
+    cassette = Cassette(
+        [create_interaction(b"[1]"), create_interaction(b"[2]", status_code=500)]
+    )
+    replay_session = ReplaySession(cassette=cassette, base_url="http://replay/")
+
+    responses = [replay_session.get("http://replay/funballer/") for _ in range(3)]
+
+    assert [response.content for response in responses] == [b"[1]", b"[2]", b"[2]"]
+    assert [response.status_code for response in responses] == [200, 500, 500]
+    assert responses[0].headers["etag"] == '"abc"'
+
+
+def test_replay_matches_form_data():
+    cassette = Cassette(
+        [
+            create_interaction(
+                b'{"detail":"Gameweek deadline has passed."}',
+                method="POST",
+                endpoint="funballer/choices/submit/{pin}",
+                data={"gameweek_no": 1, "team_choice": "Spurs", "player_choice": 7},
+                status_code=400,
+            )
+        ]
+    )
+    replay_session = ReplaySession(cassette=cassette, base_url="http://replay/")
+
+    response = replay_session.post(
+        "http://replay/funballer/choices/submit/1234",
+        data={"player_choice": 7, "team_choice": "Spurs", "gameweek_no": 1},
+    )
+
+    assert response.status_code == 400
+    with pytest.raises(CassetteMiss):
+        replay_session.post(
+            "http://replay/funballer/choices/submit/1234",
+            data={"player_choice": 8, "team_choice": "Spurs", "gameweek_no": 1},
+        )
+
+
+def test_record_redacts_pin():
+    session = Mock()
+    session.post.return_value.status_code = 201
+    session.post.return_value.headers = {}
+    session.post.return_value.content = b""
+    cassette = Cassette()
+    recording_session = RecordingSession(
+        cassette=cassette, base_url="http://record/", session=session
+    )
+
+    recording_session.post(
+        "http://record/funballer/choices/submit/1234", data={"gameweek_no": 1}
+    )
+
+    (interaction,) = cassette.interactions
+    assert interaction.endpoint == "funballer/choices/submit/{pin}"
+    session.post.assert_called_once_with(
+        "http://record/funballer/choices/submit/1234",
+        headers={},
+        data={"gameweek_no": 1},
+    )
+
+
+def test_replay_miss():
+    replay_session = ReplaySession(cassette=Cassette(), base_url="http://replay/")
+
+    with pytest.raises(requests.ConnectionError):
+        replay_session.get("http://replay/funballer/")
+
+
+@pytest.mark.parametrize(
+    "latency_scale, expected_output",
+    [
+        (0, []),
+        (1, [0.25]),
+        (2, [0.5]),
+    ],
+)
+def test_replay_latency(monkeypatch, latency_scale, expected_output):
+    sleeps = []
+    monkeypatch.setattr("interface.cassette.time.sleep", sleeps.append)
+    replay_session = ReplaySession(
+        cassette=Cassette([create_interaction(b"[]")]),
+        base_url="http://replay/",
+        latency_scale=latency_scale,
+    )
+
+    replay_session.get("http://replay/funballer/")
+
+    assert sleeps == expected_output
+
+
+def test_save_and_load_binary_content(tmp_path):
+    cassette_path = str(tmp_path / "cassette.json.gz")
+    interactions = [create_interaction(b"\xff\x00"), create_interaction(b"[]")]
+
+    Cassette(interactions).save(cassette_path)
+
+    assert Cassette.load(cassette_path).interactions == interactions
+
+
+def test_create_cassette_session(monkeypatch, tmp_path):
+    cassette_path = str(tmp_path / "cassette.json.gz")
+    Cassette([create_interaction(b"[]")]).save(cassette_path)
+
+    monkeypatch.delenv("FANTASY_FUNBALL_CASSETTE", raising=False)
+    assert create_cassette_session() is None
+
+    monkeypatch.setenv("FANTASY_FUNBALL_CASSETTE", cassette_path)
+    monkeypatch.setenv("FANTASY_FUNBALL_CASSETTE_MODE", "replay")
+    monkeypatch.setenv("FANTASY_FUNBALL_CASSETTE_LATENCY", "0.5")
+    replay_session = create_cassette_session()
+
+    assert isinstance(replay_session, ReplaySession)
+    assert replay_session.latency_scale == 0.5
+    assert len(replay_session.cassette) == 1
+
+    monkeypatch.setenv("FANTASY_FUNBALL_CASSETTE_MODE", "rewind")
+    with pytest.raises(ValueError):
+        create_cassette_session()
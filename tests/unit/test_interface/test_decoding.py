@@ -0,0 +1,91 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from requests import Response
+
+from interface import FunballInterface
+from interface.decoding import RecordValidationError, decode_records, loads
+from interface.records import ChoiceRecord, GameweekSummaryRecord, PlayerRecord
+
+DECODING_PATH = "interface.decoding"
+INTERFACE_PATH = "interface.fantasy_funball"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_loads(use_orjson):
+    content = '[{"id":1,"name":"Hugo Lloris","team":"Spurs ⚽"}]'.encode()
+
+    if use_orjson:
+        output = loads(content)
+    else:
+        with patch(f"{DECODING_PATH}.orjson", None):
+            output = loads(content)
+
+    assert output == [{"id": 1, "name": "Hugo Lloris", "team": "Spurs ⚽"}]
+
+
+def test_decode_records():
+    content = b'[{"id":1,"name":"Hugo Lloris","goals":0},{"id":2}]'
+
+    output = decode_records(content, schema=PlayerRecord)
+
+    assert output == [{"id": 1, "name": "Hugo Lloris", "goals": 0}, {"id": 2}]
+
+
+def test_decode_single_record():
+    content = b'{"text":"Test Gameweek Summary"}'
+
+    output = decode_records(content, schema=GameweekSummaryRecord, many=False)
+
+    assert output == {"text": "Test Gameweek Summary"}
+
+
+@pytest.mark.parametrize(
+    "content, expected_message",
+    [
+        (b'{"detail":"Not found."}', "Expected a list of PlayerRecord, got dict."),
+        (b"[1]", "Expected a PlayerRecord, got int."),
+        (b'[{"name":"Hugo Lloris"}]', "PlayerRecord is missing the 'id' field."),
+        (
+            b'[{"id":"1"}]',
+            "PlayerRecord field 'id' has unexpected type str.",
+        ),
+        (
+            b'[{"id":true}]',
+            "PlayerRecord field 'id' has unexpected type bool.",
+        ),
+    ],
+)
+def test_decode_records_invalid(content, expected_message):
+    with pytest.raises(RecordValidationError) as exc:
+        decode_records(content, schema=PlayerRecord)
+
+    assert str(exc.value) == expected_message
+
+
+def test_decode_records_optional_field():
+    content = (
+        b'[{"gameweek_id__gameweek_no":1,"team_choice__team_name":"Spurs",'
+        b'"player_choice__first_name":"Harry","player_choice__surname":"Kane",'
+        b'"team_point_awarded":null,"player_point_awarded":true}]'
+    )
+
+    output = decode_records(content, schema=ChoiceRecord)
+
+    assert output[0]["team_point_awarded"] is None
+
+
+@patch(f"{INTERFACE_PATH}.st")
+def test_get_choices_data_invalid_record(mock_streamlit):
+    funball_interface = FunballInterface(session=Mock())
+
+    mock_response = Mock(object=Response)
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_response.content = b'[{"gameweek_id__gameweek_no":"one"}]'
+    funball_interface.session.get.return_value = mock_response
+
+    funball_interface.get_choices_data(funballer_name="Test", gameweek_no_limit=2)
+
+    mock_streamlit.error.assert_called_once_with("Please enter a valid funballer name")
+    mock_streamlit.stop.assert_called_once()
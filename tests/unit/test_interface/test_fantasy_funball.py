@@ -1,26 +1,37 @@
+import json
+import time
 from unittest.mock import Mock, patch
 
 import pytest
 from requests import Response
 
 from interface import FunballInterface
-from utilities import ChoicesData
+from interface.cache import ResponseCache
+from utilities import ChoicesData, SubmitChoiceData
+from utilities.tracing import _TRACER, Tracer
 
 INTERFACE_PATH = "interface.fantasy_funball"
 
 FUNBALL_INTERFACE = FunballInterface()
 
 
-@patch(f"{INTERFACE_PATH}.requests")
+@pytest.fixture(autouse=True)
+def clear_cache():
+    FUNBALL_INTERFACE.cache.clear()
+    FUNBALL_INTERFACE.supports_gameweek_windows = None
+    FUNBALL_INTERFACE._gameweek_windows_checked_at = None
+
+
+@patch.object(FUNBALL_INTERFACE, "session")
 def test_get_single_gameweek_data(mock_request):
     dummy_gameweek_data = (
-        '[{"id":2,"home_team__team_name":"Spurs","away_team__team_name":"Brentford",'
-        '"gameday__date":"2022-01-01","kickoff":"2022-01-01 12:00:00"},{"id":1,'
-        '"home_team__team_name":"Liverpool","away_team__team_name":"Norwich",'
-        '"gameday__date":"2022-01-02","kickoff":"2022-01-02 15:00:00"}]'
+        b'[{"id":2,"home_team__team_name":"Spurs","away_team__team_name":"Brentford",'
+        b'"gameday__date":"2022-01-01","kickoff":"2022-01-01 12:00:00"},{"id":1,'
+        b'"home_team__team_name":"Liverpool","away_team__team_name":"Norwich",'
+        b'"gameday__date":"2022-01-02","kickoff":"2022-01-02 15:00:00"}]'
     )
     mock_response = Mock(object=Response)
-    mock_response.text = dummy_gameweek_data
+    mock_response.content = dummy_gameweek_data
 
     mock_request.get.return_value = mock_response
 
@@ -37,11 +48,11 @@ def test_get_single_gameweek_data(mock_request):
     assert output == expected_output
 
 
-@patch(f"{INTERFACE_PATH}.requests")
+@patch.object(FUNBALL_INTERFACE, "session")
 def test_get_all_player_data(mock_request):
     mock_request_response = Mock(object=Response)
-    mock_request_response.text = (
-        '[{"id":1,"first_name":"test","surname":"player","goals":1,"assists":2}]'
+    mock_request_response.content = (
+        b'[{"id":1,"first_name":"test","surname":"player","goals":1,"assists":2}]'
     )
 
     mock_request.get.return_value = mock_request_response
@@ -61,6 +72,26 @@ def test_get_all_player_data(mock_request):
     assert output == expected_output
 
 
+@patch.object(FUNBALL_INTERFACE, "session")
+def test_get_player_catalog_is_cached(mock_request):
+    mock_request_response = Mock(object=Response)
+    mock_request_response.status_code = 200
+    mock_request_response.headers = {}
+    mock_request_response.content = (
+        b'[{"id":1,"name":"Danny Ward","team__team_name":"Leicester"},'
+        b'{"id":2,"name":"Danny Ward","team__team_name":"Wolves"}]'
+    )
+
+    mock_request.get.return_value = mock_request_response
+
+    output = FUNBALL_INTERFACE.get_player_catalog()
+
+    assert output.options == ("Danny Ward (Leicester)", "Danny Ward (Wolves)")
+    assert output.id_for_label("Danny Ward (Wolves)") == 2
+    assert FUNBALL_INTERFACE.get_player_catalog() is output
+    assert mock_request.get.call_count == 1
+
+
 @pytest.mark.parametrize(
     "session_funballer_name, expected_output",
     [
@@ -87,7 +118,7 @@ def test_get_all_player_data(mock_request):
     ],
 )
 @patch(f"{INTERFACE_PATH}.st")
-@patch(f"{INTERFACE_PATH}.requests")
+@patch.object(FUNBALL_INTERFACE, "session")
 def test_get_choices_data(
     mock_request,
     mock_streamlit,
@@ -96,16 +127,16 @@ def test_get_choices_data(
 ):
 
     mock_response = Mock(object=Response)
-    mock_response.text = (
-        '[{"id":2,"funballer_id":1,"player_choice__first_name":"Hugo",'
-        '"player_choice__surname":"Lloris","team_choice__team_name":'
-        '"Liverpool","player_has_been_steved":false,"team_has_been_steved":false,'
-        '"gameweek_id__gameweek_no":1,"team_point_awarded":true,'
-        '"player_point_awarded":false},{"id":1,"funballer_id":1,'
-        '"player_choice__first_name":"Harry","player_choice__surname":"Kane",'
-        '"team_choice__team_name":"Spurs","player_has_been_steved":true,'
-        '"team_has_been_steved":false,"gameweek_id__gameweek_no":2,'
-        '"team_point_awarded":true,"player_point_awarded":false}]'
+    mock_response.content = (
+        b'[{"id":2,"funballer_id":1,"player_choice__first_name":"Hugo",'
+        b'"player_choice__surname":"Lloris","team_choice__team_name":'
+        b'"Liverpool","player_has_been_steved":false,"team_has_been_steved":false,'
+        b'"gameweek_id__gameweek_no":1,"team_point_awarded":true,'
+        b'"player_point_awarded":false},{"id":1,"funballer_id":1,'
+        b'"player_choice__first_name":"Harry","player_choice__surname":"Kane",'
+        b'"team_choice__team_name":"Spurs","player_has_been_steved":true,'
+        b'"team_has_been_steved":false,"gameweek_id__gameweek_no":2,'
+        b'"team_point_awarded":true,"player_point_awarded":false}]'
     )
 
     mock_request.get.return_value = mock_response
@@ -119,10 +150,10 @@ def test_get_choices_data(
     assert output == expected_output
 
 
-@patch(f"{INTERFACE_PATH}.requests")
+@patch.object(FUNBALL_INTERFACE, "session")
 def test_get_gameweek_summary(mock_request):
     mock_response = Mock(object=Response)
-    mock_response.text = '{"text":"Test Gameweek Summary"}'
+    mock_response.content = b'{"text":"Test Gameweek Summary"}'
     mock_request.get.return_value = mock_response
 
     output = FUNBALL_INTERFACE.get_gameweek_summary()
@@ -131,12 +162,12 @@ def test_get_gameweek_summary(mock_request):
     assert output == expected_output
 
 
-@patch(f"{INTERFACE_PATH}.requests")
+@patch.object(FUNBALL_INTERFACE, "session")
 def test_get_funballer_data(mock_request):
     mock_response = Mock(object=Response)
-    mock_response.text = (
-        '[{"id":32,"first_name":"Test","surname":"Funballer","player_points":10,'
-        '"team_points":5,"points":15,"pin":"1234"}]'
+    mock_response.content = (
+        b'[{"id":32,"first_name":"Test","surname":"Funballer","player_points":10,'
+        b'"team_points":5,"points":15,"pin":"1234"}]'
     )
     mock_request.get.return_value = mock_response
 
@@ -149,3 +180,413 @@ def test_get_funballer_data(mock_request):
     }
 
     assert output == expected_output
+
+
+@patch.object(FUNBALL_INTERFACE, "session")
+def test_get_all_gameweek_data_cached(mock_session):
+    mock_response = Mock(object=Response)
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_response.content = b'[{"gameweek_no":1,"deadline":"2022-01-01T00:00:00Z"}]'
+    mock_session.get.return_value = mock_response
+
+    first_output = FUNBALL_INTERFACE.get_all_gameweek_data()
+    second_output = FUNBALL_INTERFACE.get_all_gameweek_data()
+
+    assert first_output is second_output
+    assert mock_session.get.call_count == 1
+
+
+@patch(f"{INTERFACE_PATH}.divider")
+@patch(f"{INTERFACE_PATH}.st")
+@patch.object(FUNBALL_INTERFACE, "session")
+def test_post_choice_invalidates_choices(mock_session, mock_streamlit, mock_divider):
+    mock_response = Mock(object=Response)
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_response.content = b"[]"
+    mock_session.get.return_value = mock_response
+    mock_session.post.return_value = Mock(object=Response, status_code=201)
+    mock_streamlit.session_state.get.return_value = "Test"
+
+    FUNBALL_INTERFACE.get_choices_data(funballer_name="Test", gameweek_no_limit=2)
+    FUNBALL_INTERFACE.post_choice(
+        payload=SubmitChoiceData(
+            pin="1234", gameweek_no=2, team_choice="Spurs", player_choice=1, submit=True
+        ),
+        funballer_name="Test",
+    )
+    FUNBALL_INTERFACE.get_choices_data(funballer_name="Test", gameweek_no_limit=2)
+
+    assert mock_session.get.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "status_code, expected_invalidated",
+    [
+        (201, ["funballer/choices/Test", "funballer/choices/Test?from=1&to=1"]),
+        (400, []),
+    ],
+)
+@patch(f"{INTERFACE_PATH}.divider")
+@patch(f"{INTERFACE_PATH}.st")
+@patch.object(FUNBALL_INTERFACE, "session")
+def test_post_choice_invalidates_submitting_funballer(
+    mock_session, mock_streamlit, mock_divider, status_code, expected_invalidated
+):
+    for cache_key in (
+        "funballer/choices/Test",
+        "funballer/choices/Test?from=1&to=1",
+        "funballer/choices/Tester",
+        "funballer/choices/Other",
+    ):
+        FUNBALL_INTERFACE.cache.put(cache_key, [])
+    mock_session.post.return_value = Mock(
+        object=Response, status_code=status_code, content=b'{"detail":"Invalid pin."}'
+    )
+
+    FUNBALL_INTERFACE.post_choice(
+        payload=SubmitChoiceData(
+            pin="1234", gameweek_no=2, team_choice="Spurs", player_choice=1, submit=True
+        ),
+        funballer_name="Test",
+    )
+
+    assert [
+        cache_key
+        for cache_key in (
+            "funballer/choices/Test",
+            "funballer/choices/Test?from=1&to=1",
+            "funballer/choices/Tester",
+            "funballer/choices/Other",
+        )
+        if FUNBALL_INTERFACE.cache.get_stale(cache_key) is None
+    ] == expected_invalidated
+
+
+def test_get_funballer_data_revalidated(stub_backend):
+    stub_backend.routes["funballer/"] = [
+        {"first_name": "Test", "player_points": 1, "team_points": 2, "points": 3}
+    ]
+    funball_interface = FunballInterface(
+        cache=ResponseCache(default_ttl=0, endpoint_ttls={}),
+    )
+
+    with patch.object(
+        funball_interface.formatter,
+        "format_funballer_data",
+        wraps=funball_interface.formatter.format_funballer_data,
+    ) as mock_format_funballer_data:
+        first_output = funball_interface.get_funballer_data()
+        second_output = funball_interface.get_funballer_data()
+
+    (_, first_headers), (_, second_headers) = stub_backend.requests
+
+    assert "If-None-Match" not in first_headers
+    assert (
+        second_headers["If-None-Match"]
+        == funball_interface.cache.get_stale("funballer/").etag
+    )
+    assert second_output is first_output
+    assert mock_format_funballer_data.call_count == 1
+    assert funball_interface.cache_stats().revalidations == 1
+
+
+def test_get_funballer_data_traced(stub_backend):
+    stub_backend.routes["funballer/"] = [
+        {"first_name": "Test", "player_points": 1, "team_points": 2, "points": 3}
+    ]
+    funball_interface = FunballInterface()
+
+    tracer = Tracer(name="Test")
+    token = _TRACER.set(tracer)
+    try:
+        funball_interface.get_funballer_data()
+        funball_interface.get_funballer_data()
+    finally:
+        _TRACER.reset(token)
+
+    miss_span, hit_span = tracer.children(None)
+
+    assert miss_span.name == "get funballer/"
+    assert miss_span.args == {"cache_key": "funballer/", "hit": False}
+    assert [
+        (span.name, span.category) for span in tracer.children(miss_span.span_id)
+    ] == [
+        ("GET funballer/", "network"),
+        ("decode funballer/", "decode"),
+        ("parse funballer/", "parse"),
+    ]
+    assert tracer.children(miss_span.span_id)[0].args == {"status_code": 200}
+    assert hit_span.args == {"cache_key": "funballer/", "hit": True}
+    assert tracer.children(hit_span.span_id) == []
+
+
+def test_get_funballer_data_modified(stub_backend):
+    stub_backend.routes["funballer/"] = [
+        {"first_name": "Test", "player_points": 1, "team_points": 2, "points": 3}
+    ]
+    funball_interface = FunballInterface(
+        cache=ResponseCache(default_ttl=0, endpoint_ttls={}),
+    )
+
+    funball_interface.get_funballer_data()
+    stub_backend.routes["funballer/"][0]["points"] = 4
+    output = funball_interface.get_funballer_data()
+
+    assert output["funballer_points"] == [4]
+    assert funball_interface.cache_stats().revalidations == 0
+
+
+@pytest.mark.parametrize(
+    "session_funballer_name, expected_gameweek_nos",
+    [
+        ("test", [1, 2]),
+        ("blah", [1]),
+    ],
+)
+@patch(f"{INTERFACE_PATH}.st")
+@patch.object(FUNBALL_INTERFACE, "session")
+def test_get_choices_dataframe(
+    mock_session,
+    mock_streamlit,
+    session_funballer_name,
+    expected_gameweek_nos,
+):
+    mock_response = Mock(object=Response)
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_response.content = (
+        b'[{"gameweek_id__gameweek_no":1,"team_choice__team_name":"Liverpool",'
+        b'"player_choice__first_name":"Hugo","player_choice__surname":"Lloris",'
+        b'"team_point_awarded":true,"player_point_awarded":false},'
+        b'{"gameweek_id__gameweek_no":2,"team_choice__team_name":"Spurs",'
+        b'"player_choice__first_name":"Harry","player_choice__surname":"Kane",'
+        b'"team_point_awarded":true,"player_point_awarded":false}]'
+    )
+    mock_session.get.return_value = mock_response
+    mock_streamlit.session_state.get.return_value = session_funballer_name
+
+    output = FUNBALL_INTERFACE.get_choices_dataframe(
+        funballer_name="test",
+        gameweek_no_limit=2,
+    )
+
+    assert output["Gameweek Number"].tolist() == expected_gameweek_nos
+    assert (
+        FUNBALL_INTERFACE.get_choices_data(
+            funballer_name="test", gameweek_no_limit=2
+        ).gameweek_no
+        == expected_gameweek_nos
+    )
+
+
+def league_choice(gameweek_no, team_name, points_awarded):
+    return {
+        "gameweek_id__gameweek_no": gameweek_no,
+        "team_choice__team_name": team_name,
+        "player_choice__first_name": "Harry",
+        "player_choice__surname": "Kane",
+        "team_point_awarded": points_awarded,
+        "player_point_awarded": points_awarded,
+    }
+
+
+@pytest.fixture
+def league_backend(stub_backend):
+    stub_backend.routes["funballer/"] = [
+        {"first_name": name, "player_points": 0, "team_points": 0, "points": 0}
+        for name in ("Ben", "Adam", "Will")
+    ]
+    stub_backend.routes["funballer/choices/Ben"] = [
+        league_choice(1, "Spurs", True),
+        league_choice(2, "Arsenal", None),
+    ]
+    stub_backend.routes["funballer/choices/Adam"] = [
+        league_choice(1, "Wolves", False),
+        league_choice(2, "Fulham", None),
+    ]
+    stub_backend.routes["funballer/choices/Will"] = []
+
+    return stub_backend
+
+
+@pytest.mark.parametrize(
+    "session_funballer_name, expected_team_choices",
+    [
+        # Only Ben can see his own choice for the upcoming gameweek
+        ("Ben", {1: ["Spurs", "Wolves", None], 2: ["Arsenal", None, None]}),
+        (None, {1: ["Spurs", "Wolves", None]}),
+    ],
+)
+@patch(f"{INTERFACE_PATH}.st")
+def test_get_league_choices_dataframe(
+    mock_streamlit, league_backend, session_funballer_name, expected_team_choices
+):
+    mock_streamlit.session_state = {"funballer_name": session_funballer_name}
+    funball_interface = FunballInterface()
+
+    output = funball_interface.get_league_choices_dataframe(gameweek_no_limit=2)
+
+    assert output.index.tolist() == ["Ben", "Adam", "Will"]
+    assert {
+        gameweek_no: output[("Team Choice", gameweek_no)]
+        .where(output[("Team Choice", gameweek_no)].notna(), None)
+        .tolist()
+        for gameweek_no in output["Team Choice"].columns
+    } == expected_team_choices
+
+
+@patch(f"{INTERFACE_PATH}.st")
+def test_get_league_choices_dataframe_is_cached(mock_streamlit, league_backend):
+    mock_streamlit.session_state = {}
+    funball_interface = FunballInterface()
+
+    funball_interface.get_league_choices_dataframe(gameweek_no_limit=2)
+    no_of_requests = len(league_backend.requests)
+    funball_interface.get_league_choices_dataframe(gameweek_no_limit=3)
+
+    assert no_of_requests == 4
+    assert len(league_backend.requests) == no_of_requests
+
+
+@patch(f"{INTERFACE_PATH}.st")
+def test_get_league_choices_dataframe_is_concurrent(mock_streamlit, league_backend):
+    mock_streamlit.session_state = {}
+    league_backend.delay = 0.2
+    funball_interface = FunballInterface()
+
+    started = time.perf_counter()
+    funball_interface.get_league_choices_dataframe(gameweek_no_limit=2)
+
+    # funballer/ then the three funballers' choices at once, rather than in turn
+    assert time.perf_counter() - started < 0.7
+
+
+WINDOWED_CHOICES = [
+    league_choice(1, "Spurs", True),
+    league_choice(2, "Arsenal", False),
+    league_choice(3, "Fulham", None),
+]
+
+
+@pytest.mark.parametrize("supports_gameweek_windows", [True, False])
+@patch(f"{INTERFACE_PATH}.st")
+def test_get_choices_dataframe_windowed(
+    mock_streamlit, stub_backend, supports_gameweek_windows
+):
+    mock_streamlit.session_state = {}
+    stub_backend.supports_gameweek_windows = supports_gameweek_windows
+    stub_backend.routes["funballer/choices/Ben"] = WINDOWED_CHOICES
+    stub_backend.routes["funballer/choices/Adam"] = []
+    funball_interface = FunballInterface()
+
+    first_output = funball_interface.get_choices_dataframe(
+        funballer_name="Ben", gameweek_no_limit=3
+    )
+    second_output = funball_interface.get_choices_dataframe(
+        funballer_name="Adam", gameweek_no_limit=3
+    )
+
+    assert first_output["Team Choice"].tolist() == ["Spurs", "Arsenal"]
+    assert second_output.empty
+    assert funball_interface.supports_gameweek_windows is supports_gameweek_windows
+
+    requested_paths = [path for path, _ in stub_backend.requests]
+    if supports_gameweek_windows:
+        assert requested_paths == [
+            "funballer/choices/Ben",
+            "funballer/choices/Ben?from=1&to=0",
+            "funballer/choices/Adam?from=1&to=2",
+        ]
+    else:
+        # Once unsupported, only the whole history is requested
+        assert requested_paths == [
+            "funballer/choices/Ben",
+            "funballer/choices/Ben?from=1&to=0",
+            "funballer/choices/Adam",
+        ]
+
+
+@patch(f"{INTERFACE_PATH}.st")
+def test_get_choices_dataframe_windows_unknown_without_choices(
+    mock_streamlit, stub_backend
+):
+    mock_streamlit.session_state = {}
+    stub_backend.routes["funballer/choices/Adam"] = []
+    funball_interface = FunballInterface()
+
+    funball_interface.get_choices_dataframe(funballer_name="Adam", gameweek_no_limit=3)
+
+    assert funball_interface.supports_gameweek_windows is None
+    assert [path for path, _ in stub_backend.requests] == ["funballer/choices/Adam"]
+
+
+@patch(f"{INTERFACE_PATH}.st")
+def test_get_choices_dataframe_windows_check_failed(mock_streamlit):
+    mock_streamlit.session_state = {}
+    funball_interface = FunballInterface(session=Mock())
+
+    def get(url, **_):
+        mock_response = Mock(object=Response)
+        mock_response.headers = {}
+        if url.endswith("?from=1&to=0"):
+            mock_response.status_code = 500
+            mock_response.content = b"Internal Server Error"
+        else:
+            mock_response.status_code = 200
+            mock_response.content = json.dumps(WINDOWED_CHOICES).encode()
+
+        return mock_response
+
+    funball_interface.session.get.side_effect = get
+
+    output = funball_interface.get_choices_dataframe(
+        funballer_name="Ben", gameweek_no_limit=3
+    )
+
+    assert output["Team Choice"].tolist() == ["Spurs", "Arsenal"]
+    assert funball_interface.supports_gameweek_windows is None
+
+
+@patch(f"{INTERFACE_PATH}.GAMEWEEK_WINDOWS_TTL", 0)
+@patch(f"{INTERFACE_PATH}.st")
+def test_get_choices_dataframe_windows_rechecked(mock_streamlit, stub_backend):
+    mock_streamlit.session_state = {}
+    stub_backend.supports_gameweek_windows = False
+    stub_backend.routes["funballer/choices/Ben"] = WINDOWED_CHOICES
+    funball_interface = FunballInterface()
+
+    funball_interface.get_choices_dataframe(funballer_name="Ben", gameweek_no_limit=3)
+    stub_backend.supports_gameweek_windows = True
+    funball_interface.get_choices_dataframe(funballer_name="Ben", gameweek_no_limit=3)
+
+    assert funball_interface.supports_gameweek_windows is True
+    assert [path for path, _ in stub_backend.requests] == [
+        "funballer/choices/Ben",
+        "funballer/choices/Ben?from=1&to=0",
+        "funballer/choices/Ben?from=1&to=0",
+    ]
+
+
+@patch(f"{INTERFACE_PATH}.st")
+def test_get_choices_data_windowed(mock_streamlit, stub_backend):
+    mock_streamlit.session_state = {"funballer_name": "Ben"}
+    stub_backend.routes["funballer/choices/Ben"] = WINDOWED_CHOICES
+    stub_backend.routes["funballer/choices/Adam"] = WINDOWED_CHOICES
+    funball_interface = FunballInterface()
+
+    own_output = funball_interface.get_choices_data(
+        funballer_name="Ben", gameweek_no_limit=2
+    )
+    other_output = funball_interface.get_choices_data(
+        funballer_name="Adam", gameweek_no_limit=2
+    )
+
+    assert own_output.gameweek_no == [1, 2, 3]
+    assert other_output.gameweek_no == [1]
+    assert [path for path, _ in stub_backend.requests] == [
+        "funballer/choices/Ben",
+        "funballer/choices/Adam",
+        "funballer/choices/Adam?from=1&to=0",
+    ]
@@ -1,3 +1,10 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+import pytz
+from pandas._testing import assert_frame_equal
+
 from interface.formatter import FunballInterfaceFormatter
 
 
@@ -71,3 +78,176 @@ def test_format_funballer_data():
     }
 
     assert output == expected_output
+
+
+def test_format_kickoffs_season():
+    formatter = FunballInterfaceFormatter()
+    bst = pytz.timezone("Europe/London")
+
+    # Hourly kickoffs across a whole season, including both DST transitions
+    season_start = datetime(2022, 8, 5, 19, 0, 0)
+    season_kickoffs = [
+        datetime.strftime(season_start + timedelta(hours=hours), "%Y-%m-%d %H:%M:%S")
+        for hours in range(0, 24 * 290, 7)
+    ]
+
+    output = formatter._format_kickoffs(kickoffs=season_kickoffs)
+
+    expected_output = [
+        datetime.strftime(
+            bst.fromutc(datetime.strptime(kickoff, "%Y-%m-%d %H:%M:%S")), "%H:%M"
+        )
+        for kickoff in season_kickoffs
+    ]
+
+    assert output == expected_output
+
+
+def test_format_gameweek_data_empty():
+    formatter = FunballInterfaceFormatter()
+
+    output = formatter.format_gameweek_data(gameweek_data=[])
+
+    expected_output = {
+        "home_teams": [],
+        "away_teams": [],
+        "game_dates": [],
+        "game_kickoffs": [],
+    }
+
+    assert output == expected_output
+
+
+def test_format_choices_dataframe():
+    formatter = FunballInterfaceFormatter()
+
+    dummy_choices_data = [
+        {
+            "gameweek_id__gameweek_no": 1,
+            "team_choice__team_name": "Liverpool",
+            "player_choice__first_name": "Hugo",
+            "player_choice__surname": "Lloris",
+            "team_point_awarded": True,
+            "player_point_awarded": False,
+        },
+        {
+            "gameweek_id__gameweek_no": 2,
+            "team_choice__team_name": "Spurs",
+            "player_choice__first_name": "Harry",
+            "player_choice__surname": "Kane",
+            "team_point_awarded": None,
+            "player_point_awarded": None,
+        },
+    ]
+
+    output = formatter.format_choices_dataframe(choices_data=dummy_choices_data)
+
+    expected_output = pd.DataFrame(
+        {
+            "Gameweek Number": [1, 2],
+            "Team Choice": ["Liverpool", "Spurs"],
+            "Player Choice": ["Hugo Lloris", "Harry Kane"],
+            "Team Point Awarded": [True, False],
+            "Player Point Awarded": [False, False],
+        }
+    )
+
+    assert_frame_equal(left=output, right=expected_output)
+
+
+def test_format_funballer_dataframe():
+    formatter = FunballInterfaceFormatter()
+
+    dummy_funballer_data = [
+        {
+            "first_name": "Patrick",
+            "team_points": 10,
+            "player_points": 5,
+            "points": 15,
+        },
+    ]
+
+    output = formatter.format_funballer_dataframe(funballer_data=dummy_funballer_data)
+
+    expected_output = pd.DataFrame(
+        {
+            "Name": ["Patrick"],
+            "Team Points": [10],
+            "Player Points": [5],
+            "Total Points": [15],
+        }
+    )
+
+    assert_frame_equal(left=output, right=expected_output)
+
+
+def test_format_all_players_from_team_dataframe():
+    formatter = FunballInterfaceFormatter()
+
+    dummy_player_data = [
+        {"first_name": "Harry", "surname": "Kane", "goals": 3, "assists": 1},
+    ]
+
+    output = formatter.format_all_players_from_team_dataframe(
+        player_data=dummy_player_data
+    )
+
+    expected_output = pd.DataFrame(
+        {
+            "Player Name": ["Harry Kane"],
+            "Goals": [3],
+            "Assists": [1],
+        }
+    )
+
+    assert_frame_equal(left=output, right=expected_output)
+
+
+def test_format_choices_dataframe_invalid_funballer():
+    formatter = FunballInterfaceFormatter()
+
+    with pytest.raises(TypeError):
+        formatter.format_choices_dataframe(choices_data={"detail": "Not found."})
+
+
+def test_format_league_choices_dataframe():
+    formatter = FunballInterfaceFormatter()
+
+    choices_by_funballer = {
+        "Ben": pd.DataFrame(
+            {
+                "Gameweek Number": [1, 2],
+                "Team Choice": ["Liverpool", "Spurs"],
+                "Player Choice": ["Hugo Lloris", "Harry Kane"],
+                "Team Point Awarded": [True, False],
+                "Player Point Awarded": [False, False],
+            }
+        ),
+        "Adam": pd.DataFrame(
+            {
+                "Gameweek Number": [1],
+                "Team Choice": ["Arsenal"],
+                "Player Choice": ["Bukayo Saka"],
+                "Team Point Awarded": [False],
+                "Player Point Awarded": [True],
+            }
+        ),
+    }
+
+    output = formatter.format_league_choices_dataframe(
+        choices_by_funballer=choices_by_funballer
+    )
+
+    assert output.index.tolist() == ["Ben", "Adam"]
+    assert output["Team Choice"].columns.tolist() == [1, 2]
+    assert output.loc["Ben", ("Player Choice", 2)] == "Harry Kane"
+    assert output.loc["Adam", ("Player Point Awarded", 1)]
+    assert pd.isna(output.loc["Adam", ("Team Choice", 2)])
+
+
+def test_format_league_choices_dataframe_no_funballers():
+    formatter = FunballInterfaceFormatter()
+
+    output = formatter.format_league_choices_dataframe(choices_by_funballer={})
+
+    assert output.empty
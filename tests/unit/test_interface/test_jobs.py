@@ -0,0 +1,101 @@
+import threading
+
+from interface import BackgroundJob, FunballInterface
+from interface.jobs import FAILED, IDLE, RUNNING, SUCCEEDED
+
+
+def test_trigger_runs_job():
+    calls = []
+    job = BackgroundJob(name="test", target=lambda: calls.append(1))
+
+    assert job.status().state == IDLE
+    assert job.trigger()
+    job.wait(timeout=5)
+
+    status = job.status()
+    assert calls == [1]
+    assert status.state == SUCCEEDED
+    assert status.finished_at >= status.started_at
+
+
+def test_concurrent_triggers_are_coalesced():
+    release = threading.Event()
+    calls = []
+
+    def target():
+        calls.append(1)
+        release.wait(timeout=5)
+
+    job = BackgroundJob(name="test", target=target)
+
+    started = [job.trigger() for _ in range(5)]
+    assert job.status().state == RUNNING
+
+    release.set()
+    job.wait(timeout=5)
+
+    assert started == [True, False, False, False, False]
+    assert calls == [1]
+
+
+def test_cooldown():
+    calls = []
+    job = BackgroundJob(name="test", target=lambda: calls.append(1), cooldown=60)
+
+    job.trigger()
+    job.wait(timeout=5)
+
+    assert not job.trigger()
+    assert calls == [1]
+    assert 0 < job.status().cooldown_remaining <= 60
+
+
+def test_no_cooldown():
+    calls = []
+    job = BackgroundJob(name="test", target=lambda: calls.append(1))
+
+    for _ in range(2):
+        job.trigger()
+        job.wait(timeout=5)
+
+    assert calls == [1, 1]
+
+
+def test_failed_job():
+    def target():
+        raise ValueError("Backend unavailable")
+
+    job = BackgroundJob(name="test", target=target)
+
+    job.trigger()
+    job.wait(timeout=5)
+
+    status = job.status()
+    assert status.state == FAILED
+    assert str(status.error) == "Backend unavailable"
+
+
+def test_update_standings_job(stub_backend):
+    stub_backend.routes["update_database/"] = {}
+    funball_interface = FunballInterface()
+    job = BackgroundJob(
+        name="update-standings", target=funball_interface.update_standings
+    )
+
+    job.trigger()
+    job.wait(timeout=5)
+
+    assert job.status().state == SUCCEEDED
+    assert [path for path, _ in stub_backend.requests] == ["update_database/"]
+
+
+def test_update_standings_job_backend_error(stub_backend):
+    funball_interface = FunballInterface()
+    job = BackgroundJob(
+        name="update-standings", target=funball_interface.update_standings
+    )
+
+    job.trigger()
+    job.wait(timeout=5)
+
+    assert job.status().state == FAILED
@@ -0,0 +1,156 @@
+import pytest
+import requests
+
+from interface import FunballInterface
+from interface.metrics import (
+    CONTENT_TYPE,
+    InterfaceMetrics,
+    MetricsRegistry,
+    endpoint_label,
+    start_metrics_server,
+)
+
+
+@pytest.mark.parametrize(
+    "endpoint, expected_output",
+    [
+        ("gameweek/all/", "gameweek/all/"),
+        ("gameweek/summary/", "gameweek/summary/"),
+        ("gameweek/12", "gameweek/{gameweek_no}"),
+        ("players/", "players/"),
+        ("Spurs/players/", "{team_name}/players/"),
+        ("funballer/", "funballer/"),
+        ("funballer/choices/Ben", "funballer/choices/{funballer_name}"),
+        ("funballer/choices/Ben?from=1&to=3", "funballer/choices/{funballer_name}"),
+        (
+            "funballer/choices/valid_teams/Ben",
+            "funballer/choices/valid_teams/{funballer_name}",
+        ),
+        ("funballer/choices/submit/1234", "funballer/choices/submit/{pin}"),
+    ],
+)
+def test_endpoint_label(endpoint, expected_output):
+    assert endpoint_label(endpoint) == expected_output
+
+
+def test_counter_render():
+    registry = MetricsRegistry()
+    counter = registry.counter("test_total", "A test counter", labelnames=("endpoint",))
+
+    counter.inc(endpoint="players/")
+    counter.inc(2, endpoint='say "hi"')
+
+    assert registry.render() == (
+        "# HELP test_total A test counter\n"
+        "# TYPE test_total counter\n"
+        'test_total{endpoint="players/"} 1\n'
+        'test_total{endpoint="say \\"hi\\""} 2\n'
+    )
+
+
+def test_histogram_render():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("test_seconds", "A test histogram", buckets=(0.1, 1))
+
+    for value in (0.05, 0.1, 0.5, 3):
+        histogram.observe(value)
+
+    assert registry.render().splitlines()[2:] == [
+        'test_seconds_bucket{le="0.1"} 2',
+        'test_seconds_bucket{le="1.0"} 3',
+        'test_seconds_bucket{le="+Inf"} 4',
+        "test_seconds_sum 3.65",
+        "test_seconds_count 4",
+    ]
+
+
+def test_labels_must_match():
+    registry = MetricsRegistry()
+    counter = registry.counter("test_total", "A test counter", labelnames=("endpoint",))
+
+    with pytest.raises(ValueError):
+        counter.inc(status_code="200")
+
+
+def test_metrics_are_registered_once():
+    registry = MetricsRegistry()
+
+    assert InterfaceMetrics(registry).responses is InterfaceMetrics(registry).responses
+
+
+def test_function_metric():
+    registry = MetricsRegistry()
+    registry.function("test_entries", "A test gauge", lambda: 3)
+
+    assert registry.render().splitlines()[-1] == "test_entries 3"
+
+
+def test_interface_calls_are_instrumented(stub_backend):
+    stub_backend.routes["funballer/"] = [
+        {"first_name": "Test", "player_points": 1, "team_points": 2, "points": 3}
+    ]
+    metrics = InterfaceMetrics(registry=MetricsRegistry())
+    funball_interface = FunballInterface(metrics=metrics)
+
+    funball_interface.get_funballer_data()
+    funball_interface.cache.clear()
+    funball_interface.get_funballer_dataframe()
+    with pytest.raises(ValueError):
+        funball_interface.get_all_gameweek_data()
+
+    assert metrics.request_duration.count(endpoint="funballer/", method="GET") == 2
+    assert (
+        metrics.responses.value(endpoint="funballer/", method="GET", status_code="200")
+        == 2
+    )
+    assert (
+        metrics.responses.value(endpoint="gameweek/all/", method="GET", status_code="404")
+        == 1
+    )
+    assert metrics.response_size.count(endpoint="funballer/") == 2
+    assert metrics.decode_duration.count(endpoint="funballer/") == 2
+    assert metrics.parse_duration.count(endpoint="funballer/") == 2
+
+
+def test_connection_errors_are_counted(monkeypatch):
+    monkeypatch.setenv("FANTASY_FUNBALL_URL", "http://127.0.0.1:1/fantasy_funball/")
+    metrics = InterfaceMetrics(registry=MetricsRegistry())
+    funball_interface = FunballInterface(metrics=metrics)
+    funball_interface.session.mount("http://", requests.adapters.HTTPAdapter())
+
+    with pytest.raises(requests.ConnectionError):
+        funball_interface.update_standings()
+
+    assert (
+        metrics.errors.value(
+            endpoint="update_database/", method="GET", error="ConnectionError"
+        )
+        == 1
+    )
+
+
+def test_submitted_pins_are_not_exported(stub_backend):
+    metrics = InterfaceMetrics(registry=MetricsRegistry())
+    funball_interface = FunballInterface(metrics=metrics)
+
+    funball_interface._request("POST", "funballer/choices/submit/1234", data={})
+
+    assert "1234" not in metrics.registry.render()
+
+
+def test_metrics_server():
+    registry = MetricsRegistry()
+    registry.counter("test_total", "A test counter").inc()
+    server = start_metrics_server(port=0, registry=registry, host="127.0.0.1")
+
+    try:
+        response = requests.get(f"http://127.0.0.1:{server.server_port}/metrics")
+        not_found_response = requests.get(f"http://127.0.0.1:{server.server_port}/")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == CONTENT_TYPE
+    assert response.text == registry.render()
+    assert not_found_response.status_code == 404
@@ -0,0 +1,61 @@
+import pytest
+
+from interface import PlayerCatalog
+
+DUMMY_PLAYER_DATA = [
+    {"id": 1, "name": "Harry Kane", "team__team_name": "Spurs"},
+    {"id": 2, "name": "Danny Ward", "team__team_name": "Leicester"},
+    {"id": 3, "name": "Danny Ward", "team__team_name": "Wolves"},
+    {"id": 4, "name": "Ben Davies", "team__team_name": "Spurs"},
+    {"id": 5, "name": "Ben Davies", "team__team_name": "Spurs"},
+    {"id": 6, "first_name": "Bukayo", "surname": "Saka"},
+]
+
+
+@pytest.fixture
+def player_catalog():
+    return PlayerCatalog(player_data=DUMMY_PLAYER_DATA)
+
+
+def test_options_are_disambiguated(player_catalog):
+    assert player_catalog.options == (
+        "Harry Kane",
+        "Danny Ward (Leicester)",
+        "Danny Ward (Wolves)",
+        "Ben Davies (#4)",
+        "Ben Davies (#5)",
+        "Bukayo Saka",
+    )
+
+
+def test_every_option_resolves_to_its_player(player_catalog):
+    output = [player_catalog.id_for_label(label) for label in player_catalog.options]
+
+    assert output == [1, 2, 3, 4, 5, 6]
+
+
+@pytest.mark.parametrize(
+    "player_id, expected_name, expected_team, expected_label",
+    [
+        (1, "Harry Kane", "Spurs", "Harry Kane"),
+        (3, "Danny Ward", "Wolves", "Danny Ward (Wolves)"),
+        (6, "Bukayo Saka", None, "Bukayo Saka"),
+    ],
+)
+def test_lookups_by_id(
+    player_catalog, player_id, expected_name, expected_team, expected_label
+):
+    assert player_catalog.name_for_id(player_id) == expected_name
+    assert player_catalog.team_for_id(player_id) == expected_team
+    assert player_catalog.label_for_id(player_id) == expected_label
+
+
+def test_ids_for_team(player_catalog):
+    assert player_catalog.ids_for_team("Spurs") == (1, 4, 5)
+    assert player_catalog.ids_for_team("Arsenal") == ()
+
+
+def test_len_and_contains(player_catalog):
+    assert len(player_catalog) == 6
+    assert 6 in player_catalog
+    assert 7 not in player_catalog
@@ -0,0 +1,166 @@
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from interface import BackgroundRefresher, FunballInterface
+from utilities.gameweek import LONDON, UTC
+
+DUMMY_FUNBALLER_DATA = [
+    {"first_name": "Test", "player_points": 1, "team_points": 2, "points": 3}
+]
+DUMMY_GAMEWEEK_DATA = [
+    {"gameweek_no": 1, "deadline": "2022-08-05T17:30:00Z"},
+    {"gameweek_no": 2, "deadline": "2022-08-13T10:00:00Z"},
+]
+
+
+@pytest.fixture
+def funball_interface(stub_backend):
+    stub_backend.routes["funballer/"] = DUMMY_FUNBALLER_DATA
+    stub_backend.routes["gameweek/all/"] = DUMMY_GAMEWEEK_DATA
+
+    return FunballInterface()
+
+
+@pytest.mark.parametrize(
+    "now, expected_next_update",
+    [
+        # BST, midnight in London is 23:00 UTC
+        (datetime(2022, 8, 1, 12, tzinfo=UTC), datetime(2022, 8, 1, 23, 5, tzinfo=UTC)),
+        (
+            datetime(2022, 8, 1, 23, 1, tzinfo=UTC),
+            datetime(2022, 8, 1, 23, 5, tzinfo=UTC),
+        ),
+        (
+            datetime(2022, 8, 1, 23, 5, tzinfo=UTC),
+            datetime(2022, 8, 2, 23, 5, tzinfo=UTC),
+        ),
+        # GMT
+        (datetime(2022, 12, 1, 12, tzinfo=UTC), datetime(2022, 12, 2, 0, 5, tzinfo=UTC)),
+    ],
+)
+def test_next_update(funball_interface, now, expected_next_update):
+    refresher = BackgroundRefresher(funball_interface=funball_interface)
+
+    output = refresher.next_update(now=now)
+
+    assert output == expected_next_update
+    assert output.astimezone(LONDON).strftime("%H:%M") == "00:05"
+
+
+@pytest.mark.parametrize(
+    "now, expected_next_run",
+    [
+        (
+            datetime(2022, 8, 5, 12, tzinfo=UTC),
+            (datetime(2022, 8, 5, 17, 31, tzinfo=UTC), "deadline"),
+        ),
+        (
+            datetime(2022, 8, 5, 17, 30, 30, tzinfo=UTC),
+            (datetime(2022, 8, 5, 17, 31, tzinfo=UTC), "deadline"),
+        ),
+        (
+            datetime(2022, 8, 5, 17, 31, tzinfo=UTC),
+            (datetime(2022, 8, 5, 23, 5, tzinfo=UTC), "update"),
+        ),
+        (
+            datetime(2022, 9, 1, 12, tzinfo=UTC),
+            (datetime(2022, 9, 1, 23, 5, tzinfo=UTC), "update"),
+        ),
+    ],
+)
+def test_next_run(funball_interface, now, expected_next_run):
+    refresher = BackgroundRefresher(funball_interface=funball_interface)
+
+    assert refresher.next_run(now=now) == expected_next_run
+
+
+def test_run_once_refreshes_cached_entries(stub_backend, funball_interface):
+    refresher = BackgroundRefresher(funball_interface=funball_interface)
+    first_output = funball_interface.get_funballer_dataframe()
+
+    stub_backend.routes["funballer/"] = [dict(DUMMY_FUNBALLER_DATA[0], points=4)]
+    run = refresher.run_once()
+    second_output = funball_interface.get_funballer_dataframe()
+
+    assert first_output["Total Points"].tolist() == [3]
+    assert second_output["Total Points"].tolist() == [4]
+    assert (run.reason, run.refreshed, run.failed) == ("manual", 1, 0)
+    assert refresher.history() == [run]
+
+    # Refreshed entries stay fresh until the next scheduled refresh
+    next_run, _ = refresher.next_run()
+    entry = funball_interface.cache.get_stale("funballer/#dataframe")
+    assert (
+        entry.expires_at - time.monotonic()
+        > (next_run - datetime.now(tz=UTC)).total_seconds()
+    )
+
+
+def test_run_once_records_failures(stub_backend, funball_interface):
+    refresher = BackgroundRefresher(funball_interface=funball_interface)
+    funball_interface.get_funballer_data()
+
+    del stub_backend.routes["funballer/"]
+    run = refresher.run_once()
+
+    assert (run.refreshed, run.failed) == (0, 1)
+    assert funball_interface.get_funballer_data()["funballer_points"] == [3]
+
+
+def test_run_once_skips_uncached_entries(stub_backend, funball_interface):
+    refresher = BackgroundRefresher(funball_interface=funball_interface)
+    stub_backend.routes["funballer/choices/Test"] = []
+    for funballer_name in ("Typo1", "Typo2", "Test"):
+        try:
+            funball_interface.get_choices_dataframe(
+                funballer_name=funballer_name, gameweek_no_limit=2
+            )
+        except BaseException:
+            pass
+    funball_interface.get_funballer_data()
+    funball_interface.cache.invalidate("funballer/choices/")
+    stub_backend.requests.clear()
+
+    run = refresher.run_once()
+
+    assert (run.refreshed, run.failed) == (1, 0)
+    assert [
+        path for path, _ in stub_backend.requests if path.startswith("funballer/")
+    ] == ["funballer/"]
+
+
+def test_run_once_drops_failed_entries(stub_backend, funball_interface):
+    refresher = BackgroundRefresher(funball_interface=funball_interface)
+    funball_interface.get_funballer_data()
+
+    del stub_backend.routes["funballer/"]
+    first_run = refresher.run_once()
+    stub_backend.routes["funballer/"] = DUMMY_FUNBALLER_DATA
+    second_run = refresher.run_once()
+
+    assert (first_run.refreshed, first_run.failed) == (0, 1)
+    assert (second_run.refreshed, second_run.failed) == (0, 0)
+
+
+def test_start_and_stop(funball_interface):
+    refresher = BackgroundRefresher(funball_interface=funball_interface)
+    funball_interface.get_funballer_data()
+
+    now = datetime.now(tz=UTC)
+    with patch.object(
+        refresher,
+        "next_run",
+        side_effect=[(now, "update")] + [(now + timedelta(1), "update")] * 10,
+    ):
+        refresher.start()
+        deadline = time.monotonic() + 5
+        while not refresher.history() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        refresher.stop(timeout=5)
+
+    assert not refresher.is_running()
+    assert [run.reason for run in refresher.history()] == ["update"]
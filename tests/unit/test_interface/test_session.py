@@ -0,0 +1,43 @@
+import pytest
+
+from interface.session import RETRY_METHODS, create_http_session
+
+
+def test_create_http_session():
+    session = create_http_session(pool_size=5, max_retries=2, backoff_factor=0.5)
+    adapter = session.get_adapter("https://example.com/")
+
+    assert adapter._pool_connections == 5
+    assert adapter._pool_maxsize == 5
+    assert adapter.max_retries.total == 2
+    assert adapter.max_retries.backoff_factor == 0.5
+    assert adapter.max_retries.allowed_methods == RETRY_METHODS
+    assert session.get_adapter("http://example.com/") is adapter
+
+
+@pytest.mark.parametrize(
+    "env_value, expected_pool_size",
+    [
+        ("", 20),
+        ("4", 4),
+    ],
+)
+def test_create_http_session_from_environment(
+    monkeypatch,
+    env_value,
+    expected_pool_size,
+):
+    monkeypatch.setenv("FANTASY_FUNBALL_POOL_SIZE", env_value)
+
+    session = create_http_session()
+    adapter = session.get_adapter("https://example.com/")
+
+    assert adapter._pool_maxsize == expected_pool_size
+
+
+def test_post_is_not_retried():
+    session = create_http_session()
+    adapter = session.get_adapter("https://example.com/")
+
+    assert not adapter.max_retries.is_retry(method="POST", status_code=503)
+    assert adapter.max_retries.is_retry(method="GET", status_code=503)
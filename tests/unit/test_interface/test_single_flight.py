@@ -0,0 +1,126 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from interface import FunballInterface
+from interface.decoding import RecordValidationError
+from interface.single_flight import SingleFlight
+from utilities import SingleFlightStats
+
+NO_OF_THREADS = 10
+
+
+def run_concurrently(function, no_of_threads=NO_OF_THREADS):
+    """Call the function from several threads at once, returning the results"""
+    barrier = threading.Barrier(no_of_threads)
+
+    def call():
+        barrier.wait(timeout=5)
+        return function()
+
+    with ThreadPoolExecutor(max_workers=no_of_threads) as executor:
+        futures = [executor.submit(call) for _ in range(no_of_threads)]
+
+    return futures
+
+
+def test_sequential_calls_are_not_coalesced():
+    single_flight = SingleFlight()
+
+    outputs = [single_flight.do("key", object) for _ in range(3)]
+
+    assert len(set(map(id, outputs))) == 3
+    assert single_flight.stats() == SingleFlightStats(
+        executions=3, coalesced=0, in_flight=0
+    )
+
+
+def test_concurrent_calls_are_coalesced():
+    single_flight = SingleFlight()
+    release = threading.Event()
+    entered = threading.Event()
+
+    def slow():
+        entered.set()
+        release.wait(timeout=5)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(single_flight.do, "key", slow)
+        entered.wait(timeout=5)
+        followers = [executor.submit(single_flight.do, "key", object) for _ in range(3)]
+
+        while single_flight.stats().coalesced < 3:
+            pass
+        release.set()
+
+    assert {id(future.result()) for future in followers} == {id(leader.result())}
+    assert single_flight.stats() == SingleFlightStats(
+        executions=1, coalesced=3, in_flight=0
+    )
+
+
+def test_exception_is_shared_and_cleared():
+    single_flight = SingleFlight()
+
+    def fail():
+        raise ValueError("Backend unavailable")
+
+    with pytest.raises(ValueError):
+        single_flight.do("key", fail)
+
+    assert single_flight.do("key", lambda: 1) == 1
+    assert single_flight.stats().in_flight == 0
+
+
+def test_concurrent_gets_share_one_backend_request(stub_backend):
+    stub_backend.delay = 0.2
+    stub_backend.routes["gameweek/all/"] = [
+        {"gameweek_no": 1, "deadline": "2022-08-05T17:30:00Z"}
+    ]
+    funball_interface = FunballInterface()
+
+    futures = run_concurrently(funball_interface.get_all_gameweek_data)
+    outputs = [future.result() for future in futures]
+
+    assert len(stub_backend.requests) == 1
+    assert all(output is outputs[0] for output in outputs)
+
+    stats = funball_interface.single_flight_stats()
+    assert stats.executions == 1
+    assert stats.coalesced == NO_OF_THREADS - 1
+
+
+def test_concurrent_gets_for_different_endpoints_are_not_coalesced(stub_backend):
+    stub_backend.delay = 0.1
+    for funballer_no in range(3):
+        stub_backend.routes[f"funballer/choices/valid_teams/Test{funballer_no}"] = [
+            {"team_name": "Spurs", "remaining_selections": funballer_no}
+        ]
+    funball_interface = FunballInterface()
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        outputs = list(
+            executor.map(
+                funball_interface.get_funballer_valid_team_selections,
+                [f"Test{funballer_no}" for funballer_no in range(3)],
+            )
+        )
+
+    assert [output.remaining_selections for output in outputs] == [[0], [1], [2]]
+    assert funball_interface.single_flight_stats().coalesced == 0
+
+
+def test_concurrent_gets_share_validation_error(stub_backend):
+    stub_backend.delay = 0.2
+    stub_backend.routes["gameweek/all/"] = [{"gameweek_no": "1"}]
+    funball_interface = FunballInterface()
+
+    futures = run_concurrently(funball_interface.get_all_gameweek_data)
+
+    for future in futures:
+        with pytest.raises(RecordValidationError):
+            future.result()
+
+    assert len(stub_backend.requests) == 1
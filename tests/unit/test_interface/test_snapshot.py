@@ -0,0 +1,144 @@
+import json
+
+import pytest
+
+from interface import FunballInterface
+from interface.snapshot import SnapshotStore, create_snapshot_store, is_snapshot_endpoint
+
+DUMMY_FUNBALLER_DATA = [
+    {"first_name": "Test", "player_points": 1, "team_points": 2, "points": 3}
+]
+
+
+@pytest.fixture
+def snapshot_store(tmp_path):
+    store = SnapshotStore(path=str(tmp_path / "snapshots.sqlite3"))
+
+    yield store
+
+    store.close()
+
+
+def test_put_and_get(snapshot_store):
+    snapshot_store.put("players/", b"[]", etag='"abc"')
+
+    output = snapshot_store.get("players/")
+
+    assert output.content == b"[]"
+    assert output.etag == '"abc"'
+    assert output.last_modified is None
+
+
+def test_get_missing(snapshot_store):
+    assert snapshot_store.get("players/") is None
+
+
+def test_get_too_old(tmp_path):
+    snapshot_store = SnapshotStore(path=str(tmp_path / "snapshots.sqlite3"), max_age=-1)
+    snapshot_store.put("players/", b"[]")
+
+    assert snapshot_store.get("players/") is None
+
+
+def test_snapshots_persist_across_stores(tmp_path):
+    path = str(tmp_path / "snapshots.sqlite3")
+    SnapshotStore(path=path).put("players/", b"[]")
+
+    assert SnapshotStore(path=path).get("players/").content == b"[]"
+
+
+@pytest.mark.parametrize(
+    "endpoint, expected_output",
+    [
+        ("gameweek/all/", True),
+        ("gameweek/3", True),
+        ("players/", True),
+        ("funballer/", True),
+        ("funballer/choices/Test", False),
+        ("Spurs/players/", False),
+    ],
+)
+def test_is_snapshot_endpoint(endpoint, expected_output):
+    assert is_snapshot_endpoint(endpoint) is expected_output
+
+
+def test_create_snapshot_store_disabled(monkeypatch):
+    monkeypatch.delenv("FANTASY_FUNBALL_SNAPSHOT_PATH", raising=False)
+
+    assert create_snapshot_store() is None
+
+
+def test_responses_are_snapshotted(stub_backend, snapshot_store):
+    stub_backend.routes["funballer/"] = DUMMY_FUNBALLER_DATA
+    funball_interface = FunballInterface(snapshots=snapshot_store)
+
+    funball_interface.get_funballer_data()
+
+    snapshot = snapshot_store.get("funballer/")
+    assert json.loads(snapshot.content) == DUMMY_FUNBALLER_DATA
+    assert snapshot.etag is not None
+
+
+def test_warm_start_serves_snapshot_then_revalidates(stub_backend, snapshot_store):
+    stub_backend.routes["funballer/"] = DUMMY_FUNBALLER_DATA
+    FunballInterface(snapshots=snapshot_store).get_funballer_data()
+    stub_backend.requests.clear()
+
+    # Restarted process, the backend has since been updated
+    stub_backend.routes["funballer/"] = [dict(DUMMY_FUNBALLER_DATA[0], points=4)]
+    funball_interface = FunballInterface(snapshots=snapshot_store)
+
+    output = funball_interface.get_funballer_data()
+    funball_interface.wait_for_revalidations()
+
+    assert output["funballer_points"] == [3]
+    assert funball_interface.get_funballer_data()["funballer_points"] == [4]
+    assert json.loads(snapshot_store.get("funballer/").content)[0]["points"] == 4
+
+    ((_, headers),) = stub_backend.requests
+    assert "If-None-Match" in headers
+
+
+def test_warm_start_revalidated_not_modified(stub_backend, snapshot_store):
+    stub_backend.routes["funballer/"] = DUMMY_FUNBALLER_DATA
+    FunballInterface(snapshots=snapshot_store).get_funballer_data()
+
+    funball_interface = FunballInterface(snapshots=snapshot_store)
+    output = funball_interface.get_funballer_data()
+    funball_interface.wait_for_revalidations()
+
+    assert funball_interface.get_funballer_data() is output
+    assert funball_interface.cache_stats().revalidations == 1
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"not json",
+        # Persisted before a schema change
+        b'[{"first_name":"Test","points":"three"}]',
+    ],
+)
+def test_warm_start_invalid_snapshot(stub_backend, snapshot_store, content):
+    stub_backend.routes["funballer/"] = DUMMY_FUNBALLER_DATA
+    snapshot_store.put("funballer/", content, etag='"abc"')
+    funball_interface = FunballInterface(snapshots=snapshot_store)
+
+    output = funball_interface.get_funballer_data()
+
+    assert output["funballer_points"] == [3]
+    assert json.loads(snapshot_store.get("funballer/").content) == DUMMY_FUNBALLER_DATA
+
+    ((_, headers),) = stub_backend.requests
+    assert "If-None-Match" not in headers
+
+
+def test_update_standings_clears_snapshots(stub_backend, snapshot_store):
+    stub_backend.routes["funballer/"] = DUMMY_FUNBALLER_DATA
+    stub_backend.routes["update_database/"] = {}
+    funball_interface = FunballInterface(snapshots=snapshot_store)
+
+    funball_interface.get_funballer_data()
+    funball_interface.update_standings()
+
+    assert snapshot_store.get("funballer/") is None
@@ -0,0 +1,187 @@
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from interface import FunballInterface, StandingsHistory, standings_history
+from interface.formatter import FunballInterfaceFormatter
+
+
+def league_choices(points_by_funballer):
+    """League choices matrix from {funballer: [(team point, player point), ...]}"""
+    return FunballInterfaceFormatter.format_league_choices_dataframe(
+        choices_by_funballer={
+            funballer_name: pd.DataFrame(
+                {
+                    "Gameweek Number": range(1, len(points) + 1),
+                    "Team Choice": "Spurs",
+                    "Player Choice": "Harry Kane",
+                    "Team Point Awarded": [team_point for team_point, _ in points],
+                    "Player Point Awarded": [player_point for _, player_point in points],
+                }
+            )
+            for funballer_name, points in points_by_funballer.items()
+        }
+    )
+
+
+LEAGUE_CHOICES = league_choices(
+    {
+        "Ben": [(True, False), (True, True), (False, False)],
+        "Adam": [(False, True), (True, True), (True, True)],
+        "Will": [(True, False)],
+    }
+)
+
+
+def test_update():
+    history = StandingsHistory(funballer_names=()).update(
+        league_choices=LEAGUE_CHOICES, current_gameweek_no=3
+    )
+
+    assert history.funballer_names == ("Ben", "Adam", "Will")
+    assert history.team_points.shape == (3, 38)
+    assert history.team_points[:, :3].tolist() == [[1, 2, 2], [0, 1, 2], [1, 1, 1]]
+    assert history.player_points[:, :3].tolist() == [[0, 1, 1], [1, 2, 3], [0, 0, 0]]
+    assert history.total_points[:, :3].tolist() == [[1, 3, 3], [1, 3, 5], [1, 1, 1]]
+    # Tied funballers share a rank
+    assert history.ranks[:, :3].tolist() == [[1, 1, 2], [1, 1, 1], [1, 3, 3]]
+    assert not history.total_points[:, 3:].any()
+    assert (history.final_gameweek_no, history.latest_gameweek_no) == (2, 3)
+
+
+def test_update_is_incremental():
+    history = StandingsHistory(funballer_names=()).update(
+        league_choices=LEAGUE_CHOICES, current_gameweek_no=2
+    )
+
+    # Finished gameweeks aren't recalculated, the current gameweek is
+    corrected_league_choices = league_choices(
+        {
+            "Ben": [(False, False), (False, False), (True, True)],
+            "Adam": [(False, True), (True, True), (True, True)],
+            "Will": [(True, False)],
+        }
+    )
+    with patch.object(
+        standings_history,
+        "_points_matrix",
+        wraps=standings_history._points_matrix,
+    ) as mock_points_matrix:
+        updated_history = history.update(
+            league_choices=corrected_league_choices, current_gameweek_no=3
+        )
+
+    assert [call.kwargs for call in mock_points_matrix.call_args_list] == [
+        {"first": 2, "last": 3}
+    ] * 2
+    assert updated_history.total_points[0, :3].tolist() == [1, 1, 3]
+    # The history updated from is left untouched
+    assert history.total_points[0, :3].tolist() == [1, 3, 0]
+
+
+def test_update_rebuilds_for_new_funballers():
+    history = StandingsHistory(funballer_names=()).update(
+        league_choices=LEAGUE_CHOICES, current_gameweek_no=3
+    )
+
+    new_league_choices = league_choices({"Ben": [(True, True)] * 3})
+    updated_history = history.update(
+        league_choices=new_league_choices, current_gameweek_no=3
+    )
+
+    assert updated_history.funballer_names == ("Ben",)
+    assert updated_history.total_points[0, :3].tolist() == [2, 4, 6]
+
+
+def test_update_before_season_start():
+    history = StandingsHistory(funballer_names=()).update(
+        league_choices=LEAGUE_CHOICES, current_gameweek_no=0
+    )
+
+    assert history.latest_gameweek_no == 0
+    assert history.to_dataframe().empty
+
+
+def test_to_dataframe():
+    history = StandingsHistory(funballer_names=()).update(
+        league_choices=LEAGUE_CHOICES, current_gameweek_no=2
+    )
+
+    output = history.to_dataframe()
+
+    assert output.columns.tolist() == [
+        "Gameweek",
+        "Funballer",
+        "Team Points",
+        "Player Points",
+        "Total Points",
+        "Rank",
+    ]
+    assert output["Gameweek"].tolist() == [1, 2] * 3
+    assert output["Funballer"].tolist() == ["Ben", "Ben", "Adam", "Adam", "Will", "Will"]
+    assert output["Total Points"].tolist() == [1, 3, 1, 3, 1, 1]
+    assert np.array_equal(output["Rank"], [1, 1, 1, 1, 1, 3])
+
+
+@pytest.fixture
+def history_backend(stub_backend):
+    stub_backend.routes["funballer/"] = [
+        {"first_name": name, "player_points": 0, "team_points": 0, "points": 0}
+        for name in ("Ben", "Adam")
+    ]
+    for name, points_awarded in (("Ben", True), ("Adam", False)):
+        stub_backend.routes[f"funballer/choices/{name}"] = [
+            {
+                "gameweek_id__gameweek_no": gameweek_no,
+                "team_choice__team_name": "Spurs",
+                "player_choice__first_name": "Harry",
+                "player_choice__surname": "Kane",
+                "team_point_awarded": points_awarded,
+                "player_point_awarded": points_awarded,
+            }
+            for gameweek_no in (1, 2)
+        ]
+
+    return stub_backend
+
+
+def test_get_standings_history(history_backend):
+    funball_interface = FunballInterface()
+
+    output = funball_interface.get_standings_history(current_gameweek_no=2)
+
+    assert output.total_points[:, :2].tolist() == [[2, 4], [0, 0]]
+    assert output.ranks[:, :2].tolist() == [[1, 1], [2, 2]]
+    assert funball_interface.get_standings_history(current_gameweek_no=2) is output
+
+
+def test_get_standings_history_new_gameweek(history_backend):
+    funball_interface = FunballInterface()
+    history = funball_interface.get_standings_history(current_gameweek_no=1)
+
+    output = funball_interface.get_standings_history(current_gameweek_no=2)
+
+    assert history.latest_gameweek_no == 1
+    assert output.latest_gameweek_no == 2
+    assert output.final_gameweek_no == 1
+
+
+def test_get_standings_history_unavailable(history_backend):
+    del history_backend.routes["funballer/choices/Adam"]
+    funball_interface = FunballInterface()
+
+    assert funball_interface.get_standings_history(current_gameweek_no=2) is None
+
+
+def test_refresh_expires_standings_history(history_backend):
+    funball_interface = FunballInterface()
+    history = funball_interface.get_standings_history(current_gameweek_no=2)
+    history_backend.routes["funballer/choices/Adam"][1]["team_point_awarded"] = True
+
+    funball_interface.refresh("funballer/")
+    output = funball_interface.get_standings_history(current_gameweek_no=2)
+
+    assert history.total_points[:, :2].tolist() == [[2, 4], [0, 0]]
+    assert output.total_points[:, :2].tolist() == [[2, 4], [0, 1]]
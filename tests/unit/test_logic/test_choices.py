@@ -1,13 +1,27 @@
-from logic.choices import ChoicesData, ColourMap, create_choices_colour_map
+from pandas import DataFrame
+from pandas._testing import assert_frame_equal
+
+from logic.choices import (
+    LOSE_COLOUR,
+    WIN_COLOUR,
+    ColourMap,
+    _create_choices_css_matrix,
+    create_choices_colour_map,
+    create_choices_css,
+    remaining_teams_colours,
+    style_remaining_teams_dataframe,
+)
 
 
 def test_create_choices_colour_map():
-    dummy_choices_data = ChoicesData(
-        gameweek_no=[1],
-        team_choice=["Spurs"],
-        player_choice=["Hugo Lloris"],
-        player_point_awarded=[False],
-        team_point_awarded=[True],
+    dummy_choices_data = DataFrame(
+        {
+            "Gameweek Number": [1],
+            "Team Choice": ["Spurs"],
+            "Player Choice": ["Hugo Lloris"],
+            "Team Point Awarded": [True],
+            "Player Point Awarded": [False],
+        }
     )
 
     expected_output = ColourMap(
@@ -18,3 +32,94 @@ def test_create_choices_colour_map():
     output = create_choices_colour_map(choices_data=dummy_choices_data)
 
     assert output == expected_output
+
+
+def test_create_choices_css():
+    dummy_choices_dataframe = DataFrame(
+        {
+            "Funballer Name": ["Test", "Test"],
+            "Gameweek Number": [1, 2],
+            "Team Choice": ["Spurs", "Liverpool"],
+            "Player Choice": ["Hugo Lloris", "Harry Kane"],
+        },
+        index=[1, 2],
+    )
+
+    output = create_choices_css(
+        choices_dataframe=dummy_choices_dataframe,
+        points_awarded={
+            "Team Choice": [True, False],
+            "Player Choice": [False, True],
+        },
+    )
+
+    expected_output = DataFrame(
+        {
+            "Funballer Name": ["", ""],
+            "Gameweek Number": ["", ""],
+            "Team Choice": [WIN_COLOUR, LOSE_COLOUR],
+            "Player Choice": [LOSE_COLOUR, WIN_COLOUR],
+        },
+        index=[1, 2],
+    )
+
+    assert_frame_equal(left=output, right=expected_output)
+
+
+def test_create_choices_css_cached():
+    dummy_choices_dataframe = DataFrame(
+        {"Team Choice": ["Spurs"] * 38, "Player Choice": ["Harry Kane"] * 38}
+    )
+    points_awarded = {
+        "Team Choice": [gameweek_no % 2 == 0 for gameweek_no in range(38)],
+        "Player Choice": [gameweek_no % 3 == 0 for gameweek_no in range(38)],
+    }
+
+    first_output = create_choices_css(dummy_choices_dataframe, points_awarded)
+    hits = _create_choices_css_matrix.cache_info().hits
+    second_output = create_choices_css(dummy_choices_dataframe, points_awarded)
+
+    assert _create_choices_css_matrix.cache_info().hits == hits + 1
+    assert_frame_equal(left=first_output, right=second_output)
+
+
+def test_create_choices_css_empty():
+    dummy_choices_dataframe = DataFrame(columns=["Team Choice", "Player Choice"])
+
+    output = create_choices_css(
+        choices_dataframe=dummy_choices_dataframe,
+        points_awarded={"Team Choice": [], "Player Choice": []},
+    )
+
+    assert output.shape == (0, 2)
+
+
+def test_remaining_teams_colours():
+    output = remaining_teams_colours((2, 1, 0, 3)).tolist()
+
+    expected_output = [
+        "background-color: green",
+        "background-color: orange",
+        "background-color: red",
+        "",
+    ]
+
+    assert output == expected_output
+
+
+def test_style_remaining_teams_dataframe():
+    dummy_remaining_teams_dataframe = DataFrame(
+        {
+            "Team Name": ["Arsenal", "Spurs"],
+            "Remaining Selections": [0, 2],
+        }
+    )
+
+    styled_dataframe = style_remaining_teams_dataframe(
+        remaining_teams_dataframe=dummy_remaining_teams_dataframe,
+    )
+    styled_dataframe._compute()
+
+    assert styled_dataframe.ctx[(0, 0)] == styled_dataframe.ctx[(0, 1)]
+    assert styled_dataframe.ctx[(0, 1)] == [("background-color", "red")]
+    assert styled_dataframe.ctx[(1, 0)] == [("background-color", "green")]
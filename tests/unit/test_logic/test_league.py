@@ -0,0 +1,56 @@
+import pandas as pd
+from pandas._testing import assert_frame_equal
+
+from interface.formatter import FunballInterfaceFormatter
+from logic.league import create_league_css, create_league_table
+
+LEAGUE_CHOICES = FunballInterfaceFormatter.format_league_choices_dataframe(
+    choices_by_funballer={
+        "Ben": pd.DataFrame(
+            {
+                "Gameweek Number": [1, 2],
+                "Team Choice": ["Liverpool", "Spurs"],
+                "Player Choice": ["Hugo Lloris", "Harry Kane"],
+                "Team Point Awarded": [True, True],
+                "Player Point Awarded": [False, True],
+            }
+        ),
+        "Adam": pd.DataFrame(
+            {
+                "Gameweek Number": [1],
+                "Team Choice": ["Arsenal"],
+                "Player Choice": ["Bukayo Saka"],
+                "Team Point Awarded": [False],
+                "Player Point Awarded": [False],
+            }
+        ),
+    }
+)
+
+
+def test_create_league_table():
+    output = create_league_table(league_choices=LEAGUE_CHOICES)
+
+    expected_output = pd.DataFrame(
+        {
+            "GW 1": ["Liverpool / Hugo Lloris", "Arsenal / Bukayo Saka"],
+            "GW 2": ["Spurs / Harry Kane", ""],
+        },
+        index=pd.Index(["Ben", "Adam"], name="Funballer Name"),
+    )
+
+    assert_frame_equal(left=output, right=expected_output, check_names=False)
+
+
+def test_create_league_css():
+    output = create_league_css(league_choices=LEAGUE_CHOICES)
+
+    expected_output = pd.DataFrame(
+        {
+            "GW 1": ["background-color: orange", "background-color: red"],
+            "GW 2": ["background-color: green", ""],
+        },
+        index=pd.Index(["Ben", "Adam"], name="Funballer Name"),
+    )
+
+    assert_frame_equal(left=output, right=expected_output)
@@ -1,19 +1,26 @@
-from logic.players import SortedPlayerData, sort_player_data
+import pandas as pd
+from pandas._testing import assert_frame_equal
+
+from logic.players import sort_player_data
 
 
 def test_sort_player_data():
-    mock_player_data = {
-        "player_names": ["test player one", "test player two"],
-        "goals": [1, 2],
-        "assists": [2, 0],
-    }
+    mock_player_data = pd.DataFrame(
+        {
+            "Player Name": ["test player one", "test player two"],
+            "Goals": [1, 2],
+            "Assists": [2, 0],
+        }
+    )
 
     output = sort_player_data(player_data=mock_player_data)
 
-    expected_output = SortedPlayerData(
-        goals=[2, 1],
-        assists=[0, 2],
-        player_names=["test player two", "test player one"],
+    expected_output = pd.DataFrame(
+        {
+            "Player Name": ["test player two", "test player one"],
+            "Goals": [2, 1],
+            "Assists": [0, 2],
+        }
     )
 
-    assert output == expected_output
+    assert_frame_equal(left=output, right=expected_output)
@@ -1,16 +1,27 @@
+from unittest.mock import Mock, patch
+
 import pandas as pd
+import pytest
 from pandas._testing import assert_frame_equal
 
-from logic.standings import create_standings_dataframe
+from interface import BackgroundJob
+from logic.standings import (
+    create_standings_dataframe,
+    create_standings_progression_chart,
+    display_standings_progression,
+    display_update_standings_button,
+)
 
 
 def test__create_standings_dataframe():
-    dummy_funballer_data = {
-        "funballer_names": ["Test One", "Test Two"],
-        "funballer_player_points": [1, 10],
-        "funballer_team_points": [2, 20],
-        "funballer_points": [3, 30],
-    }
+    dummy_funballer_data = pd.DataFrame(
+        {
+            "Name": ["Test One", "Test Two"],
+            "Team Points": [2, 20],
+            "Player Points": [1, 10],
+            "Total Points": [3, 30],
+        }
+    )
 
     output = create_standings_dataframe(
         funballer_data=dummy_funballer_data,
@@ -28,3 +39,55 @@ def test__create_standings_dataframe():
 
     # Use pandas 'assert_frame_equal' for DataFrame comparison
     assert_frame_equal(left=output, right=expected_output)
+
+
+@patch("logic.standings.st")
+def test_display_standings_progression_unavailable(mock_streamlit):
+    display_standings_progression(standings_history=None)
+
+    mock_streamlit.write.assert_called_once_with(
+        "The standings progression is unavailable, please try again later."
+    )
+    mock_streamlit.altair_chart.assert_not_called()
+
+
+@patch("logic.standings.st")
+def test_display_update_standings_button_does_not_update(mock_streamlit):
+    target = Mock()
+    update_standings_job = BackgroundJob(name="test", target=target)
+
+    display_update_standings_button(update_standings_job=update_standings_job)
+
+    target.assert_not_called()
+    mock_streamlit.button.assert_called_once_with(
+        label="Update Standings",
+        on_click=update_standings_job.trigger,
+        disabled=False,
+    )
+
+
+@pytest.mark.parametrize(
+    "metric, expected_reverse",
+    [
+        ("Total Points", None),
+        ("Rank", True),
+    ],
+)
+def test_create_standings_progression_chart(metric, expected_reverse):
+    dummy_standings_history = pd.DataFrame(
+        {
+            "Gameweek": [1, 2, 1, 2],
+            "Funballer": ["Test One", "Test One", "Test Two", "Test Two"],
+            "Total Points": [1, 3, 2, 2],
+            "Rank": [2, 1, 1, 2],
+        }
+    )
+
+    output = create_standings_progression_chart(
+        standings_history=dummy_standings_history, metric=metric
+    ).to_dict()
+
+    assert output["mark"]["type"] == "line"
+    assert output["encoding"]["y"]["field"] == metric
+    assert output["encoding"]["y"].get("scale", {}).get("reverse") == expected_reverse
+    assert output["encoding"]["color"]["field"] == "Funballer"
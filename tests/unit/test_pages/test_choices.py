@@ -0,0 +1,63 @@
+import importlib.util
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+from requests import Response
+from streamlit.runtime.scriptrunner import StopException
+
+from interface import FunballInterface
+
+INTERFACE_PATH = "interface.fantasy_funball"
+
+CHOICES_PAGE_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "src", "pages", "2_⚽_Choices.py"
+)
+
+
+def load_page(path: str):
+    spec = importlib.util.spec_from_file_location("choices_page", path)
+    page = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(page)
+
+    return page
+
+
+def mock_backend_get(url: str, **_) -> Response:
+    mock_response = Mock(object=Response)
+    mock_response.headers = {}
+
+    if url.endswith("gameweek/all/"):
+        mock_response.status_code = 200
+        mock_response.content = b'[{"gameweek_no":1,"deadline":"2022-08-05T17:30:00Z"}]'
+    elif url.endswith("players/"):
+        mock_response.status_code = 200
+        mock_response.content = b"[]"
+    else:
+        mock_response.status_code = 404
+        mock_response.content = b'{"detail":"Not found."}'
+
+    return mock_response
+
+
+@patch(f"{INTERFACE_PATH}.st")
+def test_choices_app_invalid_funballer_name(mock_streamlit):
+    mock_streamlit.session_state = {}
+    mock_streamlit.stop.side_effect = StopException
+
+    funball_interface = FunballInterface(session=Mock())
+    funball_interface.session.get.side_effect = mock_backend_get
+
+    page = load_page(CHOICES_PAGE_PATH)
+    with patch.object(
+        page, "display_choices_form", return_value="Nosuchperson"
+    ), patch.object(
+        page, "get_funball_interface", return_value=funball_interface
+    ), patch.object(
+        page, "get_background_refresher"
+    ), pytest.raises(
+        StopException
+    ):
+        page.choices_app()
+
+    mock_streamlit.error.assert_called_once_with("Please enter a valid funballer name")
@@ -6,14 +6,29 @@ import pytz
 
 from utilities import determine_gameweek_no
 from utilities.gameweek import (
+    GameweekCalendar,
     _localise_datetime,
     determine_default_gameweek_no,
+    format_deadline,
+    get_gameweek_calendar,
     get_gameweek_deadline,
+    get_gameweek_deadline_datetime,
     has_current_gameweek_deadline_passed,
 )
 
 GAMEWEEK_UTILITIES_PATH = "utilities.gameweek"
 
+# Deliberately out of order, as returned by the backend
+CALENDAR_GAMEWEEK_DATA = [
+    {"gameweek_no": 2, "deadline": "2022-01-08T11:00:00Z"},
+    {"gameweek_no": 1, "deadline": "2022-01-01T11:00:00Z"},
+    {"gameweek_no": 3, "deadline": "2022-01-15T11:00:00Z"},
+]
+
+
+def _utc(*args) -> datetime.datetime:
+    return pytz.utc.localize(datetime.datetime(*args))
+
 
 @pytest.mark.parametrize(
     "input_timezone, expected_timezone",
@@ -51,14 +66,14 @@ def test__localise_datetime_unsupported_locale(dummy_datetime):
         (
             # Before "season" has started
             datetime.datetime(
-                year=2021, month=1, day=1, hour=0, minute=0, second=0, tzinfo=None
+                year=2021, month=1, day=1, hour=0, minute=0, second=0, tzinfo=pytz.utc
             ),
             0,
         ),
         (
             # After "season" has started
             datetime.datetime(
-                year=2022, month=1, day=3, hour=0, minute=0, second=0, tzinfo=None
+                year=2022, month=1, day=3, hour=0, minute=0, second=0, tzinfo=pytz.utc
             ),
             1,
         ),
@@ -105,27 +120,107 @@ def test_get_gameweek_deadline():
 @pytest.mark.parametrize(
     "input_deadline, expected_output",
     [
-        ("Sat 1 January 2000 @ 00:00:00", True),
-        ("Sat 1 January 2040 @ 00:00:00", False),
+        ("2000-01-01T00:00:00Z", True),
+        ("2040-01-01T00:00:00Z", False),
     ],
 )
-@patch(f"{GAMEWEEK_UTILITIES_PATH}.get_gameweek_deadline")
-def test_has_current_gameweek_deadline_passed(
-    mock_gameweek_deadline,
-    input_deadline,
-    expected_output,
-):
-    mock_gameweek_deadline.return_value = input_deadline
+def test_has_current_gameweek_deadline_passed(input_deadline, expected_output):
+    mock_gameweek_data = [
+        {
+            "gameweek_no": 1,
+            "deadline": input_deadline,
+        }
+    ]
 
     arbitrary_gameweek_no = 1
     output = has_current_gameweek_deadline_passed(
         gameweek_no=arbitrary_gameweek_no,
-        gameweek_data=[],
+        gameweek_data=mock_gameweek_data,
     )
 
     assert output == expected_output
 
 
+@pytest.mark.parametrize(
+    "input_deadline, expected_output",
+    [
+        # GMT
+        ("2022-01-01T00:00:00Z", "Sat 1 January 2022 @ 00:00:00"),
+        # BST
+        ("2022-08-05T17:30:00Z", "Fri 5 August 2022 @ 18:30:00"),
+        # Either side of the clocks going forward at 01:00 UTC
+        ("2022-03-27T00:30:00Z", "Sun 27 March 2022 @ 00:30:00"),
+        ("2022-03-27T01:30:00Z", "Sun 27 March 2022 @ 02:30:00"),
+        # Either side of the clocks going back at 01:00 UTC
+        ("2022-10-30T00:30:00Z", "Sun 30 October 2022 @ 01:30:00"),
+        ("2022-10-30T01:30:00Z", "Sun 30 October 2022 @ 01:30:00"),
+    ],
+)
+def test_format_deadline(input_deadline, expected_output):
+    mock_gameweek_data = [
+        {
+            "gameweek_no": 1,
+            "deadline": input_deadline,
+        }
+    ]
+
+    deadline = get_gameweek_deadline_datetime(
+        gameweek_no=1,
+        gameweek_data=mock_gameweek_data,
+    )
+
+    assert deadline == pytz.utc.localize(
+        datetime.datetime.strptime(input_deadline, "%Y-%m-%dT%H:%M:%SZ")
+    )
+    assert format_deadline(deadline=deadline) == expected_output
+
+
+@pytest.mark.parametrize(
+    "current_datetime, expected_output",
+    [
+        # 18:25 BST, before the 18:30 BST deadline
+        (datetime.datetime(2022, 8, 5, 17, 25, tzinfo=pytz.utc), False),
+        # 18:45 BST, after the deadline but before 18:30 UTC
+        (datetime.datetime(2022, 8, 5, 17, 45, tzinfo=pytz.utc), True),
+        # Clocks go back at 01:00 UTC, the deadline is the second 01:30 UK time
+        (datetime.datetime(2022, 10, 30, 0, 45, tzinfo=pytz.utc), False),
+        (datetime.datetime(2022, 10, 30, 1, 45, tzinfo=pytz.utc), True),
+    ],
+)
+@patch(f"{GAMEWEEK_UTILITIES_PATH}.datetime", wraps=datetime.datetime)
+def test_has_current_gameweek_deadline_passed_dst(
+    mock_datetime,
+    current_datetime,
+    expected_output,
+):
+    mock_gameweek_data = [
+        {"gameweek_no": 1, "deadline": "2022-08-05T17:30:00Z"},
+        {"gameweek_no": 2, "deadline": "2022-10-30T01:30:00Z"},
+    ]
+    mock_datetime.now.return_value = current_datetime
+
+    gameweek_no = 1 if current_datetime.month == 8 else 2
+    output = has_current_gameweek_deadline_passed(
+        gameweek_no=gameweek_no,
+        gameweek_data=mock_gameweek_data,
+    )
+
+    assert output == expected_output
+    mock_datetime.now.assert_called_once_with(tz=pytz.utc)
+
+
+def test_get_gameweek_deadline_season_finished():
+    mock_gameweek_data = [
+        {
+            "gameweek_no": 38,
+            "deadline": "2022-05-22T14:30:00Z",
+        }
+    ]
+
+    assert get_gameweek_deadline_datetime(39, mock_gameweek_data) is None
+    assert get_gameweek_deadline(39, mock_gameweek_data) == "Season finished."
+
+
 @pytest.mark.parametrize(
     "deadline_passed, expected_output",
     [
@@ -156,3 +251,57 @@ def test__determine_default_gameweek_no(
     )
 
     assert output == expected_output
+
+
+@pytest.mark.parametrize(
+    "now, expected_output",
+    [
+        (_utc(2021, 12, 1), 0),
+        (_utc(2022, 1, 1, 11), 0),
+        (_utc(2022, 1, 1, 11, 0, 1), 1),
+        (_utc(2022, 1, 10), 2),
+        (_utc(2022, 6, 1), 3),
+    ],
+)
+def test_gameweek_calendar_current_gameweek_no(now, expected_output):
+    calendar = GameweekCalendar(all_gameweek_data=CALENDAR_GAMEWEEK_DATA)
+
+    assert calendar.current_gameweek_no(now=now) == expected_output
+
+
+@pytest.mark.parametrize(
+    "now, expected_output",
+    [
+        (_utc(2021, 12, 1), (1, _utc(2022, 1, 1, 11))),
+        (_utc(2022, 1, 8, 11), (3, _utc(2022, 1, 15, 11))),
+        (_utc(2022, 6, 1), None),
+    ],
+)
+def test_gameweek_calendar_next_deadline(now, expected_output):
+    calendar = GameweekCalendar(all_gameweek_data=CALENDAR_GAMEWEEK_DATA)
+
+    assert calendar.next_deadline(now=now) == expected_output
+
+
+@pytest.mark.parametrize(
+    "gameweek_no, expected_output",
+    [
+        (1, True),
+        (2, False),
+        (39, False),
+    ],
+)
+def test_gameweek_calendar_has_deadline_passed(gameweek_no, expected_output):
+    calendar = GameweekCalendar(all_gameweek_data=CALENDAR_GAMEWEEK_DATA)
+
+    assert calendar.deadline_for(2) == _utc(2022, 1, 8, 11)
+    assert calendar.has_deadline_passed(gameweek_no, now=_utc(2022, 1, 5)) is (
+        expected_output
+    )
+
+
+def test_get_gameweek_calendar_reused():
+    calendar = get_gameweek_calendar(all_gameweek_data=CALENDAR_GAMEWEEK_DATA)
+
+    assert get_gameweek_calendar(all_gameweek_data=CALENDAR_GAMEWEEK_DATA) is calendar
+    assert get_gameweek_calendar(all_gameweek_data=[]) is not calendar
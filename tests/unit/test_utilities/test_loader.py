@@ -0,0 +1,140 @@
+import threading
+import time
+
+import pytest
+
+from utilities.loader import DataLoader
+from utilities.tracing import _TRACER, Tracer
+
+
+def test_load():
+    loader = DataLoader()
+    loader.add("gameweek_data", lambda: [1, 2, 3])
+    loader.add(
+        "gameweek_no_limit",
+        lambda gameweek_data: max(gameweek_data),
+        depends_on=["gameweek_data"],
+    )
+    loader.add(
+        "choices_data",
+        lambda gameweek_no_limit: list(range(1, gameweek_no_limit)),
+        depends_on=["gameweek_no_limit"],
+    )
+    loader.add("player_data", lambda: ["Harry Kane"])
+
+    output = loader.load()
+
+    assert output == {
+        "gameweek_data": [1, 2, 3],
+        "gameweek_no_limit": 3,
+        "choices_data": [1, 2],
+        "player_data": ["Harry Kane"],
+    }
+    assert set(loader.timings) == set(output)
+
+
+def test_load_independent_datasets_concurrently():
+    barrier = threading.Barrier(2, timeout=1)
+
+    loader = DataLoader()
+    loader.add("gameweek_data", lambda: barrier.wait())
+    loader.add("player_data", lambda: barrier.wait())
+
+    # Would raise BrokenBarrierError if the datasets were loaded one at a time
+    loader.load()
+
+
+def test_load_sequential_datasets_on_calling_thread():
+    loader = DataLoader()
+    loader.add("gameweek_data", lambda: threading.current_thread())
+    loader.add(
+        "gameweek_no_limit",
+        lambda gameweek_data: threading.current_thread(),
+        depends_on=["gameweek_data"],
+    )
+
+    output = loader.load()
+
+    assert set(output.values()) == {threading.current_thread()}
+
+
+@pytest.mark.parametrize(
+    "max_workers, expected_threads",
+    [
+        (1, 1),
+        (8, 3),
+    ],
+)
+def test_load_threads(monkeypatch, max_workers, expected_threads):
+    monkeypatch.setenv("FANTASY_FUNBALL_LOADER_WORKERS", str(max_workers))
+    barrier = threading.Barrier(expected_threads, timeout=1)
+
+    loader = DataLoader()
+    for name in ("gameweek_data", "gameweek_summary", "funballer_data"):
+        loader.add(name, lambda: (barrier.wait(), threading.current_thread())[1])
+
+    output = loader.load()
+
+    assert loader.width() == 3
+    assert len(set(output.values())) == expected_threads
+
+
+def test_critical_path():
+    loader = DataLoader()
+    loader.add("slow", lambda: time.sleep(0.05))
+    loader.add("fast", lambda: None)
+    loader.add("after_slow", lambda slow, fast: None, depends_on=["slow", "fast"])
+    loader.add("independent", lambda: None)
+
+    loader.load()
+
+    assert loader.critical_path() == ["slow", "after_slow"]
+
+
+def test_load_raises_exception():
+    def failing_load():
+        raise KeyError("gameweek_no")
+
+    loader = DataLoader()
+    loader.add("gameweek_data", failing_load)
+
+    with pytest.raises(KeyError):
+        loader.load()
+
+
+@pytest.mark.parametrize(
+    "nodes, expected_message",
+    [
+        ({"a": ["b"]}, "Dataset 'a' depends on undeclared dataset 'b'."),
+        ({"a": ["b"], "b": ["a"]}, "Dataset dependencies contain a cycle."),
+    ],
+)
+def test_load_invalid_dependencies(nodes, expected_message):
+    loader = DataLoader()
+    for name, depends_on in nodes.items():
+        loader.add(name, lambda **_: None, depends_on=depends_on)
+
+    with pytest.raises(ValueError) as exc:
+        loader.load()
+    assert str(exc.value) == expected_message
+
+
+def test_load_is_traced():
+    tracer = Tracer(name="Test")
+    token = _TRACER.set(tracer)
+
+    loader = DataLoader()
+    loader.add("gameweek_data", lambda: [1, 2, 3])
+    loader.add("player_data", lambda: ["Harry Kane"])
+    try:
+        loader.load()
+    finally:
+        _TRACER.reset(token)
+
+    (load_span,) = tracer.children(None)
+
+    assert load_span.name == "DataLoader.load"
+    assert {span.name for span in tracer.children(load_span.span_id)} == {
+        "load gameweek_data",
+        "load player_data",
+    }
@@ -0,0 +1,186 @@
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from utilities.tracing import (
+    _TRACER,
+    Tracer,
+    get_tracer,
+    span,
+    trace_script_run,
+    traced,
+    tracing_enabled,
+    with_trace_context,
+)
+
+TRACING_PATH = "utilities.tracing"
+
+
+@pytest.fixture
+def tracer():
+    tracer = Tracer(name="Test")
+    token = _TRACER.set(tracer)
+
+    yield tracer
+
+    _TRACER.reset(token)
+
+
+@traced
+def create_dataframe():
+    with span("build", category="pandas"):
+        return [1, 2, 3]
+
+
+def test_spans_are_not_recorded_without_a_tracer():
+    with span("build") as span_args:
+        span_args["rows"] = 3
+
+    assert get_tracer() is None
+    assert create_dataframe() == [1, 2, 3]
+
+
+def test_spans_nest(tracer):
+    with span("page", category="page") as span_args:
+        span_args["funballer_name"] = "Ben"
+        create_dataframe()
+
+    page_span, function_span, build_span = tracer.spans
+
+    assert page_span.parent_id is None
+    assert page_span.args == {"funballer_name": "Ben"}
+    assert function_span.name == "create_dataframe"
+    assert function_span.category == "logic"
+    assert function_span.parent_id == page_span.span_id
+    assert build_span.parent_id == function_span.span_id
+    assert tracer.children(None) == [page_span]
+    assert page_span.started <= function_span.started <= build_span.started
+    assert build_span.duration <= function_span.duration <= page_span.duration
+
+
+def test_span_records_errors(tracer):
+    with pytest.raises(ValueError):
+        with span("build"):
+            raise ValueError
+
+    assert tracer.spans[0].args == {"error": "ValueError"}
+
+
+def test_with_trace_context(tracer):
+    executor = ThreadPoolExecutor(max_workers=2)
+
+    with span("load"):
+        futures = [
+            executor.submit(with_trace_context(create_dataframe)) for _ in range(2)
+        ]
+        [future.result() for future in futures]
+
+    # Without the trace context, work on the pool isn't traced
+    executor.submit(create_dataframe).result()
+    executor.shutdown()
+
+    load_span = tracer.children(None)[0]
+    function_spans = tracer.children(load_span.span_id)
+
+    assert len(tracer.spans) == 5
+    assert len(function_spans) == 2
+    assert all(
+        function_span.thread_id != threading.get_ident()
+        for function_span in function_spans
+    )
+
+
+def test_to_chrome_trace(tracer):
+    with span("page", category="page"):
+        create_dataframe()
+
+    trace = json.loads(tracer.dumps())
+    events = trace["traceEvents"]
+    complete_events = [event for event in events if event["ph"] == "X"]
+
+    assert [event["name"] for event in complete_events] == [
+        "page",
+        "create_dataframe",
+        "build",
+    ]
+    assert {event["name"] for event in events if event["ph"] == "M"} == {
+        "process_name",
+        "thread_name",
+    }
+    assert complete_events[1]["args"]["parent_id"] == (
+        complete_events[0]["args"]["span_id"]
+    )
+    assert complete_events[0]["ts"] <= complete_events[1]["ts"]
+    assert complete_events[0]["dur"] >= complete_events[1]["dur"]
+
+
+def test_trace_script_run_disabled(monkeypatch, tmp_path):
+    monkeypatch.delenv("FANTASY_FUNBALL_TRACE", raising=False)
+    monkeypatch.setenv("FANTASY_FUNBALL_TRACE_DIR", str(tmp_path))
+
+    with trace_script_run("Choices") as tracer:
+        create_dataframe()
+
+    assert tracer is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_trace_script_run(monkeypatch, tmp_path):
+    monkeypatch.setenv("FANTASY_FUNBALL_TRACE", "1")
+    monkeypatch.setenv("FANTASY_FUNBALL_TRACE_DIR", str(tmp_path))
+
+    with trace_script_run("Choices") as tracer:
+        assert get_tracer() is tracer
+        create_dataframe()
+
+    (trace_path,) = tmp_path.iterdir()
+
+    assert get_tracer() is None
+    assert trace_path.name.startswith("choices-")
+    assert [
+        event["name"]
+        for event in json.loads(trace_path.read_text())["traceEvents"]
+        if event["ph"] == "X"
+    ] == ["Choices", "create_dataframe", "build"]
+
+
+@pytest.mark.parametrize(
+    "trace_query, query_params, expected_output",
+    [
+        ("1", {"trace": ["1"]}, True),
+        ("1", {"trace": ["false"]}, False),
+        ("1", {}, False),
+        ("0", {"trace": ["1"]}, False),
+    ],
+)
+@patch(f"{TRACING_PATH}.st")
+def test_tracing_enabled_query_param(
+    mock_streamlit, monkeypatch, trace_query, query_params, expected_output
+):
+    monkeypatch.delenv("FANTASY_FUNBALL_TRACE", raising=False)
+    monkeypatch.setenv("FANTASY_FUNBALL_TRACE_QUERY", trace_query)
+    mock_streamlit.experimental_get_query_params.return_value = query_params
+
+    assert tracing_enabled() is expected_output
+
+
+def test_trace_script_run_keeps_latest_traces(monkeypatch, tmp_path):
+    monkeypatch.setenv("FANTASY_FUNBALL_TRACE", "1")
+    monkeypatch.setenv("FANTASY_FUNBALL_TRACE_DIR", str(tmp_path))
+    monkeypatch.setenv("FANTASY_FUNBALL_TRACE_KEEP", "2")
+
+    for mtime, name in enumerate(("Standings", "Choices", "League")):
+        with trace_script_run(name):
+            pass
+        for trace_file in tmp_path.iterdir():
+            if trace_file.name.startswith(name.lower()):
+                os.utime(trace_file, (mtime, mtime))
+
+    assert sorted(trace_file.name.split("-")[0] for trace_file in tmp_path.iterdir()) == [
+        "choices",
+        "league",
+    ]